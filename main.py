@@ -1,11 +1,12 @@
 import sys
 import os
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QStackedWidget, QFileDialog, QSlider, QCheckBox, QComboBox, QLineEdit, QMessageBox
-from PySide6.QtCore import Qt, QPoint, QSize, QTimer, Signal as pyqtSignal, QEvent
+from PySide6.QtCore import Qt, QPoint, QSize, QTimer, Signal as pyqtSignal, QEvent, QThreadPool
 from PySide6.QtGui import QFont, QIcon, QCursor
 
 from ui.main_window import MainWindow
 from utils.config_manager import ConfigManager
+from ui.theme import apply_theme
 
 def main():
     # 确保配置目录存在
@@ -21,12 +22,22 @@ def main():
     # 加载配置
     config_manager = ConfigManager()
     
+    # 在创建窗口前应用主题，所有窗口共用一个应用级样式表
+    apply_theme(config_manager.config['appearance']['theme'], app)
+    
     # 创建主窗口
     main_window = MainWindow(config_manager)
     main_window.show()
     
     # 运行应用程序
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    
+    # 等待线程池中仍在使用单词管理器的任务（如建立模糊查找索引）结束
+    QThreadPool.globalInstance().waitForDone()
+    
+    # 退出前保存未写入的数据
+    config_manager.close()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,417 @@
+import numpy as np
+
+class WordStore:
+    """
+    单词列式存储类，按整数单词ID将学习状态保存在NumPy数组中，
+    通过 WordView 提供与 Word 相同的接口
+    """
+    
+    # 学习状态编码
+    STATUSES = ["unlearned", "learned", "skipped", "favorite"]
+    
+    # 已删除单词的状态编码，删除后保留其位置，其他单词ID不变
+    REMOVED = -1
+    
+    def __init__(self, capacity=1024):
+        """
+        初始化单词存储
+        
+        Args:
+            capacity (int, optional): 初始容量. Defaults to 1024.
+        """
+        self._size = 0
+        
+        # 文本字段
+        self.words = []
+        self.meanings = []
+        self.phonetics = []
+        self.examples = []
+        self.tags = []
+        
+        # 单词 -> 单词ID
+        self._index = {}
+        
+        # 学习状态字段
+        capacity = max(capacity, 1)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.learn_count = np.zeros(capacity, dtype=np.int32)
+        self.review_count = np.zeros(capacity, dtype=np.int32)
+        self.last_learn_time = np.full(capacity, np.nan, dtype=np.float64)  # NaN 表示无
+        self.next_review_time = np.full(capacity, np.nan, dtype=np.float64)  # NaN 表示无
+        self.mastery_level = np.zeros(capacity, dtype=np.int8)
+    
+    def __len__(self):
+        return self._size
+    
+    def __getitem__(self, word_id):
+        return self.get(word_id)
+    
+    def __iter__(self):
+        for word_id in range(self._size):
+            if self.status[word_id] != self.REMOVED:
+                yield WordView(self, word_id)
+    
+    @classmethod
+    def from_dicts(cls, items):
+        """
+        从单词字典列表创建单词存储
+        
+        Args:
+            items (list): 单词字典列表
+        
+        Returns:
+            WordStore: 单词存储
+        """
+        store = cls(capacity=len(items) if hasattr(items, "__len__") else 1024)
+        for data in items:
+            store.add_dict(data)
+        return store
+    
+    def add(self, word, meaning, phonetic=None, examples=None, tags=None):
+        """
+        添加单词
+        
+        Args:
+            word (str): 单词
+            meaning (str): 单词含义
+            phonetic (str, optional): 音标. Defaults to None.
+            examples (list, optional): 例句列表. Defaults to None.
+            tags (list, optional): 标签列表. Defaults to None.
+        
+        Returns:
+            int: 单词ID
+        """
+        if self._size == len(self.status):
+            self._grow()
+        
+        word_id = self._size
+        self._size += 1
+        
+        self.words.append(word)
+        self.meanings.append(meaning)
+        self.phonetics.append(phonetic or "")
+        # 空列表以 None 保存，避免为每个单词分配列表对象
+        self.examples.append(examples or None)
+        self.tags.append(tags or None)
+        self._index.setdefault(word, word_id)
+        
+        return word_id
+    
+    def add_dict(self, data):
+        """
+        从单词字典添加单词
+        
+        Args:
+            data (dict): 单词字典
+        
+        Returns:
+            int: 单词ID
+        """
+        word_id = self.add(
+            word=data["word"],
+            meaning=data["meaning"],
+            phonetic=data.get("phonetic", ""),
+            examples=data.get("examples", []),
+            tags=data.get("tags", [])
+        )
+        
+        self.status[word_id] = self.STATUSES.index(data.get("status", "unlearned"))
+        self.learn_count[word_id] = data.get("learn_count", 0)
+        self.review_count[word_id] = data.get("review_count", 0)
+        self.last_learn_time[word_id] = _to_array_time(data.get("last_learn_time"))
+        self.next_review_time[word_id] = _to_array_time(data.get("next_review_time"))
+        self.mastery_level[word_id] = data.get("mastery_level", 0)
+        
+        return word_id
+    
+    def get(self, word_id):
+        """
+        获取单词视图
+        
+        Args:
+            word_id (int): 单词ID
+        
+        Returns:
+            WordView: 单词视图
+        """
+        if not 0 <= word_id < self._size or self.status[word_id] == self.REMOVED:
+            raise IndexError(word_id)
+        return WordView(self, word_id)
+    
+    def update(self, word_id, meaning, phonetic=None, examples=None, tags=None):
+        """
+        更新单词的文本字段，学习状态保持不变
+        
+        Args:
+            word_id (int): 单词ID
+            meaning (str): 单词含义
+            phonetic (str, optional): 音标. Defaults to None.
+            examples (list, optional): 例句列表. Defaults to None.
+            tags (list, optional): 标签列表. Defaults to None.
+        """
+        self.get(word_id)
+        self.meanings[word_id] = meaning
+        self.phonetics[word_id] = phonetic or ""
+        self.examples[word_id] = examples or None
+        self.tags[word_id] = tags or None
+    
+    def remove(self, word_id):
+        """
+        删除单词，其位置保留为空位
+        
+        Args:
+            word_id (int): 单词ID
+        """
+        word = self.get(word_id).word
+        if self._index.get(word) == word_id:
+            del self._index[word]
+        
+        self.meanings[word_id] = ""
+        self.phonetics[word_id] = ""
+        self.examples[word_id] = None
+        self.tags[word_id] = None
+        self.status[word_id] = self.REMOVED
+        self.learn_count[word_id] = 0
+        self.review_count[word_id] = 0
+        self.last_learn_time[word_id] = np.nan
+        self.next_review_time[word_id] = np.nan
+        self.mastery_level[word_id] = 0
+    
+    def find(self, word):
+        """
+        按单词查找单词ID
+        
+        Args:
+            word (str): 单词
+        
+        Returns:
+            int: 单词ID，不存在时返回 None
+        """
+        return self._index.get(word)
+    
+    def ids_by_status(self, status):
+        """
+        获取指定状态的全部单词ID
+        
+        Args:
+            status (str): 学习状态
+        
+        Returns:
+            numpy.ndarray: 单词ID数组
+        """
+        code = self.STATUSES.index(status)
+        return np.flatnonzero(self.status[:self._size] == code)
+    
+    def count_by_status(self):
+        """
+        统计各学习状态的单词数量
+        
+        Returns:
+            dict: 学习状态 -> 单词数量
+        """
+        status = self.status[:self._size]
+        counts = np.bincount(status[status != self.REMOVED], minlength=len(self.STATUSES))
+        return {status: int(counts[code]) for code, status in enumerate(self.STATUSES)}
+    
+    def due_ids(self, now):
+        """
+        获取下次复习时间已到的单词ID，按到期时间排序
+        
+        Args:
+            now (float): 当前时间戳
+        
+        Returns:
+            numpy.ndarray: 单词ID数组
+        """
+        next_review_time = self.next_review_time[:self._size]
+        ids = np.flatnonzero(next_review_time <= now)  # NaN 比较结果为 False
+        return ids[np.argsort(next_review_time[ids], kind="stable")]
+    
+    def _grow(self):
+        """扩大状态数组容量"""
+        capacity = len(self.status) * 2
+        self.status = _resize(self.status, capacity, 0)
+        self.learn_count = _resize(self.learn_count, capacity, 0)
+        self.review_count = _resize(self.review_count, capacity, 0)
+        self.last_learn_time = _resize(self.last_learn_time, capacity, np.nan)
+        self.next_review_time = _resize(self.next_review_time, capacity, np.nan)
+        self.mastery_level = _resize(self.mastery_level, capacity, 0)
+
+
+class WordView:
+    """
+    单词视图类，以 Word 的接口读写 WordStore 中的一个单词
+    """
+    
+    __slots__ = ("_store", "_id")
+    
+    def __init__(self, store, word_id):
+        """
+        初始化单词视图
+        
+        Args:
+            store (WordStore): 单词存储
+            word_id (int): 单词ID
+        """
+        self._store = store
+        self._id = word_id
+    
+    @property
+    def id(self):
+        return self._id
+    
+    @property
+    def word(self):
+        return self._store.words[self._id]
+    
+    @property
+    def meaning(self):
+        return self._store.meanings[self._id]
+    
+    @property
+    def phonetic(self):
+        return self._store.phonetics[self._id]
+    
+    @property
+    def examples(self):
+        examples = self._store.examples[self._id]
+        if examples is None:
+            examples = self._store.examples[self._id] = []
+        return examples
+    
+    @property
+    def tags(self):
+        tags = self._store.tags[self._id]
+        if tags is None:
+            tags = self._store.tags[self._id] = []
+        return tags
+    
+    @property
+    def status(self):
+        return WordStore.STATUSES[self._store.status[self._id]]
+    
+    @status.setter
+    def status(self, value):
+        self._store.status[self._id] = WordStore.STATUSES.index(value)
+    
+    @property
+    def learn_count(self):
+        return int(self._store.learn_count[self._id])
+    
+    @property
+    def review_count(self):
+        return int(self._store.review_count[self._id])
+    
+    @property
+    def last_learn_time(self):
+        return _from_array_time(self._store.last_learn_time[self._id])
+    
+    @property
+    def next_review_time(self):
+        return _from_array_time(self._store.next_review_time[self._id])
+    
+    @next_review_time.setter
+    def next_review_time(self, value):
+        self._store.next_review_time[self._id] = _to_array_time(value)
+    
+    @property
+    def mastery_level(self):
+        return int(self._store.mastery_level[self._id])
+    
+    def to_dict(self):
+        """
+        将单词转换为字典，用于JSON序列化
+        
+        Returns:
+            dict: 单词字典
+        """
+        return {
+            "word": self.word,
+            "meaning": self.meaning,
+            "phonetic": self.phonetic,
+            "examples": self.examples,
+            "tags": self.tags,
+            "status": self.status,
+            "learn_count": self.learn_count,
+            "review_count": self.review_count,
+            "last_learn_time": self.last_learn_time,
+            "next_review_time": self.next_review_time,
+            "mastery_level": self.mastery_level
+        }
+    
+    def mark_as_learned(self, timestamp=None):
+        """
+        标记为已学习
+        
+        Args:
+            timestamp (float, optional): 时间戳. Defaults to None.
+        """
+        self._store.status[self._id] = WordStore.STATUSES.index("learned")
+        self._store.learn_count[self._id] += 1
+        self._store.last_learn_time[self._id] = _to_array_time(timestamp)
+    
+    def mark_as_reviewed(self, timestamp=None):
+        """
+        标记为已复习
+        
+        Args:
+            timestamp (float, optional): 时间戳. Defaults to None.
+        """
+        self._store.review_count[self._id] += 1
+        self._store.last_learn_time[self._id] = _to_array_time(timestamp)
+    
+    def mark_as_skipped(self):
+        """
+        标记为跳过
+        """
+        self.status = "skipped"
+    
+    def toggle_favorite(self):
+        """
+        切换收藏状态
+        
+        Returns:
+            bool: 切换后的收藏状态
+        """
+        if self.status == "favorite":
+            self.status = "learned" if self.learn_count > 0 else "unlearned"
+            return False
+        else:
+            self.status = "favorite"
+            return True
+    
+    def update_mastery_level(self, level):
+        """
+        更新掌握程度
+        
+        Args:
+            level (int): 掌握程度 (0-5)
+        """
+        if 0 <= level <= 5:
+            self._store.mastery_level[self._id] = level
+    
+    def __str__(self):
+        """
+        返回单词的字符串表示
+        
+        Returns:
+            str: 单词字符串
+        """
+        return f"{self.word} - {self.meaning}"
+
+
+def _to_array_time(value):
+    """将可能为 None 的时间戳转换为数组中的值"""
+    return np.nan if value is None else value
+
+
+def _from_array_time(value):
+    """将数组中的时间戳转换回可能为 None 的值"""
+    return None if np.isnan(value) else float(value)
+
+
+def _resize(array, capacity, fill_value):
+    """扩大数组并用默认值填充新增部分"""
+    result = np.full(capacity, fill_value, dtype=array.dtype)
+    result[:len(array)] = array
+    return result
\ No newline at end of file
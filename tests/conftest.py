@@ -0,0 +1,74 @@
+import os
+import json
+import pytest
+from utils.config_manager import ConfigManager
+from utils.sqlite_word_manager import SQLiteWordManager
+
+
+def write_general_config(config_dir, **general):
+    """写入只包含常规设置的配置文件，其他设置使用默认值"""
+    os.makedirs(config_dir, exist_ok=True)
+    with open(os.path.join(config_dir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump({'general': general}, f)
+
+
+@pytest.fixture
+def make_config_manager(tmp_path):
+    """创建使用临时配置目录的配置管理器，参数为覆盖的常规设置"""
+    managers = []
+    
+    def make(**general):
+        config_dir = str(tmp_path / 'config')
+        if general:
+            write_general_config(config_dir, **general)
+        manager = ConfigManager(config_dir)
+        managers.append(manager)
+        return manager
+    
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+@pytest.fixture
+def config_manager(make_config_manager):
+    """使用JSON存储引擎的配置管理器"""
+    return make_config_manager()
+
+
+def make_entry(word, meaning=None, **fields):
+    """创建单词条目"""
+    entry = {'word': word, 'meaning': meaning if meaning is not None else f"{word}的释义"}
+    entry.update(fields)
+    return entry
+
+
+def write_vocabulary(path, words, name='test'):
+    """写入JSON单词本，words 为单词或单词条目列表"""
+    entries = [make_entry(word) if isinstance(word, str) else word for word in words]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'name': name, 'verbs': entries}, f, ensure_ascii=False)
+    return entries
+
+
+def write_records(manager, records):
+    """写入学习记录 [(日期, word_id, 状态, 时间戳)]"""
+    if isinstance(manager, SQLiteWordManager):
+        with manager.conn:
+            for record in records:
+                manager._write_learning_record(*record)
+    else:
+        for record in records:
+            manager._apply_learning_record(*record)
+
+
+@pytest.fixture
+def add_vocabulary():
+    """在单词管理器中添加JSON单词本，返回单词本路径"""
+    def add(word_manager, words, name='test'):
+        path = os.path.join(word_manager.vocabularies_dir, f"{name}.json")
+        write_vocabulary(path, words, name)
+        word_manager.add_vocabulary({'name': name, 'path': path, 'count': len(words)})
+        return path
+    
+    return add
\ No newline at end of file
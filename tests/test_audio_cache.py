@@ -0,0 +1,59 @@
+import os
+import pytest
+
+from utils.audio_cache import AudioCache, detect_audio_format
+
+WAV_HEADER = b'RIFF\x24\x00\x00\x00WAVEfmt '
+AIFF_HEADER = b'FORM\x00\x00\x00\x2eAIFFCOMM'
+
+
+class FakeEngine:
+    """按 header 写入音频文件的TTS引擎"""
+    
+    def __init__(self, header):
+        self.header = header
+        self.pending = []
+    
+    def save_to_file(self, text, path):
+        self.pending.append(path)
+    
+    def runAndWait(self):
+        for path in self.pending:
+            with open(path, 'wb') as f:
+                f.write(self.header + b'\0' * 64)
+        self.pending = []
+
+
+@pytest.mark.parametrize('header, expected', [
+    (WAV_HEADER, 'wav'),
+    (AIFF_HEADER, 'aiff'),
+    (b'FORM\x00\x00\x00\x2eAIFC', 'aiff'),
+    (b'RIFF\x00\x00\x00\x00AVI ', None),
+    (b'', None),
+])
+def test_detect_audio_format(tmp_path, header, expected):
+    path = tmp_path / 'clip'
+    path.write_bytes(header)
+    assert detect_audio_format(str(path)) == expected
+
+
+def test_wav_clips_are_cached(tmp_path):
+    cache = AudioCache(str(tmp_path), 1 << 20)
+    
+    rendered, rendered_bytes = cache.render(FakeEngine(WAV_HEADER), ['apple', 'pear', 'apple'], 'voice', 200)
+    
+    assert rendered == 2 and rendered_bytes > 0
+    assert cache.render_supported
+    assert cache.get('apple', 'voice', 200) is not None
+    assert cache.get_stats()['entries'] == 2
+
+
+def test_unplayable_format_is_not_cached(tmp_path):
+    """驱动输出AIFF时不放入缓存，并标记为无法合成到缓存"""
+    cache = AudioCache(str(tmp_path), 1 << 20)
+    
+    assert cache.render(FakeEngine(AIFF_HEADER), ['apple'], 'voice', 200) == (0, 0)
+    
+    assert not cache.render_supported
+    assert cache.get('apple', 'voice', 200) is None
+    assert os.listdir(str(tmp_path)) == []
\ No newline at end of file
@@ -0,0 +1,134 @@
+import random
+import pytest
+
+from models.word_store import WordStore
+from utils.fuzzy_index import FuzzyIndex, levenshtein
+from utils.word_manager import normalize_headword
+
+LETTERS = 'abcdeéß'
+
+
+def reference_distance(a, b):
+    """动态规划计算编辑距离"""
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+
+def brute_force_search(store, query, max_distance, normalize=str.casefold):
+    """逐个计算编辑距离，按编辑距离、长度差和单词ID排序"""
+    query = normalize(query)
+    results = []
+    for word_id in range(len(store)):
+        if store.status[word_id] == WordStore.REMOVED:
+            continue
+        key = normalize(store.words[word_id])
+        distance = reference_distance(query, key)
+        if distance <= max_distance:
+            results.append((distance, abs(len(key) - len(query)), word_id))
+    results.sort()
+    return [word_id for _, _, word_id in results], [distance for distance, _, _ in results]
+
+
+def random_word(rng, max_length=7):
+    return ''.join(rng.choice(LETTERS) for _ in range(rng.randint(1, max_length)))
+
+
+def random_store(rng, count=300):
+    store = WordStore(capacity=8)
+    for _ in range(count):
+        store.add(random_word(rng), '')
+    for word_id in rng.sample(range(count), count // 10):
+        store.remove(word_id)
+    return store
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_levenshtein_matches_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        a = random_word(rng, 10)
+        b = random_word(rng, 10)
+        assert levenshtein(a, b) == reference_distance(a, b)
+        # 超过 max_distance 时只保证返回值大于 max_distance
+        distance = levenshtein(a, b, 2)
+        assert distance == reference_distance(a, b) or (distance > 2 and reference_distance(a, b) > 2)
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('max_distance', [0, 1, 2, 3])
+def test_search_matches_brute_force(seed, max_distance):
+    """双字组筛选和批量计算的结果与逐个计算相同"""
+    rng = random.Random(seed)
+    store = random_store(rng)
+    index = FuzzyIndex(store)
+    
+    for _ in range(60):
+        query = random_word(rng) + ('xyz' if rng.random() < 0.1 else '')
+        ids, distances = index.search(query, max_distance)
+        assert (ids.tolist(), distances.tolist()) == brute_force_search(store, query, max_distance), query
+
+
+def test_long_queries_use_scalar_path():
+    """超过64个字符的查询逐个计算"""
+    store = WordStore()
+    for word in ['a' * 70, 'a' * 69 + 'b', 'a' * 60, 'b' * 70]:
+        store.add(word, '')
+    index = FuzzyIndex(store)
+    
+    ids, distances = index.search('a' * 70, 2)
+    assert (ids.tolist(), distances.tolist()) == brute_force_search(store, 'a' * 70, 2)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_add_and_remove_match_brute_force(seed):
+    """增量添加（包含新字符）和删除后的索引与逐个计算相同"""
+    rng = random.Random(seed)
+    store = random_store(rng, count=150)
+    index = FuzzyIndex(store, normalize_headword)
+    
+    for _ in range(4):
+        alive = [word_id for word_id in range(len(store)) if store.status[word_id] != WordStore.REMOVED]
+        removed = rng.sample(alive, 10)
+        for word_id in removed:
+            store.remove(word_id)
+        added = [store.add(random_word(rng) + rng.choice(['', 'ж', 'Q', 'ÿ']), '') for _ in range(20)]
+        index.remove(removed)
+        index.add(added)
+        
+        assert len(index) == sum(1 for _ in store)
+        for _ in range(40):
+            query = random_word(rng) + rng.choice(['', 'ж', 'q'])
+            ids, distances = index.search(query, 2)
+            assert (ids.tolist(), distances.tolist()) == brute_force_search(store, query, 2, normalize_headword), query
+
+
+def test_empty_index():
+    index = FuzzyIndex(WordStore())
+    assert len(index) == 0
+    assert index.search('apple')[0].tolist() == []
+    
+    index.add([index.store.add('apple', '')])
+    assert index.search('aple')[0].tolist() == [0]
+
+
+def test_lookup_uses_only_built_indexes(config_manager, add_vocabulary):
+    """未指定单词本时只查找已建立模糊查找索引的单词本，不加载其他单词本"""
+    manager = config_manager.word_manager
+    first = add_vocabulary(manager, ['apple', 'banana'], name='a')
+    second = add_vocabulary(manager, ['aple', 'grape'], name='b')
+    
+    assert manager.fuzzy_lookup('appel') == []
+    assert manager.get_cached_fuzzy_index(first) is None
+    
+    manager.get_fuzzy_index(first)
+    assert manager.fuzzy_lookup('appel') == [(2, first, 0)]
+    assert manager.get_cached_fuzzy_index(second) is None
+    
+    manager.get_fuzzy_index(second)
+    assert manager.fuzzy_lookup('appel') == [(2, first, 0), (2, second, 0)]
+    assert manager.fuzzy_lookup('appel', [second]) == [(2, second, 0)]
\ No newline at end of file
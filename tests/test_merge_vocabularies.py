@@ -0,0 +1,82 @@
+import json
+import pytest
+
+from tests.conftest import make_entry, write_records
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def word_manager(request, make_config_manager):
+    return make_config_manager(storage_backend=request.param).word_manager
+
+
+def test_entries_are_merged(word_manager, add_vocabulary):
+    """规范化后相同的单词合并为一个条目，释义、例句和标签去重合并"""
+    first = add_vocabulary(word_manager, [
+        make_entry('Apple', '苹果; 苹果树', examples=['an apple'], tags=['fruit']),
+        make_entry('pear', '梨'),
+    ], name='a')
+    second = add_vocabulary(word_manager, [
+        make_entry('  apple ', '苹果；苹果公司', phonetic='ˈæpl', examples=['an apple', 'apple pie'], tags=['fruit', 'IT']),
+        make_entry('plum', '李子'),
+    ], name='b')
+    
+    vocabulary = word_manager.merge_vocabularies([first, second], 'merged')
+    
+    assert vocabulary['count'] == 3
+    assert vocabulary in word_manager.get_vocabularies()
+    with open(vocabulary['path'], encoding='utf-8') as f:
+        entries = {entry['word']: entry for entry in json.load(f)['verbs']}
+    assert list(entries) == ['Apple', 'pear', 'plum']
+    assert entries['Apple'] == {
+        'word': 'Apple',
+        'meaning': '苹果; 苹果树; 苹果公司',
+        'phonetic': 'ˈæpl',
+        'examples': ['an apple', 'apple pie'],
+        'tags': ['fruit', 'IT'],
+    }
+
+
+def test_learning_records_are_remapped(word_manager, add_vocabulary):
+    """原单词本的学习记录迁移到合并后的单词，同一天的记录保留最新的一条"""
+    first = add_vocabulary(word_manager, ['Apple', 'pear'], name='a')
+    second = add_vocabulary(word_manager, ['apple', 'plum'], name='b')
+    write_records(word_manager, [
+        ('2024-01-01', f'{first}:Apple', 'learned', 1000.0),
+        ('2024-01-02', f'{first}:Apple', 'reviewed', 2000.0),
+        ('2024-01-02', f'{second}:apple', 'skipped', 1500.0),
+        ('2024-01-03', f'{second}:apple', 'reviewed', 3000.0),
+        ('2024-01-01', f'{second}:plum', 'learned', 1100.0),
+    ])
+    
+    output = word_manager.merge_vocabularies([first, second], 'merged')['path']
+    
+    # 2024-01-02 的两条记录合并为时间较新的一条，学习天数为 3
+    assert word_manager._get_word_state(f'{output}:Apple') == ['reviewed', 3000.0, 3]
+    assert word_manager._get_word_state(f'{output}:plum') == ['learned', 1100.0, 1]
+    assert word_manager._get_word_state(f'{output}:pear') is None
+    for word_id in (f'{first}:Apple', f'{second}:apple', f'{second}:plum'):
+        assert word_manager._get_word_state(word_id) is None
+    
+    assert [word['word'] for word in word_manager.get_words_by_status(output, 'reviewed')] == ['Apple']
+    assert [word['word'] for word in word_manager.get_words_by_status(output, 'learned')] == ['plum']
+
+
+def test_merge_name_does_not_overwrite(word_manager, add_vocabulary):
+    """同名单词本已存在时合并结果使用新的文件名"""
+    first = add_vocabulary(word_manager, ['apple'], name='merged')
+    
+    vocabulary = word_manager.merge_vocabularies([first], 'merged')
+    
+    assert vocabulary['path'] != first
+    assert [word['word'] for word in word_manager.load_vocabulary_words(first)] == ['apple']
+
+
+def test_binary_books_remap_json_records(word_manager, add_vocabulary):
+    """合并二进制单词本时迁移其JSON单词本的学习记录"""
+    path = add_vocabulary(word_manager, ['apple'], name='a')
+    binary_path = word_manager.compile_vocabulary(path)
+    write_records(word_manager, [('2024-01-01', f'{path}:apple', 'learned', 1000.0)])
+    
+    output = word_manager.merge_vocabularies([binary_path], 'merged')['path']
+    
+    assert word_manager._get_word_state(f'{output}:apple') == ['learned', 1000.0, 1]
\ No newline at end of file
@@ -0,0 +1,94 @@
+import json
+from utils.config_manager import ConfigManager
+from utils.record_journal import RecordJournal
+
+
+def read_saved_records(config_manager):
+    """读取配置文件中已保存的学习记录"""
+    with open(config_manager.config_file, encoding='utf-8') as f:
+        return json.load(f)['learning_records']
+
+
+def test_records_are_appended_not_saved(config_manager):
+    """日志模式下答题只追加日志，不重写配置文件"""
+    config_manager.save_config(sync=True)
+    manager = config_manager.word_manager
+    manager.update_learning_record('a.json:apple', 'new')
+    manager.update_learning_record('a.json:pear', 'new')
+    
+    assert manager.journal.event_count == 2
+    assert read_saved_records(config_manager)['daily_records'] == {}
+    events = manager.journal.read_events()
+    assert [event['word_id'] for event in events] == ['a.json:apple', 'a.json:pear']
+    assert [event['seq'] for event in events] == [1, 2]
+
+
+def test_replay_after_crash(config_manager):
+    """程序异常退出后，下次启动时重放日志并合并到配置文件"""
+    config_manager.save_config(sync=True)
+    manager = config_manager.word_manager
+    manager.update_learning_record('a.json:apple', 'new')
+    manager.journal.close()  # 模拟未合并日志就退出
+    
+    restarted = ConfigManager(config_manager.config_dir)
+    try:
+        today = restarted.word_manager.get_today_stats()
+        assert today['new_words'] == 1
+        assert 'a.json:apple' in today['words']
+        assert restarted.word_manager.get_word_status('a.json:apple') == 'new'
+        
+        # 重放后日志已合并到配置文件并清空
+        assert restarted.word_manager.journal.read_events() == []
+        saved = read_saved_records(restarted)
+        assert saved['journal_seq'] == 1
+        assert sum(record['new_words'] for record in saved['daily_records'].values()) == 1
+    finally:
+        restarted.close()
+
+
+def test_replay_skips_merged_events(config_manager):
+    """序号不大于快照序号的事件已在配置文件中，重放时不重复计数"""
+    manager = config_manager.word_manager
+    manager.update_learning_record('a.json:apple', 'new')
+    assert manager.compact_journal()
+    
+    # 模拟合并后清空日志前退出: 日志中仍有已合并的事件
+    journal = RecordJournal(manager.journal.journal_file)
+    journal.append({'seq': 1, 'date': '2024-01-01', 'word_id': 'a.json:apple', 'status': 'new', 'timestamp': 1.0})
+    journal.close()
+    
+    restarted = ConfigManager(config_manager.config_dir)
+    try:
+        assert restarted.word_manager.get_today_stats()['new_words'] == 1
+        assert '2024-01-01' not in restarted.config['learning_records']['daily_records']
+    finally:
+        restarted.close()
+
+
+def test_compaction_at_threshold(make_config_manager):
+    """日志事件达到阈值时合并到配置文件并清空日志"""
+    config_manager = make_config_manager(journal_compact_threshold=3)
+    manager = config_manager.word_manager
+    for word in ('apple', 'pear'):
+        manager.update_learning_record(f'a.json:{word}', 'new')
+    assert manager.journal.event_count == 2
+    
+    manager.update_learning_record('a.json:plum', 'new')
+    assert manager.journal.event_count == 0
+    assert manager.journal.read_events() == []
+    saved = read_saved_records(config_manager)
+    assert saved['journal_seq'] == 3
+    assert sum(record['new_words'] for record in saved['daily_records'].values()) == 3
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    """异常退出时写入不完整的最后一行被忽略"""
+    path = tmp_path / 'records.journal'
+    journal = RecordJournal(str(path))
+    journal.append({'seq': 1, 'word_id': 'a.json:apple'})
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "word_id": "a.js')
+    
+    assert journal.read_events() == [{'seq': 1, 'word_id': 'a.json:apple'}]
+    assert journal.event_count == 1
\ No newline at end of file
@@ -0,0 +1,54 @@
+import random
+import datetime
+import pytest
+
+DAY = 86400
+STATUSES = ['new', 'learned', 'reviewed', 'review', 'test', 'skipped', 'favorite']
+
+
+def heap_review_words(manager, path, now):
+    """通过逐词复习队列计算需要复习的单词"""
+    intervals, queue, words_by_id, words = manager._get_review_queue(path)
+    return [words_by_id[word_id] for word_id in queue.get_due(now)]
+
+
+@pytest.mark.parametrize('strategy, intervals', [
+    ('艾宾浩斯记忆曲线', [1, 2, 4, 7, 15]),
+    ('间隔重复系统', [1, 3, 6, 10, 20]),
+    ('自定义策略', [2, 5, 9]),
+])
+def test_batch_matches_heap(config_manager, add_vocabulary, strategy, intervals):
+    """数组运算的结果与逐词复习队列完全相同"""
+    config_manager.config['review']['strategy'] = strategy
+    config_manager.config['review']['intervals'] = intervals
+    manager = config_manager.word_manager
+    words = [f'word{i}' for i in range(500)] + ['word3', 'word7']  # 包含重复的单词
+    path = add_vocabulary(manager, words)
+    
+    rng = random.Random(7)
+    now = datetime.datetime.now().timestamp()
+    for i in rng.sample(range(500), 300):
+        for day in range(rng.randint(1, 4)):
+            timestamp = now - rng.uniform(0, 40) * DAY + rng.random()
+            manager._apply_learning_record(f'2020-01-{day + 1:02d}', f'{path}:word{i}', rng.choice(STATUSES), timestamp)
+    
+    expected = heap_review_words(manager, path, now)
+    assert expected
+    assert manager.get_review_words_batch(path, now) == expected
+    
+    # 建立列式单词存储后 get_review_words 使用数组运算，结果不变
+    manager.get_word_store(path)
+    assert manager.get_review_words(path) == heap_review_words(manager, path, datetime.datetime.now().timestamp())
+
+
+def test_only_learned_and_reviewed_records_are_scheduled(config_manager, add_vocabulary):
+    """只有 learned 和 reviewed 记录安排复习，与原来的复习规则一致"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ['apple', 'pear', 'plum', 'kiwi'])
+    learned_at = datetime.datetime.now().timestamp() - 3 * DAY
+    for word, status in zip(['apple', 'pear', 'plum', 'kiwi'], ['learned', 'reviewed', 'new', 'test']):
+        manager._apply_learning_record('2020-01-01', f'{path}:{word}', status, learned_at)
+    
+    assert {word['word'] for word in manager.get_review_words(path)} == {'apple', 'pear'}
+    manager.get_word_store(path)
+    assert {word['word'] for word in manager.get_review_words(path)} == {'apple', 'pear'}
\ No newline at end of file
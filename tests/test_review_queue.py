@@ -0,0 +1,56 @@
+import datetime
+from utils.review_queue import ReviewQueue
+
+DAY = 86400
+
+
+def test_get_due_in_due_order():
+    """到期单词按到期时间排序，未到期的单词不返回"""
+    queue = ReviewQueue()
+    queue.schedule('c', 30.0)
+    queue.schedule('a', 10.0)
+    queue.schedule('b', 20.0)
+    queue.schedule('d', 100.0)
+    
+    assert queue.get_due(50.0) == ['a', 'b', 'c']
+    # 到期单词在处理前一直保留
+    assert queue.get_due(50.0) == ['a', 'b', 'c']
+    assert len(queue) == 4
+
+
+def test_reschedule_and_remove():
+    """重新安排或移除后旧的到期时间不再生效"""
+    queue = ReviewQueue()
+    queue.schedule('a', 10.0)
+    queue.schedule('b', 20.0)
+    queue.schedule('a', 60.0)
+    queue.schedule('b', None)
+    
+    assert queue.get_due(50.0) == []
+    assert queue.get_due(60.0) == ['a']
+    assert 'b' not in queue
+
+
+def test_heap_is_compacted():
+    """反复重新安排时堆中的过期元素不会无限增长"""
+    queue = ReviewQueue()
+    for i in range(1000):
+        queue.schedule('a', float(i))
+    assert len(queue._heap) <= 2 * len(queue) + 64
+    assert queue.get_due(1000.0) == ['a']
+
+
+def test_overdue_words_are_returned(config_manager, add_vocabulary):
+    """错过了复习当天的单词仍作为过期单词返回，复习后重新安排"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ['apple', 'pear', 'plum'])
+    now = datetime.datetime.now().timestamp()
+    manager._apply_learning_record('2020-01-01', f'{path}:apple', 'learned', now - 30 * DAY)
+    manager._apply_learning_record('2020-01-01', f'{path}:pear', 'learned', now - 3 * DAY)
+    manager._apply_learning_record('2020-01-01', f'{path}:plum', 'learned', now - 3600)
+    
+    assert [word['word'] for word in manager.get_review_words(path)] == ['apple', 'pear']
+    
+    # 第二天复习后使用第二个复习间隔
+    manager._apply_learning_record('2020-01-02', f'{path}:apple', 'reviewed', now - 60)
+    assert [word['word'] for word in manager.get_review_words(path)] == ['pear']
\ No newline at end of file
@@ -0,0 +1,100 @@
+import random
+import numpy as np
+import pytest
+
+from models.word_store import WordStore
+from utils.search_index import SearchIndex, _CJK_RUN
+
+LETTERS = 'abcdeÄé'
+HANZI = '苹果梨子水红色绿的一种新'
+
+
+def random_store(seed, count=400):
+    """生成随机单词和释义的单词存储，包含重复的单词和已删除的单词"""
+    rng = random.Random(seed)
+    store = WordStore(capacity=8)
+    for _ in range(count):
+        word = ''.join(rng.choice(LETTERS) for _ in range(rng.randint(1, 5)))
+        if rng.random() < 0.3:
+            word = word.upper()
+        meaning = ''.join(rng.choice(HANZI + ' ;,') for _ in range(rng.randint(0, 8)))
+        store.add(word, meaning)
+    for word_id in rng.sample(range(count), count // 10):
+        store.remove(word_id)
+    return store
+
+
+def brute_force_search(store, query):
+    """逐个比较的搜索结果：前缀匹配按单词排序，之后是释义匹配（按单词ID）"""
+    query = query.strip()
+    if not query:
+        return []
+    alive = [word_id for word_id in range(len(store)) if store.status[word_id] != WordStore.REMOVED]
+    prefix = sorted((word_id for word_id in alive if store.words[word_id].casefold().startswith(query.casefold())),
+                    key=lambda word_id: store.words[word_id].casefold())
+    if not _CJK_RUN.search(query):
+        return prefix
+    meaning = [word_id for word_id in alive
+               if query.casefold() in store.meanings[word_id].casefold() and word_id not in prefix]
+    return prefix + meaning
+
+
+def queries(seed, count=300):
+    rng = random.Random(seed)
+    result = ['', ' ', 'a', 'A', 'ä', '果', '水果', '红色的', 'zz', '苹果梨子水红色绿']
+    for _ in range(count):
+        alphabet = HANZI if rng.random() < 0.5 else LETTERS
+        result.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))))
+    return result
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_search_matches_brute_force(seed):
+    """前缀查找和释义倒排索引的结果与逐个比较相同"""
+    store = random_store(seed)
+    index = SearchIndex(store)
+    
+    for query in queries(seed):
+        assert index.search(query).tolist() == brute_force_search(store, query), query
+
+
+def test_incremental_meaning_queries():
+    """输入逐字追加和删除时，基于上一次结果筛选与重新查询的结果相同"""
+    store = random_store(4)
+    index = SearchIndex(store)
+    
+    text = '红色的水果'
+    for query in [text[:i] for i in range(1, len(text) + 1)] + [text[:i] for i in range(len(text), 0, -1)]:
+        assert index.search(query).tolist() == brute_force_search(store, query), query
+
+
+@pytest.mark.parametrize('seed', [5, 6])
+def test_add_update_remove_matches_brute_force(seed):
+    """增量更新后的索引与逐个比较的结果相同"""
+    rng = random.Random(seed)
+    store = random_store(seed, count=200)
+    index = SearchIndex(store)
+    
+    for _ in range(5):
+        alive = [word_id for word_id in range(len(store)) if store.status[word_id] != WordStore.REMOVED]
+        removed = rng.sample(alive, 10)
+        for word_id in removed:
+            store.remove(word_id)
+        updated = rng.sample([word_id for word_id in alive if word_id not in removed], 10)
+        for word_id in updated:
+            store.update(word_id, ''.join(rng.choice(HANZI) for _ in range(rng.randint(0, 6))))
+        added = [store.add(''.join(rng.choice(LETTERS) for _ in range(rng.randint(1, 4))),
+                           ''.join(rng.choice(HANZI) for _ in range(rng.randint(0, 6))))
+                 for _ in range(15)]
+        index.remove(removed)
+        index.update(updated)
+        index.add(added)
+        
+        for query in queries(seed, count=80):
+            assert index.search(query).tolist() == brute_force_search(store, query), query
+
+
+def test_empty_store():
+    index = SearchIndex(WordStore())
+    assert index.search('a').tolist() == []
+    assert index.search('水果').dtype == np.int64
\ No newline at end of file
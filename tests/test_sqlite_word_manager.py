@@ -0,0 +1,121 @@
+import json
+import sqlite3
+import pytest
+from utils.config_manager import ConfigManager
+from utils.sqlite_word_manager import SQLiteWordManager
+from tests.conftest import write_vocabulary, write_general_config, write_records
+
+DAY = 86400
+
+
+@pytest.fixture
+def sqlite_manager(make_config_manager):
+    """使用SQLite存储引擎的单词管理器"""
+    manager = make_config_manager(storage_backend='sqlite').word_manager
+    assert isinstance(manager, SQLiteWordManager)
+    return manager
+
+
+def test_init_shares_base_state(sqlite_manager):
+    """SQLite单词管理器具有基类的全部缓存、索引和日志"""
+    for name in ('journal', '_vocabulary_hashes', '_word_state_index', '_review_queues', '_word_stores',
+                 '_search_indexes', '_fuzzy_indexes', '_binary_vocabularies', 'vocabulary_cache'):
+        assert hasattr(sqlite_manager, name)
+
+
+def test_load_and_resync(sqlite_manager, add_vocabulary):
+    """单词本文件变化后只更新变化的单词，学习记录保持不变"""
+    path = add_vocabulary(sqlite_manager, ['apple', 'pear', 'plum'])
+    assert [word['word'] for word in sqlite_manager.load_vocabulary_words(path)] == ['apple', 'pear', 'plum']
+    sqlite_manager.update_learning_record(f'{path}:pear', 'learned')
+    
+    write_vocabulary(path, ['pear', 'plum', 'kiwi'])
+    words = sqlite_manager.resync_vocabulary(path)
+    assert [word['word'] for word in words] == ['pear', 'plum', 'kiwi']
+    assert sqlite_manager.get_word_status(f'{path}:pear') == 'learned'
+    assert [word['word'] for word in sqlite_manager.get_words_by_status(path, 'learned')] == ['pear']
+
+
+def test_duplicate_headwords_are_returned_once(sqlite_manager, add_vocabulary):
+    """单词本中重复的单词在按状态查询和复习查询中只返回一次"""
+    path = add_vocabulary(sqlite_manager, ['apple', 'pear', 'apple'])
+    sqlite_manager.load_vocabulary_words(path)
+    write_records(sqlite_manager, [('2024-01-01', f'{path}:apple', 'learned', 1000.0)])
+    
+    assert [word['word'] for word in sqlite_manager.get_words_by_status(path, 'learned')] == ['apple']
+    assert [word['word'] for word in sqlite_manager.get_review_words(path)] == ['apple']
+
+
+def test_review_words_match_json_backend(config_manager, sqlite_manager, add_vocabulary):
+    """两种存储引擎返回相同的复习单词和顺序"""
+    words = ['apple', 'pear', 'plum', 'kiwi', 'lime']
+    results = []
+    for manager in (config_manager.word_manager, sqlite_manager):
+        path = add_vocabulary(manager, words)
+        manager.load_vocabulary_words(path)
+        base = 1_600_000_000.0
+        write_records(manager, [
+            ('2020-09-13', f'{path}:apple', 'learned', base),
+            ('2020-09-13', f'{path}:pear', 'learned', base + 10),
+            ('2020-09-14', f'{path}:pear', 'reviewed', base + DAY),
+            ('2020-09-13', f'{path}:plum', 'skipped', base + 20),
+        ])
+        results.append([word['word'] for word in manager.get_review_words(path)])
+    
+    assert results[0] == results[1] == ['apple', 'pear']
+
+
+def count_saved_records(db_path):
+    """通过独立的连接统计已提交的学习记录数"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute('SELECT COUNT(*) FROM record_words').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_auto_save_off_commits_on_close(tmp_path):
+    """关闭自动保存时学习记录在关闭时才提交"""
+    config_dir = str(tmp_path / 'config')
+    write_general_config(config_dir, storage_backend='sqlite', auto_save=False)
+    config_manager = ConfigManager(config_dir)
+    manager = config_manager.word_manager
+    manager.update_learning_record('a.json:apple', 'new')
+    
+    assert manager.get_word_status('a.json:apple') == 'new'
+    assert count_saved_records(manager.db_path) == 0
+    config_manager.close()
+    assert count_saved_records(manager.db_path) == 1
+
+
+def test_auto_save_on_commits_each_record(sqlite_manager):
+    """开启自动保存时每条学习记录立即提交"""
+    sqlite_manager.update_learning_record('a.json:apple', 'new')
+    assert count_saved_records(sqlite_manager.db_path) == 1
+
+
+def test_first_start_migrates_json_records(tmp_path):
+    """首次使用SQLite时迁移JSON存储中的学习记录和单词本"""
+    config_dir = str(tmp_path / 'config')
+    config_manager = ConfigManager(config_dir)
+    path = str(tmp_path / 'config' / 'vocabularies' / 'test.json')
+    write_vocabulary(path, ['apple', 'pear'])
+    config_manager.word_manager.add_vocabulary({'name': 'test', 'path': path, 'count': 2})
+    config_manager.word_manager.update_learning_record(f'{path}:apple', 'new')
+    config_manager.close()
+    
+    with open(config_manager.config_file, encoding='utf-8') as f:
+        config = json.load(f)
+    config['general']['storage_backend'] = 'sqlite'
+    with open(config_manager.config_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    
+    migrated = ConfigManager(config_dir)
+    try:
+        manager = migrated.word_manager
+        assert isinstance(manager, SQLiteWordManager)
+        assert manager.get_word_status(f'{path}:apple') == 'new'
+        assert manager.get_today_stats()['new_words'] == 1
+        assert [word['word'] for word in manager.load_vocabulary_words(path)] == ['apple', 'pear']
+    finally:
+        migrated.close()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import os
+import struct
+import threading
+import pytest
+
+from tests.conftest import make_entry, write_vocabulary
+from utils.vocab_binary import BinaryVocabulary, compile_vocabulary, compiled_path, is_binary_vocabulary, MAGIC
+
+ENTRIES = [
+    make_entry('apple', '苹果', phonetic='ˈæpl', examples=['An apple a day.', 'a\x1fb', ''], tags=['水果', 'CET4']),
+    make_entry('naïve', '天真的', phonetic='', examples=[], tags=[]),
+    make_entry('x\x1fy', 'контроль\n第二行', phonetic='ks', examples=['\x00', '😀'], tags=['\x1f']),
+]
+
+
+@pytest.fixture
+def book(tmp_path):
+    path = str(tmp_path / 'book.json')
+    write_vocabulary(path, ENTRIES)
+    return path
+
+
+def test_roundtrip(book):
+    """编译后按下标读取的条目与JSON单词本相同，列表元素可以包含任意字符"""
+    assert compile_vocabulary(book) == len(ENTRIES)
+    
+    with BinaryVocabulary(compiled_path(book)) as vocabulary:
+        assert len(vocabulary) == len(ENTRIES)
+        assert list(vocabulary) == ENTRIES
+        assert vocabulary[-1] == ENTRIES[-1]
+        assert vocabulary[1:] == ENTRIES[1:]
+        assert [vocabulary.get_word(i) for i in range(len(ENTRIES))] == [entry['word'] for entry in ENTRIES]
+        assert vocabulary.source_path == book
+        with pytest.raises(IndexError):
+            vocabulary.get(len(ENTRIES))
+
+
+def test_missing_fields_use_empty_values(tmp_path):
+    """缺少的字段读取为空字符串或空列表，字符串例句视为单个例句"""
+    path = str(tmp_path / 'book.json')
+    write_vocabulary(path, [{'word': 'a'}, {'word': 'b', 'meaning': None, 'examples': 'only one'}])
+    compile_vocabulary(path)
+    
+    with BinaryVocabulary(compiled_path(path)) as vocabulary:
+        assert vocabulary[0] == {'word': 'a', 'meaning': '', 'phonetic': '', 'examples': [], 'tags': []}
+        assert vocabulary[1]['examples'] == ['only one']
+
+
+def test_old_version_is_recompiled(config_manager, add_vocabulary):
+    """旧版本的二进制单词本不是有效的二进制单词本，打开时重新编译"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ENTRIES)
+    binary_path = compiled_path(path)
+    with open(binary_path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<H', 1) + b'\0' * 64)
+    os.utime(binary_path, ns=(os.stat(path).st_mtime_ns + 10 ** 9,) * 2)
+    assert not is_binary_vocabulary(binary_path)
+    
+    vocabulary = manager.open_binary_vocabulary(path)
+    
+    assert vocabulary is not None and list(vocabulary) == ENTRIES
+    assert is_binary_vocabulary(binary_path)
+
+
+@pytest.mark.parametrize('backend', ['json', 'sqlite'])
+def test_binary_book_uses_json_word_ids(make_config_manager, add_vocabulary, backend):
+    """通过二进制单词本打开时 word_id 与JSON单词本相同，学习记录通用"""
+    manager = make_config_manager(storage_backend=backend).word_manager
+    path = add_vocabulary(manager, ENTRIES)
+    binary_path = manager.compile_vocabulary(path)
+    
+    assert manager.word_id_path(binary_path) == path
+    assert manager.word_id_path(path) == path
+    
+    manager.update_learning_record(f"{path}:apple", 'learned')
+    assert [word['word'] for word in manager.get_words_by_status(binary_path, 'learned')] == ['apple']
+    assert manager.get_words_by_status(binary_path, 'learned') == manager.get_words_by_status(path, 'learned')
+    
+    if backend == 'json':
+        store = manager.get_word_store(binary_path)
+        assert store.STATUSES[store.status[store.find('apple')]] == 'learned'
+        manager.update_learning_record(f"{path}:naïve", 'skipped')
+        assert store.STATUSES[store.status[store.find('naïve')]] == 'skipped'
+
+def test_iteration_uses_own_handle(config_manager, add_vocabulary):
+    """逐个读取二进制单词本时使用独立的映射，共享的二进制单词本被关闭或重新编译后仍可继续读取"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ENTRIES)
+    binary_path = manager.compile_vocabulary(path)
+    shared = manager.open_binary_vocabulary(binary_path)
+    
+    words = manager.iter_vocabulary_words(binary_path)
+    assert next(words) == ENTRIES[0]
+    manager.compile_vocabulary(path)
+    manager._close_binary_vocabulary()
+    
+    assert list(words) == ENTRIES[1:]
+    assert shared._mmap is None
+
+
+def test_concurrent_open_shares_one_handle(config_manager, add_vocabulary):
+    """多个线程同时打开同一个二进制单词本时只打开一次"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ENTRIES)
+    binary_path = manager.compile_vocabulary(path)
+    barrier = threading.Barrier(8)
+    opened = []
+    
+    def open_vocabulary():
+        barrier.wait()
+        opened.append(manager.open_binary_vocabulary(binary_path))
+        assert manager.word_id_path(binary_path) == path
+    
+    threads = [threading.Thread(target=open_vocabulary) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len({id(vocabulary) for vocabulary in opened}) == 1
+    assert list(manager._binary_vocabularies) == [binary_path]
\ No newline at end of file
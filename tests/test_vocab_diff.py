@@ -0,0 +1,114 @@
+import os
+import pytest
+
+from tests.conftest import make_entry, write_vocabulary, write_records
+from utils.vocab_diff import diff_vocabulary_entries
+from utils.search_index import SearchIndex
+from utils.fuzzy_index import FuzzyIndex
+from utils.word_manager import normalize_headword
+
+QUERIES = ['a', 'ap', 'app', 'pe', 'p', 'k', 'z', '水果', '果', '红', '红色', '新', '苹果树']
+FUZZY_QUERIES = ['aple', 'apple', 'pera', 'kiwy', 'plm', 'grap', 'lemn', 'x']
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def word_manager(request, make_config_manager):
+    return make_config_manager(storage_backend=request.param).word_manager
+
+
+def rewrite(path, words):
+    """改写单词本并推后修改时间，确保被识别为已变化"""
+    entries = write_vocabulary(path, words)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    return entries
+
+
+def test_diff_entries():
+    """按单词比较新增、修改和删除的条目"""
+    old = [make_entry('apple', '苹果'), make_entry('pear', '梨'), make_entry('plum', '李子')]
+    new = [make_entry('pear', '梨子'), make_entry('apple', '苹果'), make_entry('kiwi', '猕猴桃')]
+    
+    inserted, updated, deleted = diff_vocabulary_entries(old, new)
+    
+    assert inserted == [new[2]]
+    assert updated == [new[0]]
+    assert deleted == ['plum']
+
+
+@pytest.mark.parametrize('old, new', [
+    (['apple', 'apple'], ['apple']),
+    (['apple'], ['apple', 'pear', 'apple']),
+])
+def test_diff_with_repeated_headwords(old, new):
+    """有重复的单词时无法按单词对应，返回 None"""
+    assert diff_vocabulary_entries([make_entry(w) for w in old], [make_entry(w) for w in new]) is None
+
+
+def test_resync_updates_indexes_in_place(word_manager, add_vocabulary):
+    """单词本变化后列式单词存储和搜索索引增量更新，结果与重新构建相同"""
+    path = add_vocabulary(word_manager, [
+        make_entry('apple', '苹果; 一种水果'),
+        make_entry('pear', '梨'),
+        make_entry('plum', '李子, 红色水果'),
+        make_entry('grape', '葡萄'),
+    ])
+    write_records(word_manager, [('2024-01-01', f'{path}:pear', 'learned', 1000.0)])
+    store = word_manager.get_word_store(path)
+    search_index = word_manager.get_search_index(path)
+    fuzzy_index = word_manager.get_fuzzy_index(path)
+    search_index.search('水果')
+    
+    rewrite(path, [
+        make_entry('pear', '梨, 新的水果'),
+        make_entry('apple', '苹果; 一种水果'),
+        make_entry('kiwi', '猕猴桃, 绿色水果'),
+        make_entry('grape', '葡萄'),
+        make_entry('Apricot', '杏, 红色水果'),
+    ])
+    words = word_manager.resync_vocabulary(path)
+    
+    assert word_manager.get_word_store(path) is store
+    assert word_manager.get_search_index(path) is search_index
+    assert word_manager.get_fuzzy_index(path) is fuzzy_index
+    assert sorted(view.word for view in store) == sorted(word['word'] for word in words)
+    assert store.STATUSES[store.status[store.find('pear')]] == 'learned'
+    assert store.find('plum') is None
+    
+    rebuilt = SearchIndex(store)
+    for query in QUERIES:
+        assert search_index.search(query).tolist() == rebuilt.search(query).tolist(), query
+    rebuilt = FuzzyIndex(store, normalize_headword)
+    assert len(fuzzy_index) == len(rebuilt)
+    for query in FUZZY_QUERIES:
+        ids, distances = fuzzy_index.search(query, 2)
+        expected_ids, expected_distances = rebuilt.search(query, 2)
+        assert ids.tolist() == expected_ids.tolist(), query
+        assert distances.tolist() == expected_distances.tolist(), query
+
+
+def test_resync_with_repeated_headwords_rebuilds(word_manager, add_vocabulary):
+    """新旧单词本中有重复的单词时，复习队列、单词存储和搜索索引重新构建"""
+    path = add_vocabulary(word_manager, ['apple', 'pear'])
+    write_records(word_manager, [('2024-01-01', f'{path}:apple', 'learned', 1000.0)])
+    word_manager.get_review_words(path)
+    store = word_manager.get_word_store(path)
+    word_manager.get_search_index(path)
+    changed = []
+    word_manager.add_vocabulary_listener(changed.append)
+    
+    rewrite(path, ['apple', 'pear', 'apple', 'plum'])
+    words = word_manager.resync_vocabulary(path)
+    
+    assert changed == [path]
+    assert [word['word'] for word in words] == ['apple', 'pear', 'apple', 'plum']
+    new_store = word_manager.get_word_store(path)
+    assert new_store is not store
+    assert [view.word for view in new_store] == ['apple', 'pear', 'apple', 'plum']
+    assert word_manager.get_search_index(path).search('p').tolist() == [1, 3]
+    assert word_manager.get_word_status(f'{path}:apple') == 'learned'
+    assert new_store.STATUSES[new_store.status[0]] == 'learned'
+    
+    rewrite(path, ['pear', 'plum'])
+    words = word_manager.resync_vocabulary(path)
+    assert [view.word for view in word_manager.get_word_store(path)] == ['pear', 'plum']
\ No newline at end of file
@@ -0,0 +1,63 @@
+import io
+import json
+import pytest
+
+from tests.conftest import make_entry
+from utils.compression import open_text_writer
+from utils.vocab_stream import iter_vocabulary_entries, iter_entries_from_file, extract_vocabulary_entries
+
+ENTRIES = [
+    make_entry('apple', '苹果', phonetic='ˈæpl', examples=['An apple a day.', '"quoted" \\ back']),
+    make_entry('naïve', '天真的'),
+    make_entry('x', None),
+    {'word': 'num', 'rank': 12345678901234567890, 'ratio': 1.5e-10, 'flags': [True, False, None]},
+    {'word': 'nested', 'meaning': {'n': ['名词'], 'v': {'deep': [[], {}]}}},
+]
+
+LAYOUTS = {
+    'list': ENTRIES,
+    'verbs': {'name': 'test', 'verbs': ENTRIES},
+    'words': {'words': ENTRIES, 'name': 'test'},
+    'extra keys': {'meta': {'verbs': 'not a list', 'n': [1, 2]}, 'name': 'x', 'verbs': ENTRIES, 'tail': [None]},
+    'empty list': [],
+    'empty object': {},
+}
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+@pytest.mark.parametrize('indent', [None, 2])
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 65536])
+def test_stream_matches_json_load(layout, indent, chunk_size):
+    """流式读取的条目与 json.load 后取出的条目相同"""
+    data = LAYOUTS[layout]
+    text = json.dumps(data, ensure_ascii=False, indent=indent)
+    
+    entries = list(iter_entries_from_file(io.StringIO(text), chunk_size=chunk_size))
+    
+    assert entries == extract_vocabulary_entries(json.loads(text))
+
+
+@pytest.mark.parametrize('compression', ['none', 'gzip', 'lzma'])
+def test_compressed_files_are_streamed(tmp_path, compression):
+    """gzip/lzma 压缩的单词本边读取边解压"""
+    path = tmp_path / 'book.json'
+    data = {'name': 'test', 'verbs': [make_entry(f'word{i}') for i in range(2000)]}
+    with open_text_writer(str(path), compression) as f:
+        json.dump(data, f, ensure_ascii=False)
+    
+    assert list(iter_vocabulary_entries(str(path), chunk_size=100)) == data['verbs']
+
+
+def test_byte_order_mark_is_skipped(tmp_path):
+    """带 BOM 的 UTF-8 文件也能读取"""
+    path = tmp_path / 'bom.json'
+    path.write_bytes(b'\xef\xbb\xbf' + json.dumps(ENTRIES, ensure_ascii=False).encode('utf-8'))
+    
+    assert list(iter_vocabulary_entries(str(path), chunk_size=5)) == ENTRIES
+
+
+@pytest.mark.parametrize('text', ['', '"words"', '[{"word": "a"} {"word": "b"}]', '{"verbs": [1, 2'])
+def test_malformed_files_raise(text):
+    """格式错误的文件抛出 ValueError"""
+    with pytest.raises(ValueError):
+        list(iter_entries_from_file(io.StringIO(text), chunk_size=4))
\ No newline at end of file
@@ -0,0 +1,105 @@
+import os
+import json
+import tracemalloc
+from utils import word_manager as word_manager_module
+from utils.vocabulary_cache import VocabularyCache
+from tests.conftest import make_entry, write_vocabulary
+
+
+def touch(path, content='x'):
+    """写入文件并返回路径"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return str(path)
+
+
+def test_hit_and_mtime_validation(tmp_path):
+    """文件未变化时命中，文件变化后失效"""
+    cache = VocabularyCache(1 << 20)
+    path = touch(tmp_path / 'a.json')
+    data = [make_entry('apple')]
+    cache.put(path, data)
+    
+    assert cache.get(path) is data
+    touch(path, 'changed')
+    assert cache.get(path) is None
+    assert cache.get_stats()['hits'] == 1 and cache.get_stats()['misses'] == 1
+    assert cache.get_stats()['total_bytes'] == 0
+
+
+def test_lru_eviction(tmp_path):
+    """超出预算时淘汰最久未使用的单词本"""
+    data = [make_entry(f'word{i}') for i in range(100)]
+    size = VocabularyCache(0).estimate_size(data)
+    cache = VocabularyCache(size * 2)
+    paths = [touch(tmp_path / f'{name}.json') for name in 'abc']
+    
+    cache.put(paths[0], data)
+    cache.put(paths[1], data)
+    cache.get(paths[0])
+    cache.put(paths[2], data)
+    
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[0]) is data and cache.get(paths[2]) is data
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_oversized_book_is_kept_alone(tmp_path):
+    """单独超出预算的单词本仍保留为唯一的缓存项"""
+    cache = VocabularyCache(1)
+    small = touch(tmp_path / 'small.json')
+    large = touch(tmp_path / 'large.json')
+    cache.put(small, [make_entry('apple')])
+    cache.put(large, [make_entry(f'word{i}') for i in range(1000)])
+    
+    assert cache.get(small) is None
+    assert cache.get(large) is not None
+    assert cache.get_stats()['entries'] == 1
+
+
+def test_size_estimate_tracks_parsed_memory(tmp_path):
+    """估算的大小接近解析结果实际占用的内存，而不是文件大小"""
+    path = tmp_path / 'big.json'
+    entries = [make_entry(f'word{i}', '放弃；抛弃' * (1 + i % 3), phonetic='/əˈbændən/',
+                          examples=[f'Example sentence {i}.'], tags=['cet6']) for i in range(20000)]
+    write_vocabulary(str(path), entries)
+    text = path.read_text(encoding='utf-8')
+    
+    tracemalloc.start()
+    data = json.loads(text)['verbs']
+    parsed_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    estimate = VocabularyCache(0).estimate_size(data)
+    assert 0.8 * parsed_bytes < estimate < 1.2 * parsed_bytes
+    assert estimate > 2 * os.path.getsize(path)
+
+
+def test_cache_miss_does_not_rehash_unchanged_file(config_manager, add_vocabulary, monkeypatch):
+    """缓存被淘汰后，文件未变化时不重新计算哈希或解析"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ['apple', 'pear'])
+    store = manager.get_word_store(path)
+    words = manager.load_vocabulary_words(path)
+    
+    calls = []
+    monkeypatch.setattr(word_manager_module, 'file_hash', lambda *args: calls.append('hash'))
+    monkeypatch.setattr(manager, '_read_vocabulary_file', lambda *args: calls.append('parse'))
+    manager.vocabulary_cache.invalidate()
+    
+    assert manager.load_vocabulary_words(path) is words
+    assert manager.get_word_store(path) is store
+    assert calls == []
+
+
+def test_cache_miss_rehashes_changed_file(config_manager, add_vocabulary):
+    """文件变化后重新读取并增量更新"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ['apple', 'pear'])
+    store = manager.get_word_store(path)
+    
+    write_vocabulary(path, ['apple', 'pear', 'plum'])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert [word['word'] for word in manager.load_vocabulary_words(path)] == ['apple', 'pear', 'plum']
+    assert manager.get_word_store(path) is store and len(store) == 3
\ No newline at end of file
@@ -0,0 +1,52 @@
+from utils.word_manager import WordManager
+
+
+def test_latest_record_wins(config_manager):
+    """单词的最新状态取时间戳最新的记录"""
+    manager = config_manager.word_manager
+    manager._apply_learning_record('2024-01-01', 'a.json:apple', 'new', 100.0)
+    manager._apply_learning_record('2024-01-03', 'a.json:apple', 'skipped', 300.0)
+    manager._apply_learning_record('2024-01-02', 'a.json:apple', 'review', 200.0)
+    
+    assert manager.get_word_status('a.json:apple') == 'skipped'
+    assert manager._get_word_state('a.json:apple') == ['skipped', 300.0, 3]
+    assert manager.get_word_status('a.json:banana') is None
+
+
+def test_study_days_count_distinct_days(config_manager):
+    """同一天的多条记录只计为一个学习天数"""
+    manager = config_manager.word_manager
+    manager._apply_learning_record('2024-01-01', 'a.json:apple', 'new', 100.0)
+    manager._apply_learning_record('2024-01-01', 'a.json:apple', 'learned', 150.0)
+    manager._apply_learning_record('2024-01-02', 'a.json:apple', 'reviewed', 200.0)
+    
+    assert manager._get_word_state('a.json:apple') == ['reviewed', 200.0, 2]
+
+
+def test_index_matches_full_rebuild(config_manager):
+    """增量更新的索引与从全部学习记录重建的索引一致"""
+    manager = config_manager.word_manager
+    records = [
+        ('2024-01-01', 'a.json:apple', 'new', 100.0),
+        ('2024-01-01', 'a.json:pear', 'skipped', 110.0),
+        ('2024-01-02', 'a.json:apple', 'reviewed', 200.0),
+        ('2024-01-02', 'a.json:pear', 'learned', 190.0),
+        ('2024-01-03', 'b.json:apple', 'favorite', 300.0),
+    ]
+    for record in records:
+        manager._apply_learning_record(*record)
+    incremental = {word_id: list(state) for word_id, state in manager._word_state_index.items()}
+    
+    rebuilt = WordManager(config_manager)
+    assert rebuilt._word_state_index == incremental
+    rebuilt.journal.close()
+
+
+def test_update_learning_record_updates_index(config_manager):
+    """update_learning_record 立即更新索引"""
+    manager = config_manager.word_manager
+    manager.update_learning_record('a.json:apple', 'learned')
+    
+    state = manager._get_word_state('a.json:apple')
+    assert state[0] == 'learned' and state[2] == 1
+    assert manager._get_last_study_time('a.json:apple') is not None
\ No newline at end of file
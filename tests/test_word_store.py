@@ -0,0 +1,56 @@
+import datetime
+import numpy as np
+from models.word_store import WordStore
+
+DAY = 86400
+
+
+def test_add_find_and_remove():
+    """删除的单词保留位置，其他单词ID不变"""
+    store = WordStore(capacity=1)
+    for word in ('apple', 'pear', 'plum'):
+        store.add(word, f'{word}的释义')
+    store.remove(1)
+    
+    assert len(store) == 3
+    assert store.find('pear') is None and store.find('plum') == 2
+    assert [view.word for view in store] == ['apple', 'plum']
+    assert store.status[1] == WordStore.REMOVED
+    assert store.count_by_status()['unlearned'] == 2
+
+
+def test_due_ids_sorted_by_due_time():
+    """到期单词按到期时间排序，没有复习时间和已删除的单词不返回"""
+    store = WordStore()
+    for word in ('a', 'b', 'c', 'd'):
+        store.add(word, '')
+    store[0].next_review_time = 30.0
+    store[1].next_review_time = 10.0
+    store[3].next_review_time = 20.0
+    store.remove(3)
+    
+    assert store.due_ids(25.0).tolist() == [1]
+    assert store.due_ids(100.0).tolist() == [1, 0]
+    assert np.array_equal(store.ids_by_status('unlearned'), [0, 1, 2])
+
+
+def test_review_times_follow_strategy_change(config_manager, add_vocabulary):
+    """复习策略变化后列式单词存储中的下次复习时间重新计算"""
+    manager = config_manager.word_manager
+    path = add_vocabulary(manager, ['apple', 'pear'])
+    learned_at = datetime.datetime.now().timestamp() - 2.5 * DAY
+    manager._apply_learning_record('2020-01-01', f'{path}:apple', 'learned', learned_at)
+    
+    store = manager.get_word_store(path)
+    assert store[0].next_review_time == learned_at + 1 * DAY
+    
+    config_manager.config['review']['strategy'] = '自定义策略'
+    config_manager.config['review']['intervals'] = [3, 6]
+    assert manager.get_word_store(path) is store
+    assert store[0].next_review_time == learned_at + 3 * DAY
+    assert store.due_ids(datetime.datetime.now().timestamp()).tolist() == []
+    
+    config_manager.config['review']['intervals'] = [2, 6]
+    manager.get_word_store(path)
+    assert store.due_ids(datetime.datetime.now().timestamp()).tolist() == [0]
+    assert np.isnan(store.next_review_time[1])
\ No newline at end of file
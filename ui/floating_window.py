@@ -1,10 +1,13 @@
 import sys
 import os
+import time
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QFrame, QSizeGrip, QApplication)
-from PySide6.QtCore import Qt, QPoint, QSize, Signal, QEvent
-from PySide6.QtGui import QFont, QIcon, QCursor
-import pyttsx3
+from PySide6.QtCore import Qt, QPoint, QSize, Signal, QEvent, QTimer, QUrl
+from PySide6.QtGui import QFont, QIcon, QCursor, QKeySequence, QShortcut
+from ui.speech_worker import SpeechWorker
+from ui.session_feeder import SessionFeeder
+from utils.perf_stats import FrameStats
 
 class FloatingWindow(QWidget):
     """悬浮窗类，用于显示单词和相关操作"""
@@ -12,26 +15,80 @@ class FloatingWindow(QWidget):
     # 自定义信号
     closed = Signal()  # 窗口关闭信号
     
-    def __init__(self, config_manager, parent=None):
+    # 最多保留的已学单词数（用于返回上一个单词），超出后丢弃最早的单词
+    HISTORY_SIZE = 100
+    
+    # 窗口显示后等待多久在空闲时启动朗读线程（毫秒），在此之前点击朗读会立即启动
+    SPEECH_PREWARM_DELAY_MS = 2000
+    
+    # 预先合成发音的后续单词数
+    PRERENDER_COUNT = 20
+    
+    def __init__(self, config_manager, speech_worker=None, parent=None):
         super().__init__(parent, Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool)
+        self.setObjectName("floatingWindow")  # 应用级样式表中悬浮窗规则的前缀
         self.config_manager = config_manager
-        self.setAttribute(Qt.WA_TranslucentBackground)  # 设置窗口背景透明
-        self.setWindowOpacity(0.95)  # 设置窗口透明度
         
-        # 初始化TTS引擎
-        self.tts_engine = pyttsx3.init()
+        # 透明度低于100%时使用透明窗口（圆角和半透明需要与桌面合成），
+        # 100%时使用不透明窗口，拖动和重绘时不需要合成窗口背景
+        opacity = config_manager.config['appearance']['opacity']
+        self.opaque = opacity >= 100
+        if not self.opaque:
+            self.setAttribute(Qt.WA_TranslucentBackground)  # 设置窗口背景透明
+            self.setWindowOpacity(opacity / 100)  # 设置窗口透明度
+        
+        # 朗读线程，朗读时不阻塞界面，TTS引擎在首次朗读或窗口显示后的空闲时间初始化
+        if speech_worker is None:
+            speech_worker = SpeechWorker(config_manager.audio_cache, self)
+            QApplication.instance().aboutToQuit.connect(speech_worker.stop)
+        self.speech_worker = speech_worker
+        self.speech_worker.spoken.connect(self.on_word_spoken)
+        self.speech_worker.clip_ready.connect(self.play_clip)
+        self.speech_worker.failed.connect(self.on_speech_failed)
+        self.speech_worker.unavailable.connect(self.on_speech_unavailable)
+        
+        # 播放缓存音频的 QSoundEffect，首次播放时创建
+        self.sound_effect = None
+        
+        # 已提交预先合成的单词位置
+        self.prerendered_until = 0
+        
+        # 学习会话供词线程，在后台准备后续单词，翻页时只从内存中取单词
+        self.lookahead = config_manager.config['general']['session_lookahead']
+        self.session_feeder = SessionFeeder(config_manager.word_manager, self.speech_worker, self)
+        self.session_feeder.words_ready.connect(self.on_words_ready)
+        self.session_feeder.exhausted.connect(self.on_words_exhausted)
+        QApplication.instance().aboutToQuit.connect(self.session_feeder.stop)
+        
+        # 当前会话序号、已请求但尚未送达的单词数、单词本是否已读完、是否在等待下一个单词送达
+        self.session_generation = None
+        self.requested_count = 0
+        self.session_exhausted = True
+        self.waiting_for_next = False
         
         # 窗口拖动相关变量
         self.dragging = False
         self.drag_position = QPoint()
         
+        # 拖动时合并移动请求，每个显示刷新周期最多移动一次窗口
+        self.pending_move = None
+        self.last_move_time = 0.0
+        self.frame_interval = 1 / 60
+        self.drag_timer = QTimer(self)
+        self.drag_timer.setSingleShot(True)
+        self.drag_timer.setTimerType(Qt.PreciseTimer)
+        self.drag_timer.timeout.connect(self.apply_drag_move)
+        
+        # 最近一次拖动的帧时间统计
+        self.drag_stats = FrameStats()
+        
         # 当前模式：学习模式或复习模式
         self.mode = "learn"  # "learn" 或 "review"
         
         # 当前单词索引
         self.current_index = 0
         
-        # 单词列表（示例数据，实际应从单词本加载）
+        # 单词列表: 已显示过的单词和预读的后续单词（未加载单词本时为示例数据）
         self.words = [
             {"word": "apple", "meaning": "n. 苹果"},
             {"word": "banana", "meaning": "n. 香蕉"},
@@ -54,7 +111,9 @@ class FloatingWindow(QWidget):
         
         # 创建主布局
         main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
+        # 不透明窗口没有透明边距，内容铺满窗口
+        margin = 0 if self.opaque else 10
+        main_layout.setContentsMargins(margin, margin, margin, margin)
         
         # 创建标题栏
         title_bar = QWidget()
@@ -106,6 +165,11 @@ class FloatingWindow(QWidget):
         self.meaning_label.setAlignment(Qt.AlignCenter)
         self.meaning_label.setFont(QFont("Arial", 14))
         
+        self.example_label = QLabel()
+        self.example_label.setObjectName("exampleLabel")
+        self.example_label.setAlignment(Qt.AlignCenter)
+        self.example_label.setWordWrap(True)
+        
         # 复习模式按钮区域
         self.review_buttons_widget = QWidget()
         review_buttons_layout = QHBoxLayout(self.review_buttons_widget)
@@ -122,6 +186,7 @@ class FloatingWindow(QWidget):
         # 将单词区域添加到内容布局
         content_layout.addWidget(self.word_label)
         content_layout.addWidget(self.meaning_label)
+        content_layout.addWidget(self.example_label)
         content_layout.addWidget(self.review_buttons_widget)
         
         # 创建操作按钮区域
@@ -167,8 +232,6 @@ class FloatingWindow(QWidget):
         size_grip = QSizeGrip(self)
         main_layout.addWidget(size_grip, 0, Qt.AlignBottom | Qt.AlignRight)
         
-        # 设置样式表
-        self.set_stylesheet()
         
         # 默认为学习模式
         self.set_mode("learn")
@@ -190,80 +253,21 @@ class FloatingWindow(QWidget):
         # 复习模式按钮
         self.know_button.clicked.connect(self.mark_as_known)
         self.dont_know_button.clicked.connect(self.mark_as_unknown)
+        
+        # 快捷键（悬浮窗处于活动状态时有效，显示/隐藏悬浮窗的快捷键由主窗口绑定）
+        shortcuts = self.config_manager.config['shortcuts']
+        for name, slot in [("next_word", self.show_next_word),
+                           ("prev_word", self.show_prev_word),
+                           ("speak_word", self.speak_word),
+                           ("toggle_mode", self.toggle_mode)]:
+            shortcut = QShortcut(QKeySequence(shortcuts[name]), self)
+            shortcut.activated.connect(slot)
     
-    def set_stylesheet(self):
-        """设置样式表"""
-        self.setStyleSheet("""
-            QWidget {
-                font-family: Arial;
-            }
-            #titleBar {
-                background-color: #2c3e50;
-                color: white;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-            }
-            #titleLabel {
-                color: white;
-                font-weight: bold;
-            }
-            #pinButton, #modeButton, #closeButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 2px;
-                font-size: 14px;
-            }
-            #pinButton:hover, #modeButton:hover, #closeButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-                border-radius: 3px;
-            }
-            #closeButton:hover {
-                background-color: #e74c3c;
-            }
-            #contentFrame {
-                background-color: white;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            #wordLabel {
-                color: #2c3e50;
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-            #meaningLabel {
-                color: #34495e;
-                font-size: 16px;
-                margin-bottom: 15px;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            #knowButton {
-                background-color: #2ecc71;
-            }
-            #knowButton:hover {
-                background-color: #27ae60;
-            }
-            #dontKnowButton {
-                background-color: #e74c3c;
-            }
-            #dontKnowButton:hover {
-                background-color: #c0392b;
-            }
-            #favoriteButton:checked {
-                background-color: #f1c40f;
-            }
-        """)
+    def prepare(self):
+        """预先完成样式、布局和原生窗口的创建，之后显示窗口只需 show()"""
+        self.ensurePolished()
+        self.layout().activate()
+        self.winId()
     
     def load_config(self):
         """加载配置"""
@@ -275,17 +279,82 @@ class FloatingWindow(QWidget):
         y = 100
         self.move(x, y)
     
+    def load_vocabulary(self, vocab_path):
+        """加载单词本，由供词线程在后台读取，首批单词准备好后开始显示"""
+        self.stop_speaking()
+        self.session_generation = self.session_feeder.open(vocab_path, self.lookahead)
+        self.requested_count = self.lookahead
+        self.session_exhausted = False
+        self.waiting_for_next = False
+        
+        self.words = []
+        self.current_index = 0
+        self.prerendered_until = 0
+        self.word_label.setText("加载中...")
+        self.meaning_label.setText("")
+        self.example_label.setText("")
+    
+    def on_words_ready(self, generation, entries):
+        """供词线程准备好一批单词，放入预读缓冲区"""
+        if generation != self.session_generation:
+            return
+        
+        self.requested_count -= len(entries)
+        first_batch = not self.words
+        self.words.extend(entries)
+        if first_batch:
+            self.update_word_display()
+        elif self.waiting_for_next:
+            # 翻页时缓冲区已空，单词送达后完成翻页
+            self.waiting_for_next = False
+            self.show_next_word()
+        self.prerender_upcoming()
+    
+    def on_words_exhausted(self, generation):
+        """单词本已读完"""
+        if generation != self.session_generation:
+            return
+        
+        self.session_exhausted = True
+        self.requested_count = 0
+        self.waiting_for_next = False
+        if not self.words:
+            self.word_label.setText("单词本为空")
+    
+    def fill_lookahead(self):
+        """预读缓冲区中的单词（包括已请求的）不足一半时，请求供词线程补足"""
+        if self.session_exhausted:
+            return
+        
+        buffered = len(self.words) - self.current_index - 1 + self.requested_count
+        if buffered * 2 < self.lookahead:
+            count = self.lookahead - buffered
+            self.requested_count += count
+            self.session_feeder.request(count)
+    
+    def trim_history(self):
+        """丢弃过早的已学单词，长时间学习时单词列表不会无限增长"""
+        if self.current_index > self.HISTORY_SIZE * 2:
+            drop = self.current_index - self.HISTORY_SIZE
+            del self.words[:drop]
+            self.current_index -= drop
+            self.prerendered_until = max(self.prerendered_until - drop, 0)
+    
     def update_word_display(self):
         """更新单词显示"""
         if 0 <= self.current_index < len(self.words):
             current_word = self.words[self.current_index]
             self.word_label.setText(current_word["word"])
+            self.favorite_button.setChecked(current_word.get("status") == "favorite")
             
-            # 在学习模式下显示含义，复习模式下隐藏含义
+            # 在学习模式下显示含义和例句，复习模式下隐藏
             if self.mode == "learn":
+                examples = current_word.get("examples")
                 self.meaning_label.setText(current_word["meaning"])
+                self.example_label.setText(examples[0] if examples else "")
             else:
                 self.meaning_label.setText("")
+                self.example_label.setText("")
     
     def set_mode(self, mode):
         """设置模式（学习或复习）"""
@@ -294,10 +363,12 @@ class FloatingWindow(QWidget):
             self.mode_button.setText("复习模式")
             self.review_buttons_widget.hide()
             self.meaning_label.show()
+            self.example_label.show()
         else:  # review mode
             self.mode_button.setText("学习模式")
             self.review_buttons_widget.show()
             self.meaning_label.hide()
+            self.example_label.hide()
         
         # 更新单词显示
         self.update_word_display()
@@ -310,33 +381,94 @@ class FloatingWindow(QWidget):
             self.set_mode("learn")
     
     def toggle_pin(self):
-        """切换窗口置顶状态"""
+        """切换窗口置顶状态，直接修改原生窗口的标志，不重新创建窗口"""
         flags = self.windowFlags()
         if self.pin_button.isChecked():
             flags |= Qt.WindowStaysOnTopHint
         else:
             flags &= ~Qt.WindowStaysOnTopHint
-        self.setWindowFlags(flags)
-        self.show()  # 需要重新显示窗口以应用新的标志
+        
+        handle = self.windowHandle()
+        if handle is None:
+            # 原生窗口尚未创建，显示时使用新的标志
+            self.setWindowFlags(flags)
+        else:
+            # setWindowFlags 会销毁并重新创建原生窗口，这里只同步部件记录的标志
+            self.overrideWindowFlags(flags)
+            handle.setFlags(flags)
     
     def speak_word(self):
         """朗读当前单词"""
         if 0 <= self.current_index < len(self.words):
-            word = self.words[self.current_index]["word"]
-            self.tts_engine.say(word)
-            self.tts_engine.runAndWait()
+            current_word = self.words[self.current_index]
+            word = current_word["word"]
+            # 已缓存的音频直接播放（预读时已查好路径），否则交给朗读线程合成
+            path = current_word.get("audio")
+            if path is None and self.speech_worker.render_to_cache:
+                path = self.speech_worker.cached_clip(word)
+            if path is not None:
+                self.play_clip(word, path)
+            else:
+                self.speech_worker.speak(word)
+    
+    def play_clip(self, word, path):
+        """播放单词音频，已切换到其他单词时忽略"""
+        if not 0 <= self.current_index < len(self.words) or self.words[self.current_index]["word"] != word:
+            return
+        
+        if self.sound_effect is None:
+            from PySide6.QtMultimedia import QSoundEffect
+            self.sound_effect = QSoundEffect(self)
+        self.sound_effect.setSource(QUrl.fromLocalFile(path))
+        self.sound_effect.play()
+    
+    def stop_speaking(self):
+        """停止朗读当前单词"""
+        self.speech_worker.cancel()
+        if self.sound_effect is not None:
+            self.sound_effect.stop()
+    
+    def prerender_upcoming(self):
+        """在后台预先合成后续单词的发音"""
+        end = min(self.current_index + self.PRERENDER_COUNT, len(self.words))
+        if end > self.prerendered_until and self.speech_worker.isRunning():
+            start = max(self.prerendered_until, self.current_index)
+            self.speech_worker.prerender(word["word"] for word in self.words[start:end]
+                                         if word.get("audio") is None)
+            self.prerendered_until = end
+    
+    def on_word_spoken(self, word):
+        """朗读完成事件处理"""
+        self.speak_button.setToolTip("朗读单词")
+    
+    def on_speech_failed(self, message):
+        """朗读失败事件处理"""
+        self.speak_button.setToolTip(f"朗读失败: {message}")
+    
+    def on_speech_unavailable(self, message):
+        """TTS引擎不可用事件处理，禁用朗读按钮"""
+        self.speak_button.setEnabled(False)
+        self.speak_button.setToolTip(f"朗读不可用: {message}")
     
     def show_prev_word(self):
         """显示上一个单词"""
         if self.current_index > 0:
             self.current_index -= 1
+            self.stop_speaking()
             self.update_word_display()
     
     def show_next_word(self):
-        """显示下一个单词"""
+        """显示下一个单词（只从预读缓冲区中取，不读盘）"""
         if self.current_index < len(self.words) - 1:
             self.current_index += 1
+            self.stop_speaking()
             self.update_word_display()
+            self.trim_history()
+            self.prerender_upcoming()
+        elif not self.session_exhausted:
+            # 缓冲区已空，下一批单词送达后再翻页
+            self.waiting_for_next = True
+        self.fill_lookahead()
     
     def skip_word(self):
         """跳过当前单词"""
@@ -365,18 +497,52 @@ class FloatingWindow(QWidget):
         """鼠标按下事件处理"""
         if event.button() == Qt.LeftButton:
             self.dragging = True
-            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            
+            # 按窗口所在屏幕的刷新率合并移动
+            screen = self.screen()
+            refresh_rate = screen.refreshRate() if screen is not None else 0
+            self.frame_interval = 1 / (refresh_rate if refresh_rate > 0 else 60)
+            self.drag_stats.reset()
             event.accept()
     
     def mouseMoveEvent(self, event):
-        """鼠标移动事件处理"""
+        """鼠标移动事件处理，只记录目标位置，每个刷新周期最多移动一次窗口"""
         if event.buttons() == Qt.LeftButton and self.dragging:
-            self.move(event.globalPos() - self.drag_position)
+            self.pending_move = event.globalPosition().toPoint() - self.drag_position
+            if not self.drag_timer.isActive():
+                wait = self.frame_interval - (time.perf_counter() - self.last_move_time)
+                if wait <= 0:
+                    self.apply_drag_move()
+                else:
+                    self.drag_timer.start(max(int(wait * 1000), 1))
             event.accept()
     
     def mouseReleaseEvent(self, event):
-        """鼠标释放事件处理"""
+        """鼠标释放事件处理，立即移动到最终位置"""
         self.dragging = False
+        self.drag_timer.stop()
+        self.apply_drag_move()
+    
+    def apply_drag_move(self):
+        """将窗口移动到最新的拖动位置"""
+        if self.pending_move is None:
+            return
+        start = time.perf_counter()
+        self.move(self.pending_move)
+        self.pending_move = None
+        self.last_move_time = start
+        self.drag_stats.frame(start)
+    
+    def showEvent(self, event):
+        """窗口显示事件处理，稍后在空闲时启动朗读线程并预先合成后续单词的发音"""
+        super().showEvent(event)
+        QTimer.singleShot(self.SPEECH_PREWARM_DELAY_MS, self.start_speech)
+    
+    def start_speech(self):
+        """启动朗读线程并预先合成后续单词的发音"""
+        self.speech_worker.start()
+        self.prerender_upcoming()
     
     def closeEvent(self, event):
         """窗口关闭事件处理"""
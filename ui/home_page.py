@@ -13,6 +13,7 @@ class HomePage(QWidget):
     
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
+        self.setObjectName("homePage")  # 应用级样式表中本页面规则的前缀
         self.config_manager = config_manager
         
         self.init_ui()
@@ -136,8 +137,6 @@ class HomePage(QWidget):
         
         main_layout.addWidget(stats_frame)
         
-        # 设置样式表
-        self.set_stylesheet()
     
     def create_feature_card(self, title, description, button_text):
         """创建功能卡片"""
@@ -188,65 +187,4 @@ class HomePage(QWidget):
         elif title == "复习单词":
             self.start_review_signal.emit()
         elif title == "单词测验":
-            self.start_test_signal.emit()
-    
-    def set_stylesheet(self):
-        """设置样式表"""
-        self.setStyleSheet("""
-            #welcomeLabel {
-                color: #2c3e50;
-                margin-bottom: 10px;
-            }
-            
-            #descriptionLabel {
-                color: #7f8c8d;
-                margin-bottom: 20px;
-            }
-            
-            #featureCard {
-                background-color: white;
-                border-radius: 10px;
-                padding: 15px;
-                min-height: 200px;
-            }
-            
-            #cardTitle {
-                color: #2c3e50;
-                margin-bottom: 10px;
-            }
-            
-            #cardDescription {
-                color: #7f8c8d;
-                margin-bottom: 15px;
-            }
-            
-            #cardButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 14px;
-            }
-            
-            #cardButton:hover {
-                background-color: #2980b9;
-            }
-            
-            #statsFrame {
-                background-color: white;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            
-            #statsTitle {
-                color: #2c3e50;
-                margin-bottom: 15px;
-            }
-            
-            #statsCount {
-                color: #3498db;
-                font-size: 24px;
-                font-weight: bold;
-            }
-        """)
\ No newline at end of file
+            self.start_test_signal.emit()
\ No newline at end of file
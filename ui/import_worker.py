@@ -0,0 +1,47 @@
+import threading
+from PySide6.QtCore import QObject, QRunnable, Signal
+from utils.vocab_importer import import_vocabulary_file, ImportCancelled
+
+class ImportSignals(QObject):
+    """导入任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+    
+    progress = Signal(int)      # 导入进度 0-100
+    finished = Signal(dict)     # 导入完成，参数为单词本信息
+    failed = Signal(str)        # 导入失败，参数为错误信息
+    cancelled = Signal()        # 导入已取消
+
+
+class ImportWorker(QRunnable):
+    """单词本导入任务，在线程池中解析文件，避免阻塞界面"""
+    
+    def __init__(self, file_path, output_dir, compression='none'):
+        super().__init__()
+        self.file_path = file_path
+        self.output_dir = output_dir
+        self.compression = compression
+        self.signals = ImportSignals()
+        self._cancel_event = threading.Event()
+        
+        # 由调用方持有引用，防止信号对象在任务结束前被回收
+        self.setAutoDelete(False)
+    
+    def cancel(self):
+        """请求取消导入，在处理下一块数据前生效"""
+        self._cancel_event.set()
+    
+    def run(self):
+        """在工作线程中执行导入"""
+        try:
+            vocabulary = import_vocabulary_file(
+                self.file_path,
+                self.output_dir,
+                progress_callback=self.signals.progress.emit,
+                is_cancelled=self._cancel_event.is_set,
+                compression=self.compression
+            )
+        except ImportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(vocabulary)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+class IndexSignals(QObject):
+    """建立索引任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+    
+    failed = Signal(str)        # 单词本的索引建立失败，参数为单词本路径
+    finished = Signal()         # 全部单词本已处理
+
+
+class FuzzyIndexWorker(QRunnable):
+    """模糊查找索引建立任务，在线程池中加载单词本并建立索引，避免首次模糊查找时阻塞界面"""
+    
+    def __init__(self, word_manager, vocab_paths):
+        super().__init__()
+        self.word_manager = word_manager
+        self.vocab_paths = list(vocab_paths)
+        self.signals = IndexSignals()
+        
+        # 由调用方持有引用，防止信号对象在任务结束前被回收
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """在工作线程中依次建立各单词本的模糊查找索引"""
+        for vocab_path in self.vocab_paths:
+            try:
+                self.word_manager.get_fuzzy_index(vocab_path)
+            except Exception as e:
+                print(f"建立模糊查找索引失败: {e}")
+                self.signals.failed.emit(vocab_path)
+        self.signals.finished.emit()
\ No newline at end of file
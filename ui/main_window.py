@@ -1,24 +1,52 @@
 import sys
 import os
+import time
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QListWidget, QStackedWidget, 
                              QFileDialog, QSlider, QCheckBox, QComboBox, QLineEdit, 
-                             QMessageBox, QListWidgetItem, QFrame)
-from PySide6.QtCore import Qt, QSize, Signal as pyqtSignal
-from PySide6.QtGui import QFont, QIcon
+                             QMessageBox, QListWidgetItem, QFrame, QProgressDialog, QApplication)
+from PySide6.QtCore import Qt, QSize, QTimer, Signal as pyqtSignal
+from PySide6.QtGui import QFont, QIcon, QKeySequence, QShortcut
 
 from ui.floating_window import FloatingWindow
 from ui.home_page import HomePage
 from ui.vocabulary_page import VocabularyPage
 from ui.settings_page import SettingsPage
+from ui.speech_worker import SpeechWorker
+from ui.theme import apply_theme
+from utils.perf_stats import FrameStats
 
 class MainWindow(QMainWindow):
     """主窗口类，包含左侧菜单和右侧内容区域"""
     
+    # 各菜单项对应的页面: (属性名, 页面类)，页面在首次切换到时才创建
+    PAGES = [
+        ("home_page", HomePage),
+        ("vocabulary_page", VocabularyPage),
+        ("settings_page", SettingsPage)
+    ]
+    
+    # 窗口显示后等待多久开始在空闲时预先创建其他页面（毫秒）
+    PREWARM_DELAY_MS = 1500
+    
     def __init__(self, config_manager):
         super().__init__()
         self.config_manager = config_manager
         self.floating_window = None
+        self.prewarm_started = False
+        
+        # 显示悬浮窗的耗时统计
+        self.floating_show_stats = FrameStats()
+        
+        # 朗读线程: 悬浮窗和生成发音缓存共用同一个TTS引擎
+        self.speech_worker = SpeechWorker(config_manager.audio_cache, self)
+        QApplication.instance().aboutToQuit.connect(self.speech_worker.stop)
+        self.audio_warm_progress = None
+        
+        # 尚未创建的页面为 None
+        self.home_page = None
+        self.vocabulary_page = None
+        self.settings_page = None
         
         self.init_ui()
         self.setup_connections()
@@ -88,22 +116,15 @@ class MainWindow(QMainWindow):
         self.content_widget = QStackedWidget()
         self.content_widget.setObjectName("contentWidget")
         
-        # 创建各个页面
-        self.home_page = HomePage(self.config_manager)
-        self.vocabulary_page = VocabularyPage(self.config_manager)
-        self.settings_page = SettingsPage(self.config_manager)
-        
-        # 将页面添加到堆叠部件中
-        self.content_widget.addWidget(self.home_page)
-        self.content_widget.addWidget(self.vocabulary_page)
-        self.content_widget.addWidget(self.settings_page)
+        # 先用占位部件填充堆叠部件，启动时只创建首页
+        for _ in self.PAGES:
+            self.content_widget.addWidget(QWidget())
+        self.ensure_page(0)
         
         # 将左侧菜单和右侧内容添加到主布局
         main_layout.addWidget(self.menu_widget)
         main_layout.addWidget(self.content_widget)
         
-        # 设置样式表
-        self.set_stylesheet()
         
         # 默认选中首页
         self.menu_list.setCurrentRow(0)
@@ -111,19 +132,89 @@ class MainWindow(QMainWindow):
     def setup_connections(self):
         """设置信号连接"""
         # 菜单项切换页面
-        self.menu_list.currentRowChanged.connect(self.content_widget.setCurrentIndex)
+        self.menu_list.currentRowChanged.connect(self.on_menu_row_changed)
         
         # 启动悬浮窗按钮
         self.start_floating_btn.clicked.connect(self.toggle_floating_window)
+        
+        # 显示/隐藏悬浮窗快捷键，应用的任一窗口（包括悬浮窗）处于活动状态时有效
+        self.toggle_float_shortcut = QShortcut(QKeySequence(self.config_manager.config['shortcuts']['toggle_float']), self)
+        self.toggle_float_shortcut.setContext(Qt.ApplicationShortcut)
+        self.toggle_float_shortcut.activated.connect(self.toggle_floating_window)
+    
+    def ensure_page(self, index):
+        """创建尚未创建的页面，替换堆叠部件中的占位部件"""
+        name, page_class = self.PAGES[index]
+        page = getattr(self, name)
+        if page is not None:
+            return page
+        
+        page = page_class(self.config_manager)
+        setattr(self, name, page)
+        if name == "vocabulary_page":
+            page.warm_audio_requested.connect(self.warm_audio_cache)
+        elif name == "settings_page":
+            page.settings_changed.connect(self.on_settings_changed)
+        
+        placeholder = self.content_widget.widget(index)
+        current_index = self.content_widget.currentIndex()
+        self.content_widget.insertWidget(index, page)
+        self.content_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.content_widget.setCurrentIndex(current_index)
+        return page
+    
+    def on_menu_row_changed(self, row):
+        """菜单项切换事件处理"""
+        if row < 0:
+            return
+        self.ensure_page(row)
+        self.content_widget.setCurrentIndex(row)
+    
+    def showEvent(self, event):
+        """窗口显示事件处理，首次显示后在空闲时预先创建隐藏的悬浮窗和其他页面"""
+        super().showEvent(event)
+        if not self.prewarm_started:
+            self.prewarm_started = True
+            # 悬浮窗总是预先创建，与是否预先创建页面无关
+            QTimer.singleShot(self.PREWARM_DELAY_MS, self.prewarm_floating_window)
+            if self.config_manager.config['general']['prewarm_pages']:
+                QTimer.singleShot(self.PREWARM_DELAY_MS, self.prewarm_next_page)
+    
+    def prewarm_next_page(self):
+        """预先创建下一个尚未创建的页面，每次只创建一个，避免长时间阻塞界面"""
+        for index, (name, _) in enumerate(self.PAGES):
+            if getattr(self, name) is None:
+                self.ensure_page(index)
+                QTimer.singleShot(0, self.prewarm_next_page)
+                return
+    
+    def prewarm_floating_window(self):
+        """在空闲时创建隐藏的悬浮窗，用户已先打开悬浮窗时不再创建"""
+        if self.floating_window is None:
+            self.create_floating_window()
+    
+    def create_floating_window(self):
+        """创建隐藏的悬浮窗并加载第一个单词本，之后切换悬浮窗只需显示或隐藏"""
+        self.floating_window = FloatingWindow(self.config_manager, self.speech_worker)
+        self.floating_window.closed.connect(self.on_floating_window_closed)
+        
+        # 加载第一个单词本
+        vocabularies = self.config_manager.word_manager.get_vocabularies()
+        if vocabularies:
+            self.floating_window.load_vocabulary(vocabularies[0]['path'])
+        self.floating_window.prepare()
     
     def toggle_floating_window(self):
         """切换悬浮窗的显示状态"""
-        if self.floating_window is None or not self.floating_window.isVisible():
-            # 创建并显示悬浮窗
-            if self.floating_window is None:
-                self.floating_window = FloatingWindow(self.config_manager)
-                self.floating_window.closed.connect(self.on_floating_window_closed)
+        if self.floating_window is None:
+            self.create_floating_window()
+        
+        if not self.floating_window.isVisible():
+            # 显示悬浮窗并记录耗时
+            start = time.perf_counter()
             self.floating_window.show()
+            self.floating_show_stats.frame(start)
             self.start_floating_btn.setText("关闭悬浮窗")
         else:
             # 关闭悬浮窗
@@ -134,58 +225,73 @@ class MainWindow(QMainWindow):
         """悬浮窗关闭事件处理"""
         self.start_floating_btn.setText("启动悬浮窗")
     
-    def set_stylesheet(self):
-        """设置样式表"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            #menuWidget {
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                border: none;
-            }
-            #appTitle {
-                color: #ecf0f1;
-                padding: 10px;
-            }
-            #menuList {
-                background-color: transparent;
-                color: #ecf0f1;
-                border: none;
-            }
-            #menuList::item {
-                padding: 10px;
-                border-radius: 5px;
-            }
-            #menuList::item:selected {
-                background-color: #34495e;
-            }
-            #menuList::item:hover {
-                background-color: #34495e;
-            }
-            #startFloatingBtn {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            #startFloatingBtn:hover {
-                background-color: #2980b9;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+    def warm_audio_cache(self, vocab_path):
+        """在后台为整个单词本预先合成发音音频"""
+        if self.audio_warm_progress is not None:
+            return
+        if not self.speech_worker.available:
+            QMessageBox.warning(self, "生成发音缓存", "TTS引擎不可用，无法生成发音缓存")
+            return
+        
+        words = [word['word'] for word in self.config_manager.word_manager.iter_vocabulary_words(vocab_path)]
+        if not words:
+            return
+        
+        # 显示进度对话框
+        self.audio_warm_progress = QProgressDialog("正在生成单词发音...", "取消", 0, len(words), self)
+        self.audio_warm_progress.setWindowTitle("生成发音缓存")
+        self.audio_warm_progress.setWindowModality(Qt.WindowModal)
+        self.audio_warm_progress.setMinimumDuration(300)
+        self.audio_warm_progress.setAutoClose(False)
+        self.audio_warm_progress.setAutoReset(False)
+        self.audio_warm_progress.setValue(0)
+        
+        self.speech_worker.render_progress.connect(self.on_audio_warm_progress)
+        self.speech_worker.render_finished.connect(self.on_audio_warm_finished)
+        self.speech_worker.unavailable.connect(self.on_audio_warm_unavailable)
+        self.audio_warm_progress.canceled.connect(self.speech_worker.cancel_prerender)
+        self.speech_worker.prerender(words)
+    
+    def on_audio_warm_progress(self, done, total):
+        """生成发音缓存进度事件处理"""
+        if self.audio_warm_progress is not None:
+            self.audio_warm_progress.setMaximum(total)
+            self.audio_warm_progress.setValue(done)
+    
+    def on_audio_warm_finished(self, rendered):
+        """生成发音缓存完成事件处理"""
+        if self.audio_warm_progress is None:
+            return
+        cancelled = self.audio_warm_progress.wasCanceled()
+        self.finish_audio_warm()
+        
+        if not self.speech_worker.render_to_cache:
+            QMessageBox.warning(self, "生成发音缓存", "当前环境无法播放音频文件，朗读时将直接使用TTS引擎")
+        elif not cancelled:
+            QMessageBox.information(self, "生成发音缓存", f"已生成 {rendered} 个单词的发音")
+    
+    def on_audio_warm_unavailable(self, message):
+        """TTS引擎不可用事件处理"""
+        if self.audio_warm_progress is None:
+            return
+        self.finish_audio_warm()
+        QMessageBox.warning(self, "生成发音缓存", f"TTS引擎不可用，无法生成发音缓存：{message}")
+    
+    def finish_audio_warm(self):
+        """结束生成发音缓存，关闭进度对话框"""
+        self.speech_worker.render_progress.disconnect(self.on_audio_warm_progress)
+        self.speech_worker.render_finished.disconnect(self.on_audio_warm_finished)
+        self.speech_worker.unavailable.disconnect(self.on_audio_warm_unavailable)
+        self.audio_warm_progress.canceled.disconnect()
+        self.audio_warm_progress.close()
+        self.audio_warm_progress.deleteLater()
+        self.audio_warm_progress = None
+    
+    def on_settings_changed(self):
+        """设置变更事件处理，主题变化时重新应用应用级样式表，复习策略变化时更新今日任务"""
+        apply_theme(self.config_manager.config['appearance']['theme'])
+        if self.vocabulary_page is not None:
+            self.vocabulary_page.refresh_word_lists()
     
     def closeEvent(self, event):
         """窗口关闭事件处理"""
@@ -0,0 +1,134 @@
+import queue
+import threading
+from PySide6.QtCore import QThread, Signal
+
+class SessionFeeder(QThread):
+    """
+    学习会话供词线程，在后台从单词本流式读取单词，并准备好例句、已缓存的发音和复习调度状态，
+    悬浮窗只从内存中的预读缓冲区取下一个单词，翻页时不需要读盘或计算
+    """
+    
+    words_ready = Signal(int, list)  # 准备好一批单词，参数为会话序号和单词条目列表
+    exhausted = Signal(int)          # 单词本已读完，参数为会话序号
+    
+    def __init__(self, word_manager, speech_worker=None, parent=None):
+        super().__init__(parent)
+        self.word_manager = word_manager
+        self.speech_worker = speech_worker
+        
+        # 请求队列，元素为 ('open', 序号, 单词本路径, 数量)、('more', 序号, 数量) 或 ('stop',)
+        self._requests = queue.Queue()
+        
+        # 会话序号: 每次打开单词本时递增，序号不是最新的请求已过时
+        self._lock = threading.Lock()
+        self._generation = 0
+        
+        # 当前会话的单词本路径、word_id 使用的单词本路径和尚未读取的单词（只在供词线程中使用）
+        self._vocab_path = None
+        self._id_path = None
+        self._iterator = None
+        
+        self._stopped = False
+    
+    def open(self, vocab_path, count):
+        """
+        开始新的学习会话，之前会话中尚未送达的单词都会被放弃
+        
+        Args:
+            vocab_path (str): 单词本路径
+            count (int): 首批准备的单词数
+        
+        Returns:
+            int: 会话序号，words_ready 和 exhausted 信号中序号不同的结果应忽略
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._requests.put(('open', generation, vocab_path, count))
+        if not self._stopped and not self.isRunning():
+            self.start()
+        return generation
+    
+    def request(self, count):
+        """为当前会话继续准备 count 个单词"""
+        with self._lock:
+            self._requests.put(('more', self._generation, count))
+    
+    def stop(self):
+        """停止供词线程并等待其结束"""
+        self._stopped = True
+        with self._lock:
+            self._generation += 1
+        self._requests.put(('stop',))
+        self.wait()
+    
+    def _is_stale(self, generation):
+        """判断请求是否已过时"""
+        return generation != self._generation
+    
+    def run(self):
+        """依次处理打开单词本和继续读取的请求"""
+        while True:
+            request = self._requests.get()
+            if request[0] == 'stop':
+                break
+            generation = request[1]
+            if self._is_stale(generation):
+                continue
+            
+            if request[0] == 'open':
+                self._vocab_path = request[2]
+                self._id_path = self.word_manager.word_id_path(self._vocab_path)
+                self._iterator = iter(self.word_manager.iter_vocabulary_words(self._vocab_path))
+                count = request[3]
+            else:
+                count = request[2]
+            self._feed(generation, count)
+    
+    def _feed(self, generation, count):
+        """读取并准备 count 个单词，单词本读完时发送 exhausted 信号"""
+        if self._iterator is None:
+            return
+        
+        entries = []
+        try:
+            for word in self._iterator:
+                entries.append(self._prepare(word))
+                if len(entries) >= count or self._is_stale(generation):
+                    break
+            else:
+                self._iterator = None
+        except Exception as e:
+            print(f"读取单词失败: {e}")
+            self._iterator = None
+        
+        if self._is_stale(generation):
+            return
+        if entries:
+            self.words_ready.emit(generation, entries)
+        if self._iterator is None:
+            self.exhausted.emit(generation)
+    
+    def _prepare(self, word):
+        """准备悬浮窗显示一个单词所需的全部数据"""
+        word_id = f"{self._id_path}:{word['word']}"
+        status, next_review_time = self.word_manager.get_word_schedule(word_id)
+        
+        examples = word.get('examples') or []
+        if isinstance(examples, str):
+            examples = [examples]
+        
+        audio = None
+        if self.speech_worker is not None and self.speech_worker.render_to_cache:
+            audio = self.speech_worker.cached_clip(word['word'])
+        
+        return {
+            'word': word['word'],
+            'meaning': word.get('meaning', ''),
+            'phonetic': word.get('phonetic') or '',
+            'examples': list(examples),
+            'word_id': word_id,
+            'status': status,
+            'next_review_time': next_review_time,
+            'audio': audio
+        }
\ No newline at end of file
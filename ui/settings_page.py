@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QFrame, QScrollArea, QSlider, QCheckBox, QComboBox,
-                             QLineEdit, QGroupBox, QFormLayout, QSpinBox, QTabWidget)
+                             QLineEdit, QGroupBox, QFormLayout, QSpinBox, QTabWidget, QMessageBox)
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QIcon, QKeySequence
 
@@ -12,6 +12,7 @@ class SettingsPage(QWidget):
     
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
+        self.setObjectName("settingsPage")  # 应用级样式表中本页面规则的前缀
         self.config_manager = config_manager
         
         self.init_ui()
@@ -63,8 +64,6 @@ class SettingsPage(QWidget):
         
         main_layout.addLayout(buttons_layout)
         
-        # 设置样式表
-        self.set_stylesheet()
     
     def create_general_settings_tab(self):
         """创建常规设置选项卡"""
@@ -295,7 +294,7 @@ class SettingsPage(QWidget):
         
         # 编辑快捷键说明
         note_label = QLabel("注：点击输入框并按下快捷键组合来设置新的快捷键")
-        note_label.setStyleSheet("color: #7f8c8d; font-style: italic;")
+        note_label.setObjectName("noteLabel")
         
         layout.addWidget(shortcut_group)
         layout.addWidget(note_label)
@@ -324,9 +323,18 @@ class SettingsPage(QWidget):
     
     def load_settings(self):
         """加载设置"""
-        # 在实际应用中，应从配置管理器加载设置
-        # 这里使用默认值
-        pass
+        # 在实际应用中，应从配置管理器加载全部设置
+        # 这里只加载主题和复习策略，其余使用默认值
+        self.theme_combo.setCurrentText(self.config_manager.config['appearance']['theme'])
+        
+        review = self.config_manager.config['review']
+        self.review_strategy_combo.setCurrentText(review['strategy'])
+        for spin, days in zip(self.interval_spins(), review['intervals']):
+            spin.setValue(days)
+    
+    def interval_spins(self):
+        """获取自定义复习间隔的输入框"""
+        return [self.interval1_spin, self.interval2_spin, self.interval3_spin, self.interval4_spin, self.interval5_spin]
     
     def on_review_strategy_changed(self, strategy):
         """复习策略变化事件处理"""
@@ -351,9 +359,13 @@ class SettingsPage(QWidget):
     
     def save_settings(self):
         """保存设置"""
-        # 在实际应用中，应将设置保存到配置管理器
-        # 这里简单地显示一个消息框
-        from PyQt5.QtWidgets import QMessageBox
+        # 在实际应用中，应将全部设置保存到配置管理器
+        # 这里只保存主题和复习策略，其余简单地显示一个消息框
+        with self.config_manager.lock:
+            self.config_manager.config['appearance']['theme'] = self.theme_combo.currentText()
+            self.config_manager.config['review']['strategy'] = self.review_strategy_combo.currentText()
+            self.config_manager.config['review']['intervals'] = [spin.value() for spin in self.interval_spins()]
+        self.config_manager.save_config()
         QMessageBox.information(self, "保存设置", "设置已保存")
         
         # 发送设置变更信号
@@ -362,7 +374,6 @@ class SettingsPage(QWidget):
     def reset_settings(self):
         """重置设置"""
         # 确认重置
-        from PyQt5.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self,
             "确认重置",
@@ -399,65 +410,4 @@ class SettingsPage(QWidget):
             self.on_meaning_font_size_changed(14)
             self.on_mix_ratio_changed(70)
             
-            QMessageBox.information(self, "重置设置", "所有设置已重置为默认值")
-    
-    def set_stylesheet(self):
-        """设置样式表"""
-        self.setStyleSheet("""
-            #pageTitle {
-                color: #2c3e50;
-                margin-bottom: 20px;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 3px;
-            }
-            
-            QSlider::groove:horizontal {
-                border: 1px solid #bdc3c7;
-                height: 8px;
-                background: #e0e0e0;
-                margin: 2px 0;
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #3498db;
-                border: 1px solid #2980b9;
-                width: 18px;
-                height: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }
-            
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            #resetBtn {
-                background-color: #e74c3c;
-            }
-            
-            #resetBtn:hover {
-                background-color: #c0392b;
-            }
-        """)
\ No newline at end of file
+            QMessageBox.information(self, "重置设置", "所有设置已重置为默认值")
\ No newline at end of file
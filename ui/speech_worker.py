@@ -0,0 +1,238 @@
+import queue
+import threading
+from collections import deque
+from PySide6.QtCore import QThread, Signal
+
+def audio_playback_available():
+    """判断是否可以播放音频文件（部分 PySide6 安装不包含 QtMultimedia）"""
+    try:
+        import PySide6.QtMultimedia
+    except ImportError:
+        return False
+    return True
+
+
+class SpeechWorker(QThread):
+    """
+    朗读线程，TTS引擎只在该线程中创建和使用，界面线程只提交朗读请求。
+    线程在首次朗读或调用 start 时才启动，pyttsx3 在线程中导入和初始化，不占用界面线程的时间。
+    设置了音频缓存且可以播放音频文件时，单词先合成到缓存再由界面播放，
+    没有朗读请求时在后台预先合成即将学习的单词
+    """
+    
+    # 预先合成时每次提交给TTS引擎的单词数，每批之间优先处理朗读请求
+    RENDER_BATCH_SIZE = 20
+    
+    spoken = Signal(str)                # 朗读完成，参数为朗读的文本
+    clip_ready = Signal(str, str)       # 单词音频已合成，参数为文本和音频文件路径
+    failed = Signal(str)                # 朗读失败，参数为错误信息
+    unavailable = Signal(str)           # TTS引擎不可用（未安装 pyttsx3 或没有语音驱动），参数为错误信息
+    render_progress = Signal(int, int)  # 预先合成进度，参数为已处理和已提交的单词数
+    render_finished = Signal(int)       # 提交的单词都已处理，参数为新合成的音频数量
+    
+    def __init__(self, audio_cache=None, parent=None):
+        super().__init__(parent)
+        self.audio_cache = audio_cache
+        # 是否合成到缓存，引擎初始化时确定
+        self.render_to_cache = False
+        
+        # 请求队列，元素为 ('speak', 序号, 文本)、('render',) 或 ('stop',)
+        self._requests = queue.Queue()
+        
+        # 请求序号: 每次提交或取消时递增，序号不是最新的请求已过时
+        self._lock = threading.Lock()
+        self._generation = 0
+        
+        # 正在朗读的请求序号
+        self._speaking_generation = None
+        
+        # 等待预先合成的单词，以及本轮合成的进度
+        self._render_words = deque()
+        self._render_total = 0
+        self._render_done = 0
+        self._rendered = 0
+        self._rendered_bytes = 0
+        
+        # 引擎当前的语音和语速，引擎初始化后才可用
+        self.voice = None
+        self.rate = None
+        
+        # TTS引擎初始化失败后不再接受朗读请求
+        self.available = True
+        self._stopped = False
+    
+    def start(self):
+        """启动朗读线程（已启动、已停止或引擎不可用时忽略）"""
+        if self.available and not self._stopped and not self.isRunning():
+            super().start()
+    
+    def speak(self, text):
+        """
+        提交朗读请求，之前尚未朗读完的请求都会被放弃
+        
+        Returns:
+            bool: 引擎不可用或线程已停止时返回 False
+        """
+        if not self.available or self._stopped:
+            return False
+        with self._lock:
+            self._generation += 1
+            self._requests.put(('speak', self._generation, text))
+        self.start()
+        return True
+    
+    def cancel(self):
+        """放弃所有尚未朗读完的请求，正在朗读的文本在下一个词开始前停止"""
+        with self._lock:
+            self._generation += 1
+    
+    def cached_clip(self, text):
+        """获取已缓存的音频文件路径，未缓存或引擎尚未初始化时返回 None"""
+        if self.audio_cache is None or self.voice is None:
+            return None
+        return self.audio_cache.get(text, self.voice, self.rate)
+    
+    def prerender(self, words):
+        """在后台预先合成单词音频（已缓存的单词会跳过）"""
+        if self.audio_cache is None or not self.available or self._stopped:
+            return
+        words = list(words)
+        with self._lock:
+            if not self._render_words:
+                # 上一轮已处理完，重新统计进度
+                self._render_total = self._render_done = self._rendered = self._rendered_bytes = 0
+            self._render_words.extend(words)
+            self._render_total += len(words)
+        self._requests.put(('render',))
+        self.start()
+    
+    def cancel_prerender(self):
+        """放弃尚未合成的单词"""
+        with self._lock:
+            self._render_words.clear()
+    
+    def stop(self):
+        """停止朗读线程并等待其结束"""
+        self._stopped = True
+        self.cancel()
+        self.cancel_prerender()
+        self._requests.put(('stop',))
+        self.wait()
+    
+    def _is_stale(self, generation):
+        """判断请求是否已过时"""
+        return generation != self._generation
+    
+    def _next_request(self):
+        """
+        取出下一个请求: 积压的朗读请求只保留最新的一个，没有朗读请求时才预先合成，
+        既没有请求也没有等待合成的单词时阻塞等待
+        """
+        request = None
+        while True:
+            try:
+                item = self._requests.get(block=request is None and not self._render_words)
+            except queue.Empty:
+                break
+            if item[0] == 'stop':
+                return item
+            if item[0] == 'speak':
+                request = item
+        return request if request is not None else ('render',)
+    
+    def _on_started_word(self, name, location, length):
+        """朗读每个词之前检查请求是否已过时，过时则停止朗读"""
+        if self._speaking_generation is not None and self._is_stale(self._speaking_generation):
+            self.engine.stop()
+    
+    def run(self):
+        """在朗读线程中创建TTS引擎并依次处理朗读和预先合成请求"""
+        try:
+            import pyttsx3
+            self.engine = pyttsx3.init()
+            self.engine.connect('started-word', self._on_started_word)
+            self.voice = self.engine.getProperty('voice')
+            self.rate = self.engine.getProperty('rate')
+            self.render_to_cache = (self.audio_cache is not None and self.audio_cache.render_supported
+                                    and audio_playback_available())
+        except Exception as e:
+            print(f"初始化TTS引擎失败: {e}")
+            self.available = False
+            self.unavailable.emit(str(e))
+            return
+        
+        while True:
+            request = self._next_request()
+            if request[0] == 'stop':
+                break
+            if request[0] == 'render':
+                self._render_next_batch()
+            else:
+                self._speak(request[1], request[2])
+    
+    def _speak(self, generation, text):
+        """处理朗读请求: 优先合成到缓存由界面播放，无法使用缓存时直接朗读"""
+        if self._is_stale(generation):
+            return
+        
+        self._speaking_generation = generation
+        try:
+            if self.render_to_cache and self.audio_cache is not None:
+                path = self.cached_clip(text)
+                if path is None:
+                    self.audio_cache.render(self.engine, [text], self.voice, self.rate)
+                    self._check_render_supported()
+                    path = self.cached_clip(text)
+                if path is not None:
+                    if not self._is_stale(generation):
+                        self.clip_ready.emit(text, path)
+                    return
+            
+            self.engine.say(text)
+            self.engine.runAndWait()
+        except Exception as e:
+            print(f"朗读失败: {e}")
+            self.failed.emit(str(e))
+        else:
+            if not self._is_stale(generation):
+                self.spoken.emit(text)
+        finally:
+            self._speaking_generation = None
+    
+    def _check_render_supported(self):
+        """TTS引擎输出的音频格式无法播放时停止合成到缓存，之后直接朗读"""
+        if not self.audio_cache.render_supported:
+            self.render_to_cache = False
+            self.cancel_prerender()
+    
+    def _render_next_batch(self):
+        """预先合成一批单词"""
+        with self._lock:
+            count = min(self.RENDER_BATCH_SIZE, len(self._render_words))
+            batch = [self._render_words.popleft() for _ in range(count)]
+        
+        if batch and self.render_to_cache:
+            try:
+                rendered, rendered_bytes = self.audio_cache.render(self.engine, batch, self.voice, self.rate)
+            except Exception as e:
+                print(f"合成单词音频失败: {e}")
+                rendered, rendered_bytes = 0, 0
+            self._check_render_supported()
+            self._rendered += rendered
+            self._rendered_bytes += rendered_bytes
+            
+            # 本轮合成的音频已占满缓存时停止，继续合成只会淘汰刚合成的音频
+            if self._rendered_bytes >= self.audio_cache.max_bytes:
+                self.cancel_prerender()
+        
+        with self._lock:
+            if self._render_done == self._render_total:
+                # 本轮已结束（多余的唤醒请求）
+                return
+            self._render_done += len(batch)
+            if not self._render_words:
+                self._render_done = self._render_total
+            done, total, finished = self._render_done, self._render_total, not self._render_words
+        self.render_progress.emit(done, total)
+        if finished:
+            self.render_finished.emit(self._rendered)
\ No newline at end of file
@@ -0,0 +1,474 @@
+from string import Template
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPalette, QColor
+
+# 默认主题名称
+DEFAULT_THEME = "默认主题"
+
+# 各主题的调色板
+THEMES = {
+    "默认主题": {
+        "window_bg": "#f5f5f5",
+        "text": "#333333",
+        "surface": "white",
+        "border": "#ddd",
+        "border_light": "#eee",
+        "title": "#2c3e50",
+        "muted": "#7f8c8d",
+        "meaning": "#34495e",
+        "accent": "#3498db",
+        "accent_hover": "#2980b9",
+        "accent_text": "white",
+        "disabled": "#bdc3c7",
+        "danger": "#e74c3c",
+        "danger_hover": "#c0392b",
+        "success": "#2ecc71",
+        "success_hover": "#27ae60",
+        "favorite": "#f1c40f",
+        "menu_bg": "#2c3e50",
+        "menu_text": "#ecf0f1",
+        "menu_hover": "#34495e",
+        "tab_bg": "#ecf0f1",
+        "groove": "#e0e0e0",
+        "groove_border": "#bdc3c7"
+    },
+    "暗色主题": {
+        "window_bg": "#1e272e",
+        "text": "#d2dae2",
+        "surface": "#2f3640",
+        "border": "#485460",
+        "border_light": "#3d4652",
+        "title": "#ecf0f1",
+        "muted": "#95a5a6",
+        "meaning": "#d2dae2",
+        "accent": "#3498db",
+        "accent_hover": "#2980b9",
+        "accent_text": "white",
+        "disabled": "#57606f",
+        "danger": "#e74c3c",
+        "danger_hover": "#c0392b",
+        "success": "#27ae60",
+        "success_hover": "#1e8449",
+        "favorite": "#d4ac0d",
+        "menu_bg": "#161c22",
+        "menu_text": "#ecf0f1",
+        "menu_hover": "#2f3640",
+        "tab_bg": "#232b33",
+        "groove": "#485460",
+        "groove_border": "#57606f"
+    },
+    "浅色主题": {
+        "window_bg": "#ffffff",
+        "text": "#2c3e50",
+        "surface": "#fafafa",
+        "border": "#e0e0e0",
+        "border_light": "#f0f0f0",
+        "title": "#2c3e50",
+        "muted": "#95a5a6",
+        "meaning": "#34495e",
+        "accent": "#5dade2",
+        "accent_hover": "#3498db",
+        "accent_text": "white",
+        "disabled": "#d5dbdb",
+        "danger": "#ec7063",
+        "danger_hover": "#e74c3c",
+        "success": "#58d68d",
+        "success_hover": "#2ecc71",
+        "favorite": "#f4d03f",
+        "menu_bg": "#ecf0f1",
+        "menu_text": "#2c3e50",
+        "menu_hover": "#d5dbdb",
+        "tab_bg": "#f4f6f6",
+        "groove": "#eaeded",
+        "groove_border": "#d5dbdb"
+    },
+    "高对比度主题": {
+        "window_bg": "#000000",
+        "text": "#ffffff",
+        "surface": "#000000",
+        "border": "#ffffff",
+        "border_light": "#808080",
+        "title": "#ffffff",
+        "muted": "#ffff00",
+        "meaning": "#ffffff",
+        "accent": "#ffff00",
+        "accent_hover": "#ffd700",
+        "accent_text": "#000000",
+        "disabled": "#808080",
+        "danger": "#ff0000",
+        "danger_hover": "#cc0000",
+        "success": "#00ff00",
+        "success_hover": "#00cc00",
+        "favorite": "#00ffff",
+        "menu_bg": "#000000",
+        "menu_text": "#ffffff",
+        "menu_hover": "#333333",
+        "tab_bg": "#1a1a1a",
+        "groove": "#333333",
+        "groove_border": "#ffffff"
+    }
+}
+
+# 窗口背景和文字颜色通过应用级调色板设置: 样式表中针对所有 QWidget 的规则
+# 会使每个部件都改用样式表绘制，创建和切换主题时开销很大
+_PALETTE_ROLES = [
+    (QPalette.Window, "window_bg"),
+    (QPalette.WindowText, "text"),
+    (QPalette.Base, "window_bg"),
+    (QPalette.AlternateBase, "surface"),
+    (QPalette.Text, "text"),
+    (QPalette.Button, "window_bg"),
+    (QPalette.ButtonText, "text"),
+    (QPalette.Highlight, "accent"),
+    (QPalette.HighlightedText, "accent_text"),
+    (QPalette.ToolTipBase, "surface"),
+    (QPalette.ToolTipText, "text"),
+    (QPalette.PlaceholderText, "muted")
+]
+
+# 样式表各部分，$ 开头的名称由调色板替换。
+# 合并为一个应用级样式表后，各页面的规则加上页面的对象名作为前缀，
+# 使其优先于应用级的通用规则（与原先页面级样式表覆盖主窗口样式表的效果相同）
+_SECTIONS = [
+    # 主窗口和所有窗口的通用规则
+    """
+    #menuWidget {
+        background-color: $menu_bg;
+        color: $menu_text;
+        border: none;
+    }
+    #appTitle {
+        color: $menu_text;
+        padding: 10px;
+    }
+    #menuList {
+        background-color: transparent;
+        color: $menu_text;
+        border: none;
+    }
+    #menuList::item {
+        padding: 10px;
+        border-radius: 5px;
+    }
+    #menuList::item:selected {
+        background-color: $menu_hover;
+    }
+    #menuList::item:hover {
+        background-color: $menu_hover;
+    }
+    QPushButton {
+        background-color: $accent;
+        color: $accent_text;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+    }
+    QPushButton:hover {
+        background-color: $accent_hover;
+    }
+    """,
+    # 首页
+    """
+    #homePage #welcomeLabel {
+        color: $title;
+        margin-bottom: 10px;
+    }
+    #homePage #descriptionLabel {
+        color: $muted;
+        margin-bottom: 20px;
+    }
+    #homePage #featureCard {
+        background-color: $surface;
+        border-radius: 10px;
+        padding: 15px;
+        min-height: 200px;
+    }
+    #homePage #cardTitle {
+        color: $title;
+        margin-bottom: 10px;
+    }
+    #homePage #cardDescription {
+        color: $muted;
+        margin-bottom: 15px;
+    }
+    #homePage #cardButton {
+        background-color: $accent;
+        color: $accent_text;
+        border: none;
+        border-radius: 5px;
+        padding: 10px;
+        font-size: 14px;
+    }
+    #homePage #cardButton:hover {
+        background-color: $accent_hover;
+    }
+    #homePage #statsFrame {
+        background-color: $surface;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    #homePage #statsTitle {
+        color: $title;
+        margin-bottom: 15px;
+    }
+    #homePage #statsCount {
+        color: $accent;
+        font-size: 24px;
+        font-weight: bold;
+    }
+    """,
+    # 单词本页面
+    """
+    #vocabularyPage #pageTitle {
+        color: $title;
+        margin-bottom: 20px;
+    }
+    #vocabularyPage #sectionTitle {
+        color: $title;
+        margin-bottom: 10px;
+    }
+    #vocabularyPage #vocabList, #vocabularyPage #wordList {
+        background-color: $surface;
+        border-radius: 5px;
+        padding: 5px;
+        border: 1px solid $border;
+    }
+    #vocabularyPage #searchEdit {
+        background-color: $surface;
+        border: 1px solid $border;
+        border-radius: 5px;
+        padding: 6px;
+    }
+    #vocabularyPage #fuzzyHint {
+        color: $muted;
+    }
+    #vocabularyPage #vocabList::item, #vocabularyPage #wordList::item {
+        padding: 8px;
+        border-bottom: 1px solid $border_light;
+    }
+    #vocabularyPage #vocabList::item:selected, #vocabularyPage #wordList::item:selected {
+        background-color: $accent;
+        color: $accent_text;
+    }
+    #vocabularyPage QPushButton {
+        background-color: $accent;
+        color: $accent_text;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    #vocabularyPage QPushButton:hover {
+        background-color: $accent_hover;
+    }
+    #vocabularyPage QPushButton:disabled {
+        background-color: $disabled;
+    }
+    #vocabularyPage QTabWidget::pane {
+        border: 1px solid $border;
+        border-radius: 5px;
+        background-color: $surface;
+    }
+    #vocabularyPage QTabBar::tab {
+        background-color: $tab_bg;
+        padding: 8px 12px;
+        margin-right: 2px;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+    }
+    #vocabularyPage QTabBar::tab:selected {
+        background-color: $surface;
+        border: 1px solid $border;
+        border-bottom: none;
+    }
+    """,
+    # 设置页面
+    """
+    #settingsPage #pageTitle {
+        color: $title;
+        margin-bottom: 20px;
+    }
+    #settingsPage #noteLabel {
+        color: $muted;
+        font-style: italic;
+    }
+    #settingsPage QGroupBox {
+        font-weight: bold;
+        border: 1px solid $groove_border;
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+    }
+    #settingsPage QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 3px;
+    }
+    #settingsPage QSlider::groove:horizontal {
+        border: 1px solid $groove_border;
+        height: 8px;
+        background: $groove;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    #settingsPage QSlider::handle:horizontal {
+        background: $accent;
+        border: 1px solid $accent_hover;
+        width: 18px;
+        height: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+    #settingsPage QPushButton {
+        background-color: $accent;
+        color: $accent_text;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    #settingsPage QPushButton:hover {
+        background-color: $accent_hover;
+    }
+    #settingsPage #resetBtn {
+        background-color: $danger;
+    }
+    #settingsPage #resetBtn:hover {
+        background-color: $danger_hover;
+    }
+    """,
+    # 悬浮窗
+    """
+    #floatingWindow QWidget {
+        font-family: Arial;
+    }
+    #floatingWindow #titleBar {
+        background-color: $menu_bg;
+        color: $menu_text;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+    }
+    #floatingWindow #titleLabel {
+        color: $menu_text;
+        font-weight: bold;
+    }
+    #floatingWindow #pinButton, #floatingWindow #modeButton, #floatingWindow #closeButton {
+        background-color: transparent;
+        color: $menu_text;
+        border: none;
+        padding: 2px;
+        font-size: 14px;
+    }
+    #floatingWindow #pinButton:hover, #floatingWindow #modeButton:hover, #floatingWindow #closeButton:hover {
+        background-color: rgba(255, 255, 255, 0.2);
+        border-radius: 3px;
+    }
+    #floatingWindow #closeButton:hover {
+        background-color: $danger;
+    }
+    #floatingWindow #contentFrame {
+        background-color: $surface;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    #floatingWindow #wordLabel {
+        color: $title;
+        font-size: 24px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    #floatingWindow #meaningLabel {
+        color: $meaning;
+        font-size: 16px;
+        margin-bottom: 15px;
+    }
+    #floatingWindow #exampleLabel {
+        color: $muted;
+        font-size: 13px;
+        font-style: italic;
+    }
+    #floatingWindow QPushButton {
+        background-color: $accent;
+        color: $accent_text;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    #floatingWindow QPushButton:hover {
+        background-color: $accent_hover;
+    }
+    #floatingWindow #knowButton {
+        background-color: $success;
+    }
+    #floatingWindow #knowButton:hover {
+        background-color: $success_hover;
+    }
+    #floatingWindow #dontKnowButton {
+        background-color: $danger;
+    }
+    #floatingWindow #dontKnowButton:hover {
+        background-color: $danger_hover;
+    }
+    #floatingWindow #favoriteButton:checked {
+        background-color: $favorite;
+    }
+    """
+]
+
+# 已生成的样式表和调色板: 主题名称 -> 样式表 / QPalette
+_stylesheets = {}
+_palettes = {}
+
+# 当前应用的主题
+_current_theme = None
+
+
+def build_stylesheet(theme):
+    """生成主题的应用级样式表，每个主题只生成一次（未知主题使用默认主题）"""
+    if theme not in THEMES:
+        theme = DEFAULT_THEME
+    stylesheet = _stylesheets.get(theme)
+    if stylesheet is None:
+        palette = THEMES[theme]
+        stylesheet = "".join(Template(section).substitute(palette) for section in _SECTIONS)
+        _stylesheets[theme] = stylesheet
+    return stylesheet
+
+
+def build_palette(theme):
+    """生成主题的应用级调色板，每个主题只生成一次（未知主题使用默认主题）"""
+    if theme not in THEMES:
+        theme = DEFAULT_THEME
+    palette = _palettes.get(theme)
+    if palette is None:
+        colors = THEMES[theme]
+        palette = QPalette()
+        for role, name in _PALETTE_ROLES:
+            palette.setColor(role, QColor(colors[name]))
+        _palettes[theme] = palette
+    return palette
+
+
+def apply_theme(theme, app=None):
+    """
+    在应用级别应用主题，所有窗口和页面共用同一个样式表，切换主题时只重新应用一次样式
+    
+    Args:
+        theme (str): 主题名称，即配置中的 appearance.theme
+        app (QApplication, optional): 应用程序. Defaults to None，即当前应用程序.
+    
+    Returns:
+        bool: 主题与当前主题相同而未重新应用时返回 False
+    """
+    if theme not in THEMES:
+        theme = DEFAULT_THEME
+    global _current_theme
+    if theme == _current_theme:
+        return False
+    
+    app = app or QApplication.instance()
+    app.setPalette(build_palette(theme))
+    app.setStyleSheet(build_stylesheet(theme))
+    _current_theme = theme
+    return True
\ No newline at end of file
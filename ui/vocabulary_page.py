@@ -1,24 +1,41 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-                             QFrame, QScrollArea, QListWidget, QListWidgetItem,
-                             QFileDialog, QMessageBox, QTabWidget, QSplitter)
-from PySide6.QtCore import Qt, Signal as pyqtSignal
+                             QFrame, QScrollArea, QListWidget, QListWidgetItem, QListView,
+                             QFileDialog, QMessageBox, QTabWidget, QSplitter, QProgressDialog, QLineEdit)
+from PySide6.QtCore import Qt, Signal as pyqtSignal, QThreadPool
 from PySide6.QtGui import QFont, QIcon
 import os
 import json
+import datetime
+from ui.import_worker import ImportWorker
+from ui.index_worker import FuzzyIndexWorker
+from ui.word_list_model import WordListModel
 
 class VocabularyPage(QWidget):
     """单词本页面，用于管理单词本和查看单词列表"""
     
+    # 自定义信号
+    warm_audio_requested = pyqtSignal(str)  # 请求生成单词本的发音缓存，参数为单词本路径
+    vocabulary_changed = pyqtSignal(str)    # 单词本内容已变化（可能来自工作线程），参数为单词本路径
+    
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
+        self.setObjectName("vocabularyPage")  # 应用级样式表中本页面规则的前缀
         self.config_manager = config_manager
         
         # 当前选中的单词本
         self.current_vocabulary = None
         
-        # 单词本列表（示例数据，实际应从配置加载）
+        # 单词本列表
         self.vocabularies = []
         
+        # 正在执行的导入任务
+        self.import_worker = None
+        self.import_progress = None
+        
+        # 正在建立模糊查找索引的任务，以及建立失败的单词本（不再重试）
+        self.fuzzy_index_worker = None
+        self.fuzzy_index_failed = set()
+        
         self.init_ui()
         self.setup_connections()
         self.load_vocabularies()
@@ -81,28 +98,38 @@ class VocabularyPage(QWidget):
         self.word_list_title.setFont(QFont("Arial", 14, QFont.Bold))
         word_list_layout.addWidget(self.word_list_title)
         
+        # 搜索框
+        self.search_edit = QLineEdit()
+        self.search_edit.setObjectName("searchEdit")
+        self.search_edit.setPlaceholderText("搜索单词或中文释义")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setEnabled(False)
+        word_list_layout.addWidget(self.search_edit)
+        
+        # 模糊查找提示
+        self.fuzzy_hint_label = QLabel()
+        self.fuzzy_hint_label.setObjectName("fuzzyHint")
+        self.fuzzy_hint_label.setWordWrap(True)
+        self.fuzzy_hint_label.hide()
+        word_list_layout.addWidget(self.fuzzy_hint_label)
+        
         # 创建选项卡部件
         self.tabs = QTabWidget()
         
         # 全部单词选项卡
-        self.all_words_tab = QListWidget()
-        self.all_words_tab.setObjectName("wordList")
+        self.all_words_tab = self.create_word_view()
         
         # 已学单词选项卡
-        self.learned_words_tab = QListWidget()
-        self.learned_words_tab.setObjectName("wordList")
+        self.learned_words_tab = self.create_word_view("learned")
         
         # 未学单词选项卡
-        self.unlearned_words_tab = QListWidget()
-        self.unlearned_words_tab.setObjectName("wordList")
+        self.unlearned_words_tab = self.create_word_view("unlearned")
         
         # 跳过单词选项卡
-        self.skipped_words_tab = QListWidget()
-        self.skipped_words_tab.setObjectName("wordList")
+        self.skipped_words_tab = self.create_word_view("skipped")
         
         # 今日任务选项卡
-        self.today_words_tab = QListWidget()
-        self.today_words_tab.setObjectName("wordList")
+        self.today_words_tab = self.create_word_view()
         
         # 将选项卡添加到选项卡部件
         self.tabs.addTab(self.all_words_tab, "全部单词")
@@ -124,8 +151,14 @@ class VocabularyPage(QWidget):
         self.start_review_btn.setObjectName("startReviewBtn")
         self.start_review_btn.setEnabled(False)  # 初始禁用
         
+        self.warm_audio_btn = QPushButton("生成发音缓存")
+        self.warm_audio_btn.setObjectName("warmAudioBtn")
+        self.warm_audio_btn.setToolTip("预先合成单词本中所有单词的发音，学习时朗读无需等待")
+        self.warm_audio_btn.setEnabled(False)  # 初始禁用
+        
         word_buttons_layout.addWidget(self.start_learning_btn)
         word_buttons_layout.addWidget(self.start_review_btn)
+        word_buttons_layout.addWidget(self.warm_audio_btn)
         
         word_list_layout.addLayout(word_buttons_layout)
         
@@ -138,14 +171,30 @@ class VocabularyPage(QWidget):
         
         main_layout.addWidget(splitter)
         
-        # 设置样式表
-        self.set_stylesheet()
+    
+    def create_word_view(self, status=None):
+        """创建单词列表视图，status 不为 None 时只显示该学习状态的单词"""
+        # 每个选项卡有自己的单词ID列表，只分批加载本选项卡的单词
+        model = WordListModel(status, self)
+        
+        view = QListView()
+        view.setObjectName("wordList")
+        view.setUniformItemSizes(True)
+        view.setModel(model)
+        return view
+    
+    def word_models(self):
+        """获取所有选项卡的单词模型"""
+        return [self.tabs.widget(i).model() for i in range(self.tabs.count())]
     
     def setup_connections(self):
         """设置信号连接"""
         # 单词本列表选择变化
         self.vocab_list.currentItemChanged.connect(self.on_vocabulary_selected)
         
+        # 搜索框输入变化
+        self.search_edit.textChanged.connect(self.on_search_text_changed)
+        
         # 单词本操作按钮
         self.import_vocab_btn.clicked.connect(self.import_vocabulary)
         self.delete_vocab_btn.clicked.connect(self.delete_vocabulary)
@@ -153,16 +202,16 @@ class VocabularyPage(QWidget):
         # 单词操作按钮
         self.start_learning_btn.clicked.connect(self.start_learning)
         self.start_review_btn.clicked.connect(self.start_review)
+        self.warm_audio_btn.clicked.connect(self.warm_audio_cache)
+        
+        # 单词本文件变化后重新加载单词列表，排队到界面线程处理
+        self.vocabulary_changed.connect(self.on_vocabulary_changed, Qt.QueuedConnection)
+        self.config_manager.word_manager.add_vocabulary_listener(self.vocabulary_changed.emit)
     
     def load_vocabularies(self):
         """加载单词本列表"""
-        # 在实际应用中，应从配置文件或数据库加载单词本列表
-        # 这里使用示例数据
-        self.vocabularies = [
-            {"name": "CET-4 核心词汇", "path": "data/cet4.json", "count": 2200},
-            {"name": "CET-6 核心词汇", "path": "data/cet6.json", "count": 2500},
-            {"name": "TOEFL 核心词汇", "path": "data/toefl.json", "count": 5000},
-        ]
+        # 从配置加载单词本列表
+        self.vocabularies = list(self.config_manager.word_manager.get_vocabularies())
         
         # 更新单词本列表
         self.update_vocabulary_list()
@@ -192,6 +241,8 @@ class VocabularyPage(QWidget):
             self.delete_vocab_btn.setEnabled(True)
             self.start_learning_btn.setEnabled(True)
             self.start_review_btn.setEnabled(True)
+            self.warm_audio_btn.setEnabled(True)
+            self.search_edit.setEnabled(True)
         else:
             self.current_vocabulary = None
             self.word_list_title.setText("单词列表")
@@ -203,89 +254,196 @@ class VocabularyPage(QWidget):
             self.delete_vocab_btn.setEnabled(False)
             self.start_learning_btn.setEnabled(False)
             self.start_review_btn.setEnabled(False)
+            self.warm_audio_btn.setEnabled(False)
+            self.search_edit.setEnabled(False)
     
     def load_word_list(self):
         """加载单词列表"""
-        # 清空所有选项卡
-        self.clear_word_lists()
-        
-        # 在实际应用中，应从文件或数据库加载单词列表
-        # 这里使用示例数据
-        words = [
-            {"word": "apple", "meaning": "n. 苹果", "status": "learned"},
-            {"word": "banana", "meaning": "n. 香蕉", "status": "unlearned"},
-            {"word": "orange", "meaning": "n. 橙子; adj. 橙色的", "status": "learned"},
-            {"word": "grape", "meaning": "n. 葡萄", "status": "skipped"},
-            {"word": "watermelon", "meaning": "n. 西瓜", "status": "unlearned"},
-        ]
-        
-        # 更新各选项卡
-        for word in words:
-            # 添加到全部单词选项卡
-            self.add_word_to_list(self.all_words_tab, word)
-            
-            # 根据状态添加到相应选项卡
-            if word["status"] == "learned":
-                self.add_word_to_list(self.learned_words_tab, word)
-            elif word["status"] == "unlearned":
-                self.add_word_to_list(self.unlearned_words_tab, word)
-            elif word["status"] == "skipped":
-                self.add_word_to_list(self.skipped_words_tab, word)
-            
-            # 添加到今日任务（示例：所有未学单词）
-            if word["status"] == "unlearned":
-                self.add_word_to_list(self.today_words_tab, word)
+        # 切换单词本时清空搜索
+        self.search_edit.blockSignals(True)
+        self.search_edit.clear()
+        self.search_edit.blockSignals(False)
+        self.fuzzy_hint_label.hide()
+        
+        self.update_word_models()
+    
+    def update_word_models(self):
+        """按当前单词本的单词存储重建各选项卡的单词ID列表"""
+        store = self.config_manager.word_manager.get_word_store(self.current_vocabulary['path'])
+        for model in self.word_models():
+            if model is not self.today_words_tab.model():
+                model.set_store(store)
+        
+        # 今日任务: 今天到期的复习单词和每日目标数量的未学单词
+        end_of_today = datetime.datetime.combine(datetime.date.today(), datetime.time.max).timestamp()
+        daily_goal = self.config_manager.config['general']['daily_goal']
+        today_ids = store.due_ids(end_of_today).tolist() + store.ids_by_status("unlearned")[:daily_goal].tolist()
+        self.today_words_tab.model().set_store(store, today_ids)
+    
+    def on_vocabulary_changed(self, vocab_path):
+        """单词本内容变化事件处理，当前单词本新增或删除单词后重建单词列表"""
+        if self.current_vocabulary is not None and self.current_vocabulary['path'] == vocab_path:
+            self.refresh_word_lists()
+    
+    def refresh_word_lists(self):
+        """按最新的单词和复习策略重建当前单词本的单词列表，保留搜索"""
+        if self.current_vocabulary is None:
+            return
+        
+        self.update_word_models()
+        if self.search_edit.text().strip():
+            self.on_search_text_changed(self.search_edit.text())
+    
+    def on_search_text_changed(self, text):
+        """搜索框输入变化事件处理"""
+        if self.current_vocabulary is None:
+            return
+        
+        self.fuzzy_hint_label.hide()
+        query = text.strip()
+        if not query:
+            for model in self.word_models():
+                model.set_filter_ids(None)
+            return
+        
+        index = self.config_manager.word_manager.get_search_index(self.current_vocabulary['path'])
+        word_ids = index.search(query)
+        if len(word_ids) == 0:
+            # 没有匹配的单词时查找拼写相近的单词
+            word_ids = self.fuzzy_search(query)
+        for model in self.word_models():
+            model.set_filter_ids(word_ids)
+    
+    def fuzzy_search(self, query):
+        """
+        在已建立模糊查找索引的单词本中查找拼写相近的单词，返回当前单词本中的单词ID，其他单词本中的单词显示在提示中
+        
+        尚未建立索引的单词本在线程池中建立，完成后重新查找
+        """
+        word_manager = self.config_manager.word_manager
+        current_path = self.current_vocabulary['path']
+        names = {vocab['path']: vocab['name'] for vocab in self.vocabularies}
+        
+        word_ids = []
+        others = []
+        for distance, vocab_path, word_id in word_manager.fuzzy_lookup(query):
+            if vocab_path == current_path:
+                word_ids.append(word_id)
+            else:
+                word = word_manager.get_cached_fuzzy_index(vocab_path).store.words[word_id]
+                others.append(f"{word}（{names.get(vocab_path, '')}）")
+        
+        missing = [vocab['path'] for vocab in self.vocabularies
+                   if vocab['path'] not in self.fuzzy_index_failed
+                   and word_manager.get_cached_fuzzy_index(vocab['path']) is None]
+        if missing:
+            self.build_fuzzy_indexes(missing)
+        
+        if word_ids:
+            hint = "没有完全匹配的单词，以下是拼写相近的单词"
+        else:
+            hint = "没有找到匹配的单词"
+        if others:
+            hint += "\n其他单词本中拼写相近的单词: " + "、".join(others)
+        if missing:
+            hint += "\n正在建立拼写索引，完成后显示更多拼写相近的单词..."
+        self.fuzzy_hint_label.setText(hint)
+        self.fuzzy_hint_label.show()
+        return word_ids
+    
+    def build_fuzzy_indexes(self, vocab_paths):
+        """在线程池中建立单词本的模糊查找索引"""
+        if self.fuzzy_index_worker is not None:
+            return
+        
+        self.fuzzy_index_worker = FuzzyIndexWorker(self.config_manager.word_manager, vocab_paths)
+        self.fuzzy_index_worker.signals.failed.connect(self.fuzzy_index_failed.add)
+        self.fuzzy_index_worker.signals.finished.connect(self.on_fuzzy_indexes_ready)
+        QThreadPool.globalInstance().start(self.fuzzy_index_worker)
     
-    def add_word_to_list(self, list_widget, word):
-        """将单词添加到列表部件"""
-        item = QListWidgetItem(f"{word['word']} - {word['meaning']}")
-        item.setData(Qt.UserRole, word)  # 存储单词数据
-        list_widget.addItem(item)
+    def on_fuzzy_indexes_ready(self):
+        """模糊查找索引建立完成事件处理，仍在搜索时重新查找并显示提示"""
+        self.fuzzy_index_worker = None
+        if self.current_vocabulary is not None and self.search_edit.text().strip():
+            self.on_search_text_changed(self.search_edit.text())
     
     def clear_word_lists(self):
         """清空所有单词列表"""
-        self.all_words_tab.clear()
-        self.learned_words_tab.clear()
-        self.unlearned_words_tab.clear()
-        self.skipped_words_tab.clear()
-        self.today_words_tab.clear()
+        for model in self.word_models():
+            model.set_store(None)
     
     def import_vocabulary(self):
         """导入单词本"""
+        if self.import_worker is not None:
+            return
+        
         # 打开文件对话框
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "导入单词本",
             "",
-            "JSON Files (*.json);;Text Files (*.txt);;All Files (*)"
+            "Vocabulary Files (*.json *.csv *.tsv *.txt);;JSON Files (*.json);;CSV Files (*.csv *.tsv);;Text Files (*.txt);;All Files (*)"
         )
         
         if file_path:
-            try:
-                # 在实际应用中，应解析文件并导入单词
-                # 这里简单地添加到单词本列表
-                file_name = os.path.basename(file_path)
-                name, _ = os.path.splitext(file_name)
-                
-                # 创建新单词本
-                new_vocab = {
-                    "name": name,
-                    "path": file_path,
-                    "count": 100  # 示例数量
-                }
-                
-                # 添加到单词本列表
-                self.vocabularies.append(new_vocab)
-                
-                # 更新单词本列表
-                self.update_vocabulary_list()
-                
-                # 选中新导入的单词本
-                self.vocab_list.setCurrentRow(len(self.vocabularies) - 1)
-                
-                QMessageBox.information(self, "导入成功", f"成功导入单词本：{name}")
-            except Exception as e:
-                QMessageBox.critical(self, "导入失败", f"导入单词本失败：{str(e)}")
+            # 显示进度对话框
+            self.import_progress = QProgressDialog(f"正在导入 {os.path.basename(file_path)}...", "取消", 0, 100, self)
+            self.import_progress.setWindowTitle("导入单词本")
+            self.import_progress.setWindowModality(Qt.WindowModal)
+            self.import_progress.setMinimumDuration(300)
+            self.import_progress.setAutoClose(False)
+            self.import_progress.setAutoReset(False)
+            self.import_progress.setValue(0)
+            
+            # 在线程池中解析文件
+            self.import_worker = ImportWorker(
+                file_path,
+                self.config_manager.vocabularies_dir,
+                self.config_manager.config['general']['storage_compression']
+            )
+            self.import_worker.signals.progress.connect(self.import_progress.setValue)
+            self.import_worker.signals.finished.connect(self.on_import_finished)
+            self.import_worker.signals.failed.connect(self.on_import_failed)
+            self.import_worker.signals.cancelled.connect(self.on_import_cancelled)
+            self.import_progress.canceled.connect(self.import_worker.cancel)
+            self.import_vocab_btn.setEnabled(False)
+            
+            QThreadPool.globalInstance().start(self.import_worker)
+    
+    def on_import_finished(self, vocabulary):
+        """导入完成事件处理"""
+        self.finish_import()
+        
+        # 添加到单词本列表并保存到配置
+        self.vocabularies.append(vocabulary)
+        self.config_manager.word_manager.add_vocabulary(vocabulary)
+        
+        # 更新单词本列表
+        self.update_vocabulary_list()
+        
+        # 选中新导入的单词本
+        self.vocab_list.setCurrentRow(len(self.vocabularies) - 1)
+        
+        QMessageBox.information(self, "导入成功", f"成功导入单词本：{vocabulary['name']}（{vocabulary['count']}词）")
+    
+    def on_import_failed(self, error):
+        """导入失败事件处理"""
+        self.finish_import()
+        QMessageBox.critical(self, "导入失败", f"导入单词本失败：{error}")
+    
+    def on_import_cancelled(self):
+        """导入取消事件处理"""
+        self.finish_import()
+    
+    def finish_import(self):
+        """结束导入任务，关闭进度对话框"""
+        if self.import_progress is not None:
+            self.import_progress.canceled.disconnect()
+            self.import_progress.close()
+            self.import_progress.deleteLater()
+            self.import_progress = None
+        self.import_worker = None
+        self.import_vocab_btn.setEnabled(True)
     
     def delete_vocabulary(self):
         """删除单词本"""
@@ -308,6 +466,7 @@ class VocabularyPage(QWidget):
             # 从列表中删除
             if 0 <= current_index < len(self.vocabularies):
                 del self.vocabularies[current_index]
+                self.config_manager.word_manager.remove_vocabulary(current_index)
                 
                 # 更新单词本列表
                 self.update_vocabulary_list()
@@ -325,6 +484,8 @@ class VocabularyPage(QWidget):
                     self.delete_vocab_btn.setEnabled(False)
                     self.start_learning_btn.setEnabled(False)
                     self.start_review_btn.setEnabled(False)
+                    self.warm_audio_btn.setEnabled(False)
+                    self.search_edit.setEnabled(False)
     
     def start_learning(self):
         """开始学习"""
@@ -350,70 +511,8 @@ class VocabularyPage(QWidget):
             f"开始复习单词本：{self.current_vocabulary['name']}"
         )
     
-    def set_stylesheet(self):
-        """设置样式表"""
-        self.setStyleSheet("""
-            #pageTitle {
-                color: #2c3e50;
-                margin-bottom: 20px;
-            }
-            
-            #sectionTitle {
-                color: #2c3e50;
-                margin-bottom: 10px;
-            }
-            
-            #vocabList, #wordList {
-                background-color: white;
-                border-radius: 5px;
-                padding: 5px;
-                border: 1px solid #ddd;
-            }
-            
-            #vocabList::item, #wordList::item {
-                padding: 8px;
-                border-bottom: 1px solid #eee;
-            }
-            
-            #vocabList::item:selected, #wordList::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-            
-            QTabBar::tab {
-                background-color: #ecf0f1;
-                padding: 8px 12px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-bottom: none;
-            }
-        """)
\ No newline at end of file
+    def warm_audio_cache(self):
+        """生成当前单词本的发音缓存"""
+        if self.current_vocabulary is None:
+            return
+        self.warm_audio_requested.emit(self.current_vocabulary['path'])
\ No newline at end of file
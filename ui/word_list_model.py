@@ -0,0 +1,116 @@
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from models.word_store import WordStore
+
+class WordListModel(QAbstractListModel):
+    """单词列表模型，直接读取 WordStore，滚动到底部时才分批加载行"""
+    
+    # 每次加载的行数
+    FETCH_BATCH_SIZE = 200
+    
+    # 自定义数据角色
+    WordIdRole = Qt.UserRole + 1   # 单词在 WordStore 中的ID
+    StatusRole = Qt.UserRole + 2   # 学习状态
+    
+    def __init__(self, status=None, parent=None):
+        """
+        初始化单词列表模型
+        
+        Args:
+            status (str, optional): 只显示该学习状态的单词. Defaults to None，即显示全部单词.
+            parent (QObject, optional): 父对象. Defaults to None.
+        """
+        super().__init__(parent)
+        self.status = status
+        self.store = None
+        # 本列表的全部单词ID（不含已删除的单词）
+        self._all_ids = np.zeros(0, dtype=np.int64)
+        # 各行对应的单词ID，搜索时为搜索结果
+        self._word_ids = self._all_ids
+        # 已加载的行数
+        self._loaded = 0
+    
+    def set_store(self, store, word_ids=None):
+        """
+        设置单词存储，为 None 时清空列表
+        
+        Args:
+            store (WordStore): 单词存储
+            word_ids (array-like, optional): 按顺序显示的单词ID（如今日任务）. Defaults to None，
+                即按学习状态从单词存储中查询.
+        """
+        self.beginResetModel()
+        self.store = store
+        if store is None:
+            self._all_ids = np.zeros(0, dtype=np.int64)
+        else:
+            if word_ids is not None:
+                ids = np.asarray(word_ids, dtype=np.int64)
+            elif self.status is not None:
+                ids = store.ids_by_status(self.status)
+            else:
+                ids = np.arange(len(store), dtype=np.int64)
+            self._all_ids = ids[store.status[ids] != WordStore.REMOVED]
+        self._word_ids = self._all_ids
+        self._loaded = 0
+        self.endResetModel()
+    
+    def set_filter_ids(self, word_ids):
+        """只按顺序显示给定ID中属于本列表的单词（如搜索结果），为 None 时显示本列表的全部单词"""
+        self.beginResetModel()
+        if word_ids is None:
+            self._word_ids = self._all_ids
+        else:
+            word_ids = np.asarray(word_ids, dtype=np.int64)
+            self._word_ids = word_ids[np.isin(word_ids, self._all_ids)]
+        self._loaded = 0
+        self.endResetModel()
+    
+    def word_id(self, row):
+        """获取行对应的单词ID"""
+        return int(self._word_ids[row])
+    
+    def total_count(self):
+        """获取单词总数（包括尚未加载的行）"""
+        return len(self._word_ids)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._word_ids)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH_SIZE, len(self._word_ids) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._loaded:
+            return None
+        
+        word_id = self.word_id(index.row())
+        if role == Qt.DisplayRole:
+            return f"{self.store.words[word_id]} - {self.store.meanings[word_id]}"
+        elif role == Qt.UserRole:
+            view = self.store[word_id]
+            return {"word": view.word, "meaning": view.meaning, "status": view.status}
+        elif role == self.WordIdRole:
+            return word_id
+        elif role == self.StatusRole:
+            return WordStore.STATUSES[self.store.status[word_id]]
+        return None
+    
+    def refresh(self):
+        """学习状态变化后通知视图刷新已加载的行"""
+        if self._loaded > 0:
+            self.dataChanged.emit(self.index(0), self.index(self._loaded - 1))
\ No newline at end of file
@@ -0,0 +1,185 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def detect_audio_format(path):
+    """根据文件头判断音频格式，返回 'wav' 或 'aiff'，无法识别时返回 None"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(12)
+    except OSError:
+        return None
+    if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+        return 'wav'
+    if head[:4] == b'FORM' and head[8:12] in (b'AIFF', b'AIFC'):
+        return 'aiff'
+    return None
+
+
+class AudioCache:
+    """发音音频缓存类，按单词、语音和语速将合成的音频保存到磁盘，超出磁盘预算时按LRU淘汰"""
+    
+    # 音频文件扩展名: 界面用 QSoundEffect 播放，只支持WAV，
+    # pyttsx3 save_to_file 的输出格式取决于驱动（macOS 的 nsss 驱动输出AIFF），合成后按文件头检查
+    EXTENSION = '.wav'
+    
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        
+        # 文件名 -> 文件大小，按最近使用排序（最近使用时间通过文件修改时间持久化）
+        self._entries = OrderedDict()
+        
+        # 朗读线程和界面线程都会访问缓存
+        self._lock = threading.Lock()
+        
+        # 统计计数
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        # TTS引擎输出的音频格式是否可以播放，输出其他格式时为 False，调用方应改为直接朗读
+        self.render_supported = True
+        
+        self._scan()
+    
+    def _scan(self):
+        """扫描缓存目录，按修改时间恢复LRU顺序"""
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(self.EXTENSION):
+                stat = entry.stat()
+                files.append((stat.st_mtime_ns, entry.name, stat.st_size))
+            elif entry.name.endswith('.tmp'):
+                # 上次合成中断留下的临时文件
+                self._remove(entry.path)
+        
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self.total_bytes += size
+        self._evict()
+    
+    @staticmethod
+    def _remove(path):
+        """删除文件，忽略错误"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def clip_path(self, word, voice, rate):
+        """获取单词音频的缓存文件路径（无论是否已缓存）"""
+        key = f"{voice}\x1f{rate}\x1f{word}".encode('utf-8')
+        return os.path.join(self.cache_dir, hashlib.blake2b(key, digest_size=16).hexdigest() + self.EXTENSION)
+    
+    def get(self, word, voice, rate):
+        """获取已缓存的单词音频文件路径，未缓存时返回 None"""
+        path = self.clip_path(word, voice, rate)
+        name = os.path.basename(path)
+        with self._lock:
+            if name not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+        
+        try:
+            os.utime(path)
+        except OSError:
+            # 文件已被外部删除
+            with self._lock:
+                self._discard(name)
+            return None
+        return path
+    
+    def contains(self, word, voice, rate):
+        """判断单词音频是否已缓存（不更新最近使用时间）"""
+        with self._lock:
+            return os.path.basename(self.clip_path(word, voice, rate)) in self._entries
+    
+    def _add(self, path):
+        """登记新合成的音频文件，返回文件大小"""
+        name = os.path.basename(path)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return 0
+        
+        with self._lock:
+            self._discard(name)
+            self._entries[name] = size
+            self.total_bytes += size
+            self._evict()
+        return size
+    
+    def _discard(self, name):
+        """移除缓存条目（调用方持有锁）"""
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self.total_bytes -= size
+    
+    def _evict(self):
+        """按LRU淘汰音频文件直到不超出磁盘预算（调用方持有锁或在初始化中）"""
+        while self.total_bytes > self.max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            self._remove(os.path.join(self.cache_dir, name))
+    
+    def render(self, engine, words, voice, rate):
+        """
+        使用TTS引擎合成尚未缓存的单词音频并放入缓存，必须在创建引擎的线程中调用
+        
+        Args:
+            engine: pyttsx3 引擎
+            words (iterable): 单词，一次提交给引擎合成
+            voice (str): 引擎当前的语音ID
+            rate (int): 引擎当前的语速
+        
+        Returns:
+            tuple: (新合成的音频数量, 总字节数)
+        """
+        clips = [(word, self.clip_path(word, voice, rate)) for word in dict.fromkeys(words)
+                 if word and not self.contains(word, voice, rate)]
+        if not clips:
+            return 0, 0
+        
+        # 先写入临时文件，合成完成后再放入缓存，避免播放不完整的音频
+        for word, path in clips:
+            engine.save_to_file(word, path + '.tmp')
+        engine.runAndWait()
+        
+        rendered = 0
+        rendered_bytes = 0
+        for word, path in clips:
+            temp_path = path + '.tmp'
+            audio_format = detect_audio_format(temp_path)
+            if audio_format == 'wav':
+                os.replace(temp_path, path)
+                rendered += 1
+                rendered_bytes += self._add(path)
+            else:
+                if audio_format is not None:
+                    # 驱动输出了无法播放的格式，之后的合成结果也一样
+                    print(f"TTS引擎输出的音频格式无法播放: {audio_format}")
+                    self.render_supported = False
+                self._remove(temp_path)
+        return rendered, rendered_bytes
+    
+    def get_stats(self):
+        """获取缓存统计信息"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'total_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
\ No newline at end of file
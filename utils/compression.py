@@ -0,0 +1,52 @@
+import gzip
+import lzma
+
+# 支持的压缩格式
+COMPRESSIONS = ('none', 'gzip', 'lzma')
+
+GZIP_MAGIC = b'\x1f\x8b'
+LZMA_MAGIC = b'\xfd7zXZ\x00'
+
+# 压缩级别: lzma 高级别压缩速度很慢而压缩率提升有限
+GZIP_LEVEL = 6
+LZMA_PRESET = 1
+
+
+def detect_compression(path):
+    """根据文件开头的魔数判断压缩格式"""
+    with open(path, 'rb') as f:
+        head = f.read(len(LZMA_MAGIC))
+    if head.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(LZMA_MAGIC):
+        return 'lzma'
+    return 'none'
+
+
+def open_text(path, encoding='utf-8-sig'):
+    """打开文本文件用于读取，压缩文件边读取边解压"""
+    compression = detect_compression(path)
+    if compression == 'gzip':
+        return gzip.open(path, 'rt', encoding=encoding)
+    if compression == 'lzma':
+        return lzma.open(path, 'rt', encoding=encoding)
+    return open(path, 'r', encoding=encoding)
+
+
+def open_text_writer(path, compression='none', encoding='utf-8'):
+    """打开文本文件用于写入，按 compression 压缩"""
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding=encoding, compresslevel=GZIP_LEVEL)
+    if compression == 'lzma':
+        return lzma.open(path, 'wt', encoding=encoding, preset=LZMA_PRESET)
+    return open(path, 'w', encoding=encoding)
+
+
+def compress_bytes(data, compression='none'):
+    """按 compression 压缩字节数据"""
+    if compression == 'gzip':
+        # 固定时间戳，使相同内容的压缩结果相同
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == 'lzma':
+        return lzma.compress(data, preset=LZMA_PRESET)
+    return data
\ No newline at end of file
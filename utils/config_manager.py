@@ -1,13 +1,18 @@
 import os
 import json
+import threading
 from .word_manager import WordManager
+from .sqlite_word_manager import SQLiteWordManager
+from .config_writer import ConfigWriter
+from .compression import open_text
+from .audio_cache import AudioCache
 
 class ConfigManager:
     """配置管理器类，负责加载、保存和管理应用程序的配置"""
     
-    def __init__(self):
-        # 配置文件路径
-        self.config_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
+    def __init__(self, config_dir=None):
+        # 配置文件路径，默认为程序目录下的 config 目录
+        self.config_dir = config_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
         self.config_file = os.path.join(self.config_dir, 'config.json')
         self.vocabularies_dir = os.path.join(self.config_dir, 'vocabularies')
         self.data_dir = os.path.join(self.config_dir, 'data')
@@ -22,6 +27,17 @@ class ConfigManager:
                 'daily_goal': 20,
                 'auto_start_float': False,
                 'auto_save': True,
+                'journal_mode': True,  # 以追加日志方式保存学习记录
+                'journal_compact_threshold': 200,  # 日志事件达到该数量时合并到配置文件
+                'storage_backend': 'json',  # 存储引擎: json 或 sqlite
+                'vocabulary_cache_mb': 64,  # 单词本缓存的内存预算（MB）
+                'save_delay_ms': 500,  # 合并保存请求的等待时间（毫秒）
+                'storage_compression': 'none',  # 单词本和配置文件的压缩格式: none、gzip 或 lzma
+                'fuzzy_max_distance': 2,  # 模糊查找允许的最大编辑距离
+                'fuzzy_limit': 10,  # 模糊查找最多返回的单词数
+                'prewarm_pages': True,  # 启动后在空闲时预先创建其他页面
+                'audio_cache_mb': 128,  # 单词发音缓存的磁盘预算（MB）
+                'session_lookahead': 30,  # 悬浮窗在后台预先准备的后续单词数
                 'data_path': self.data_dir
             },
             # 外观设置
@@ -52,6 +68,7 @@ class ConfigManager:
             # 学习记录
             'learning_records': {
                 'last_study_date': None,
+                'journal_seq': 0,  # 已合并到配置文件的最后一条日志序号
                 'daily_records': {}
             }
         }
@@ -62,8 +79,29 @@ class ConfigManager:
         # 加载配置
         self.load_config()
         
+        # 配置锁: 修改配置的代码与后台写入线程通过该锁同步
+        self.lock = threading.RLock()
+        
+        # 后台配置写入器
+        self.writer = ConfigWriter(
+            self.config_file,
+            self._serialize_config,
+            self.lock,
+            delay=self.config['general']['save_delay_ms'] / 1000,
+            compression=lambda: self.config['general']['storage_compression']
+        )
+        
         # 初始化单词管理器
-        self.word_manager = WordManager(self)
+        if self.config['general']['storage_backend'] == 'sqlite':
+            self.word_manager = SQLiteWordManager(self)
+        else:
+            self.word_manager = WordManager(self)
+        
+        # 单词发音缓存
+        self.audio_cache = AudioCache(
+            os.path.join(self.data_dir, 'audio_cache'),
+            self.config['general']['audio_cache_mb'] * 1024 * 1024
+        )
     
     def _ensure_dirs_exist(self):
         """确保必要的目录存在"""
@@ -75,7 +113,7 @@ class ConfigManager:
         """加载配置"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
+                with open_text(self.config_file) as f:
                     loaded_config = json.load(f)
                 
                 # 更新配置，保留默认值
@@ -83,25 +121,34 @@ class ConfigManager:
             except Exception as e:
                 print(f"加载配置文件失败: {e}")
     
-    def save_config(self):
-        """保存配置"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=4)
-            return True
-        except Exception as e:
-            print(f"保存配置文件失败: {e}")
-            return False
+    def _serialize_config(self):
+        """序列化配置，压缩保存时不缩进"""
+        if self.config['general']['storage_compression'] == 'none':
+            return json.dumps(self.config, ensure_ascii=False, indent=4)
+        return json.dumps(self.config, ensure_ascii=False, separators=(',', ':'))
+    
+    def save_config(self, sync=False):
+        """保存配置，默认在后台线程中合并写入，sync 为 True 时立即写入"""
+        if sync:
+            return self.writer.flush()
+        self.writer.schedule()
+        return True
     
     def _update_dict(self, target, source):
         """递归更新字典，保留默认值"""
         for key, value in source.items():
             if key in target:
-                if isinstance(value, dict) and isinstance(target[key], dict):
+                # 默认值为空字典的项（如每日学习记录）是自由键值映射，整体替换
+                if isinstance(value, dict) and isinstance(target[key], dict) and target[key]:
                     self._update_dict(target[key], value)
                 else:
                     target[key] = value
     
+    def close(self):
+        """关闭配置管理器，保存所有未写入的数据"""
+        self.word_manager.close()
+        self.writer.close()
+    
     def get_setting(self, section, key=None):
         """获取设置值"""
         if section in self.config:
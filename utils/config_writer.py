@@ -0,0 +1,104 @@
+import os
+import time
+import threading
+from .compression import compress_bytes
+
+class ConfigWriter:
+    """配置写入器类，在后台线程中合并短时间内的多次保存请求并原子地写入文件"""
+    
+    def __init__(self, config_file, serialize, lock, delay=0.5, max_delay=5.0, compression=None):
+        self.config_file = config_file
+        # 序列化函数，在持有 lock 时调用，返回要写入的文本
+        self._serialize = serialize
+        self._lock = lock
+        # 返回压缩格式的函数，为 None 时不压缩
+        self._compression = compression
+        
+        # 最后一次保存请求后等待的时间，以及首次请求后最长等待的时间（秒）
+        self.delay = delay
+        self.max_delay = max_delay
+        
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = False
+        self._first_request_time = 0
+        self._last_request_time = 0
+        self._closed = False
+        
+        # 最后一次写入的内容，内容未变化时跳过写入
+        self._last_content = None
+        
+        self._thread = threading.Thread(target=self._run, name='ConfigWriter', daemon=True)
+        self._thread.start()
+    
+    def schedule(self):
+        """请求在后台保存配置"""
+        with self._condition:
+            now = time.monotonic()
+            if not self._pending:
+                self._pending = True
+                self._first_request_time = now
+            self._last_request_time = now
+            self._condition.notify()
+    
+    def flush(self):
+        """立即在当前线程保存配置"""
+        with self._condition:
+            self._pending = False
+        return self._write()
+    
+    def close(self):
+        """停止后台线程并写入未保存的配置"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        return self.flush()
+    
+    def _run(self):
+        """后台线程: 等待保存请求，合并后写入"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                
+                # 等待请求平息，但不超过最长等待时间
+                while self._pending and not self._closed:
+                    now = time.monotonic()
+                    deadline = min(self._last_request_time + self.delay,
+                                   self._first_request_time + self.max_delay)
+                    if now >= deadline:
+                        break
+                    self._condition.wait(deadline - now)
+                
+                if not self._pending or self._closed:
+                    continue
+                self._pending = False
+            
+            self._write()
+    
+    def _write(self):
+        """序列化配置并通过临时文件原子地写入"""
+        with self._write_lock:
+            try:
+                with self._lock:
+                    content = self._serialize()
+                    compression = self._compression() if self._compression is not None else 'none'
+                
+                if (compression, content) == self._last_content:
+                    return True
+                
+                temp_file = self.config_file + '.tmp'
+                with open(temp_file, 'wb') as f:
+                    f.write(compress_bytes(content.encode('utf-8'), compression))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+                
+                self._last_content = (compression, content)
+                return True
+            except Exception as e:
+                print(f"保存配置文件失败: {e}")
+                return False
\ No newline at end of file
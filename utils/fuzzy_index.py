@@ -0,0 +1,249 @@
+import numpy as np
+from models.word_store import WordStore
+
+# 批量计算时用 uint64 保存模式串各位置的状态，更长的查询逐个计算
+MAX_PATTERN_LENGTH = 64
+
+# 双字组编码为 前一个字符编码 * CODE_BASE + 后一个字符编码，字符编码不超过 Unicode 码位数
+CODE_BASE = 1 << 21
+
+
+def levenshtein(a, b, max_distance=None):
+    """计算两个字符串的编辑距离（Myers 位并行算法），超过 max_distance 时返回大于 max_distance 的值"""
+    m = len(a)
+    if m == 0:
+        return len(b)
+    
+    # 各字符在 a 中出现位置的位掩码
+    peq = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(b)
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        # 每个剩余字符最多使距离减1
+        if max_distance is not None and score - remaining > max_distance:
+            return score - remaining
+        ph = (ph << 1) | 1
+        pv = ((mh << 1) | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    return score
+
+
+class FuzzyIndex:
+    """
+    单词本模糊查找索引，用于查找拼写有误的单词：
+    按首尾填充后的双字组建立倒排索引，编辑距离不超过 d 的单词至少包含查询中 (双字组数 - 2d) 个不同的双字组，
+    据此和单词长度筛选出候选单词后，再用位并行算法批量计算编辑距离
+    """
+    
+    def __init__(self, store, normalize=str.casefold):
+        """
+        为单词存储构建模糊查找索引
+        
+        Args:
+            store (WordStore): 单词存储
+            normalize (function, optional): 单词规范化函数，查询使用同样的规范化. Defaults to str.casefold.
+        """
+        self.store = store
+        self.normalize = normalize
+        self._word_ids = np.flatnonzero(store.status[:len(store)] != WordStore.REMOVED)
+        self._keys = [normalize(store.words[word_id]) for word_id in self._word_ids.tolist()]
+        count = len(self._keys)
+        
+        # 所有单词的字符编码连续保存，第 i 个单词为 _codes[_starts[i]:_starts[i] + _lengths[i]]，编码 0 保留为填充字符
+        self._lengths = np.fromiter(map(len, self._keys), dtype=np.int64, count=count)
+        self._starts = np.zeros(count, dtype=np.int64)
+        np.cumsum(self._lengths[:-1], out=self._starts[1:])
+        ords = np.frombuffer(''.join(self._keys).encode('utf-32-le'), dtype=np.uint32)
+        alphabet = np.flatnonzero(np.bincount(ords)) if len(ords) else np.zeros(0, dtype=np.int64)
+        self._char_codes = {chr(o): code for code, o in enumerate(alphabet.tolist(), 1)}
+        lookup = np.zeros(int(alphabet[-1]) + 1 if len(alphabet) else 1, dtype=np.int64)
+        lookup[alphabet] = np.arange(1, len(alphabet) + 1)
+        self._codes = lookup[ords]
+        
+        # 每个单词前加填充字符，最后再加一个，相邻两个编码组成双字组
+        padded = np.zeros(len(self._codes) + count + 1, dtype=np.int64)
+        padded[np.arange(len(self._codes)) + np.repeat(np.arange(1, count + 1), self._lengths)] = self._codes
+        grams = padded[:-1] * CODE_BASE + padded[1:]
+        gram_rows = np.repeat(np.arange(count, dtype=np.int32), self._lengths + 1)
+        
+        # 双字组的倒排索引，所有倒排列表连续保存在一个数组中:
+        # 第 k 个双字组为 _gram_keys[k]，包含它的单词下标（升序）为 _posting_rows[_posting_offsets[k]:_posting_offsets[k + 1]]
+        order = np.argsort(grams, kind='stable')
+        grams = grams[order]
+        gram_rows = gram_rows[order]
+        # 同一单词中重复的双字组只保留一次
+        keep = np.ones(len(grams), dtype=bool)
+        keep[1:] = (grams[1:] != grams[:-1]) | (gram_rows[1:] != gram_rows[:-1])
+        grams = grams[keep]
+        self._posting_rows = gram_rows[keep]
+        
+        starts = np.flatnonzero(np.diff(grams)) + 1
+        starts = np.concatenate([[0], starts]) if len(grams) else starts
+        self._gram_keys = grams[starts]
+        self._posting_offsets = np.append(starts, len(grams)).astype(np.int64)
+        
+        # 建立索引后新增的单词: 双字组 -> 单词下标列表，查询时与上面的倒排列表合并
+        self._added_postings = {}
+        # 单词下标是否有效，删除的单词标记为 False
+        self._alive = np.ones(count, dtype=bool)
+    
+    def __len__(self):
+        return int(np.count_nonzero(self._alive))
+    
+    def add(self, word_ids):
+        """
+        将单词存储中新增的单词加入索引
+        
+        Args:
+            word_ids (list): 新增的单词ID
+        """
+        if not word_ids:
+            return
+        
+        row = len(self._keys)
+        codes = []
+        for word_id in word_ids:
+            key = self.normalize(self.store.words[word_id])
+            word_codes = [self._char_codes.setdefault(char, len(self._char_codes) + 1) for char in key]
+            padded = [0] + word_codes + [0]
+            for gram in set(zip(padded, padded[1:])):
+                self._added_postings.setdefault(gram[0] * CODE_BASE + gram[1], []).append(row)
+            self._keys.append(key)
+            codes.extend(word_codes)
+            row += 1
+        
+        lengths = np.fromiter((len(key) for key in self._keys[-len(word_ids):]), dtype=np.int64, count=len(word_ids))
+        starts = len(self._codes) + np.concatenate([[0], np.cumsum(lengths[:-1])]).astype(np.int64)
+        self._word_ids = np.concatenate([self._word_ids, np.asarray(word_ids, dtype=self._word_ids.dtype)])
+        self._lengths = np.concatenate([self._lengths, lengths])
+        self._starts = np.concatenate([self._starts, starts])
+        self._codes = np.concatenate([self._codes, np.asarray(codes, dtype=np.int64)])
+        self._alive = np.concatenate([self._alive, np.ones(len(word_ids), dtype=bool)])
+    
+    def remove(self, word_ids):
+        """
+        从索引中删除单词，单词下标保留并标记为无效，查询时跳过
+        
+        Args:
+            word_ids (list): 已删除的单词ID
+        """
+        if word_ids:
+            self._alive[np.isin(self._word_ids, np.asarray(word_ids, dtype=np.int64))] = False
+    
+    def _encode(self, query):
+        """将查询编码为字符编码列表，单词中没有的字符编码为负数（不同字符编码不同）"""
+        unknown = {}
+        return [self._char_codes.get(char) or unknown.setdefault(char, -len(unknown) - 1) for char in query]
+    
+    def _candidates(self, codes, max_distance):
+        """根据双字组数量和单词长度筛选可能满足编辑距离的单词下标"""
+        length_ok = (np.abs(self._lengths - len(codes)) <= max_distance) & self._alive
+        
+        padded = [0] + codes + [0]
+        grams = set(zip(padded, padded[1:]))
+        threshold = len(grams) - 2 * max_distance
+        if threshold <= 0:
+            # 查询太短，双字组无法筛选
+            return np.flatnonzero(length_ok)
+        
+        # 包含单词中没有的字符的双字组不会命中任何单词，但仍计入双字组数
+        keys = np.asarray(sorted(a * CODE_BASE + b for a, b in grams if a >= 0 and b >= 0), dtype=np.int64)
+        positions = np.searchsorted(self._gram_keys, keys)
+        positions = positions[positions < len(self._gram_keys)]
+        positions = positions[np.isin(self._gram_keys[positions], keys)]
+        added = [key for key in keys.tolist() if key in self._added_postings]
+        if len(set(self._gram_keys[positions].tolist()).union(added)) < threshold:
+            return np.zeros(0, dtype=np.int64)
+        
+        # 同一单词的双字组只在其中一处出现: 建立索引时的单词在倒排列表中，之后新增的单词在 _added_postings 中
+        rows = np.concatenate([self._posting_rows[self._posting_offsets[k]:self._posting_offsets[k + 1]]
+                               for k in positions.tolist()]
+                              + [np.asarray(self._added_postings[key], dtype=np.int64) for key in added])
+        counts = np.bincount(rows, minlength=len(self._keys))
+        return np.flatnonzero((counts >= threshold) & length_ok)
+    
+    def _distances(self, query, codes, rows):
+        """批量计算查询与各候选单词的编辑距离（Myers 位并行算法，每个字符位置对所有候选单词做一次向量运算）"""
+        if len(codes) > MAX_PATTERN_LENGTH:
+            return np.asarray([levenshtein(query, self._keys[row]) for row in rows.tolist()], dtype=np.int64)
+        
+        # 各字符在查询中出现位置的位掩码
+        peq = np.zeros(len(self._char_codes) + 1, dtype=np.uint64)
+        for i, code in enumerate(codes):
+            if code > 0:
+                peq[code] |= np.uint64(1 << i)
+        m = len(codes)
+        mask = np.uint64((1 << m) - 1)
+        last = np.uint64(1 << (m - 1))
+        one = np.uint64(1)
+        
+        # 按长度降序排列，第 j 个字符位置只需计算长度大于 j 的前 active 个单词
+        order = np.argsort(-self._lengths[rows], kind='stable')
+        lengths = self._lengths[rows][order]
+        starts = self._starts[rows][order]
+        n = len(rows)
+        pv = np.full(n, mask, dtype=np.uint64)
+        mv = np.zeros(n, dtype=np.uint64)
+        scores = np.full(n, m, dtype=np.int64)
+        for j in range(int(lengths[0]) if n else 0):
+            active = int(np.searchsorted(-lengths, -j, side='left'))
+            p = pv[:active]
+            v = mv[:active]
+            eq = peq[self._codes[starts[:active] + j]]
+            xv = eq | v
+            xh = (((eq & p) + p) ^ p) | eq
+            ph = v | ~(xh | p)
+            mh = p & xh
+            scores[:active] += (ph & last) != 0
+            scores[:active] -= (mh & last) != 0
+            ph = (ph << one) | one
+            pv[:active] = ((mh << one) | ~(xv | ph)) & mask
+            mv[:active] = ph & xv & mask
+        
+        distances = np.empty(n, dtype=np.int64)
+        distances[order] = scores
+        return distances
+    
+    def search(self, query, max_distance=2, limit=None):
+        """
+        查找与 query 的编辑距离不超过 max_distance 的单词
+        
+        Args:
+            query (str): 查询文本
+            max_distance (int, optional): 最大编辑距离. Defaults to 2.
+            limit (int, optional): 最多返回的数量. Defaults to None.
+        
+        Returns:
+            tuple: (单词ID数组, 编辑距离数组)，按编辑距离、长度差和单词ID排序
+        """
+        query = self.normalize(query)
+        if not query or not len(self):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        
+        codes = self._encode(query)
+        rows = self._candidates(codes, max_distance)
+        distances = self._distances(query, codes, rows)
+        matched = distances <= max_distance
+        rows = rows[matched]
+        distances = distances[matched]
+        
+        # 编辑距离相同时长度接近的单词在前
+        order = np.lexsort((rows, np.abs(self._lengths[rows] - len(codes)), distances))[:limit]
+        return self._word_ids[rows[order]], distances[order]
\ No newline at end of file
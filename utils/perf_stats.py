@@ -0,0 +1,45 @@
+import time
+from collections import deque
+
+class FrameStats:
+    """帧时间统计类，记录最近若干帧的间隔和每帧耗时（毫秒）"""
+    
+    def __init__(self, capacity=240):
+        # 最近若干帧距上一帧的间隔和本帧的耗时
+        self.intervals = deque(maxlen=capacity)
+        self.durations = deque(maxlen=capacity)
+        self._last_start = None
+    
+    def reset(self):
+        """清空统计，下一帧不计算间隔"""
+        self.intervals.clear()
+        self.durations.clear()
+        self._last_start = None
+    
+    def frame(self, start, end=None):
+        """
+        记录一帧
+        
+        Args:
+            start (float): 本帧开始时间（time.perf_counter）
+            end (float, optional): 本帧结束时间. Defaults to None，即当前时间.
+        """
+        if end is None:
+            end = time.perf_counter()
+        if self._last_start is not None:
+            self.intervals.append((start - self._last_start) * 1000)
+        self.durations.append((end - start) * 1000)
+        self._last_start = start
+    
+    def get_stats(self):
+        """获取帧时间统计信息"""
+        intervals = sorted(self.intervals)
+        durations = self.durations
+        return {
+            'frames': len(durations),
+            'mean_interval_ms': sum(intervals) / len(intervals) if intervals else 0.0,
+            'p95_interval_ms': intervals[int(len(intervals) * 0.95)] if intervals else 0.0,
+            'max_interval_ms': intervals[-1] if intervals else 0.0,
+            'mean_duration_ms': sum(durations) / len(durations) if durations else 0.0,
+            'max_duration_ms': max(durations) if durations else 0.0
+        }
\ No newline at end of file
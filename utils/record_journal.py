@@ -0,0 +1,66 @@
+import os
+import json
+
+class RecordJournal:
+    """学习记录日志类，以追加方式保存学习事件，避免每次答题都重写整个配置文件"""
+    
+    def __init__(self, journal_file):
+        self.journal_file = journal_file
+        self._file = None
+        
+        # 自上次压缩以来写入的事件数
+        self.event_count = 0
+    
+    def append(self, event):
+        """追加一条学习事件，每条事件占一行紧凑JSON"""
+        try:
+            if self._file is None:
+                self._file = open(self.journal_file, 'a', encoding='utf-8')
+            self._file.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._file.flush()
+            self.event_count += 1
+            return True
+        except Exception as e:
+            print(f"写入学习记录日志失败: {e}")
+            return False
+    
+    def read_events(self):
+        """读取日志中的全部学习事件"""
+        events = []
+        if not os.path.exists(self.journal_file):
+            return events
+        
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        # 程序异常退出时最后一行可能写入不完整，直接忽略
+                        print(f"忽略损坏的学习记录日志行: {line[:50]}")
+        except Exception as e:
+            print(f"读取学习记录日志失败: {e}")
+        
+        self.event_count = len(events)
+        return events
+    
+    def clear(self):
+        """清空日志（在日志内容已合并到配置文件后调用）"""
+        self.close()
+        try:
+            with open(self.journal_file, 'w', encoding='utf-8'):
+                pass
+            self.event_count = 0
+            return True
+        except Exception as e:
+            print(f"清空学习记录日志失败: {e}")
+            return False
+    
+    def close(self):
+        """关闭日志文件"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
\ No newline at end of file
@@ -0,0 +1,51 @@
+import heapq
+
+class ReviewQueue:
+    """复习队列类，按下次复习时间维护单词的最小堆"""
+    
+    def __init__(self):
+        # 堆中元素: (下次复习时间, word_id)，过期元素延迟删除
+        self._heap = []
+        # 当前有效的下次复习时间: word_id -> next_review_time
+        self._due_times = {}
+    
+    def __len__(self):
+        return len(self._due_times)
+    
+    def __contains__(self, word_id):
+        return word_id in self._due_times
+    
+    def schedule(self, word_id, next_review_time):
+        """安排（或重新安排）单词的下次复习时间"""
+        if next_review_time is None:
+            self.remove(word_id)
+            return
+        
+        self._due_times[word_id] = next_review_time
+        heapq.heappush(self._heap, (next_review_time, word_id))
+        
+        # 过期元素过多时重建堆
+        if len(self._heap) > 2 * len(self._due_times) + 64:
+            self._heap = [(due, wid) for wid, due in self._due_times.items()]
+            heapq.heapify(self._heap)
+    
+    def remove(self, word_id):
+        """从队列中移除单词"""
+        self._due_times.pop(word_id, None)
+    
+    def get_due(self, now):
+        """获取所有到期的单词（按到期时间排序），到期单词在处理前一直保留在队列中"""
+        due = []
+        seen = set()
+        while self._heap and self._heap[0][0] <= now:
+            next_review_time, word_id = heapq.heappop(self._heap)
+            # 跳过已被移除、重新安排或重复的过期元素
+            if self._due_times.get(word_id) == next_review_time and word_id not in seen:
+                seen.add(word_id)
+                due.append((next_review_time, word_id))
+        
+        # 放回堆中，直到单词被复习或移除
+        for item in due:
+            heapq.heappush(self._heap, item)
+        
+        return [word_id for next_review_time, word_id in due]
\ No newline at end of file
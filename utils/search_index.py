@@ -0,0 +1,205 @@
+import re
+import bisect
+import numpy as np
+from models.word_store import WordStore
+
+# 连续的汉字
+_CJK_RUN = re.compile('[\u3400-\u9fff\uf900-\ufaff]+')
+
+
+class SearchIndex:
+    """
+    单词本搜索索引类：按单词前缀查找使用排序后的单词数组和二分查找，
+    按中文释义查找使用单字和双字倒排索引
+    """
+    
+    def __init__(self, store):
+        """
+        为单词存储构建搜索索引
+        
+        Args:
+            store (WordStore): 单词存储
+        """
+        self.store = store
+        word_ids = np.flatnonzero(store.status[:len(store)] != WordStore.REMOVED)
+        
+        # 按小写单词排序的单词和对应的单词ID
+        keys = [store.words[word_id].casefold() for word_id in word_ids.tolist()]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_words = [keys[i] for i in order]
+        self._sorted_ids = word_ids[np.asarray(order, dtype=np.int64)] if order else word_ids
+        
+        # 释义中的汉字单字和双字的倒排索引，所有倒排列表连续保存在一个数组中:
+        # 编号为 code 的字的单词ID（升序）为 _posting_ids[_posting_offsets[code]:_posting_offsets[code + 1]]
+        self._gram_codes = {}
+        codes = []
+        ids = []
+        for word_id in word_ids.tolist():
+            for gram in self._grams(store.meanings[word_id]):
+                codes.append(self._gram_codes.setdefault(gram, len(self._gram_codes)))
+                ids.append(word_id)
+        codes = np.asarray(codes, dtype=np.int64)
+        self._posting_ids = np.asarray(ids, dtype=np.int32)[np.argsort(codes, kind='stable')]
+        self._posting_offsets = np.zeros(len(self._gram_codes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(self._gram_codes)), out=self._posting_offsets[1:])
+        
+        # 建立索引后新增或修改的单词: 字 -> 单词ID集合，查询时与上面的倒排列表合并
+        self._added_postings = {}
+        
+        # 上一次释义查询的结果，输入追加字符时在其基础上筛选
+        self._last_query = None
+        self._last_meaning_ids = None
+    
+    @staticmethod
+    def _grams(text):
+        """提取文本中的汉字单字和相邻两个汉字（去重）"""
+        grams = set()
+        for run in _CJK_RUN.findall(str(text)):
+            grams.update(run)
+            grams.update(run[i:i + 2] for i in range(len(run) - 1))
+        return grams
+    
+    def _posting(self, gram):
+        """获取包含该字的单词ID数组，不存在时返回 None"""
+        code = self._gram_codes.get(gram)
+        ids = None if code is None else self._posting_ids[self._posting_offsets[code]:self._posting_offsets[code + 1]]
+        added = self._added_postings.get(gram)
+        if added:
+            added = np.fromiter(added, dtype=np.int64, count=len(added))
+            ids = np.unique(added) if ids is None else np.union1d(ids, added)
+        return ids
+    
+    def _add_postings(self, word_ids):
+        """将单词释义中的字加入倒排索引"""
+        for word_id in word_ids:
+            for gram in self._grams(self.store.meanings[word_id]):
+                self._added_postings.setdefault(gram, set()).add(word_id)
+    
+    def add(self, word_ids):
+        """
+        将单词存储中新增的单词加入索引
+        
+        Args:
+            word_ids (list): 新增的单词ID
+        """
+        for word_id in word_ids:
+            key = self.store.words[word_id].casefold()
+            # 新增的单词ID比已有的都大，放在相同单词之后，与重新构建的顺序一致
+            position = bisect.bisect_right(self._sorted_words, key)
+            self._sorted_words.insert(position, key)
+            self._sorted_ids = np.insert(self._sorted_ids, position, word_id)
+        self._add_postings(word_ids)
+        self._last_query = None
+    
+    def update(self, word_ids):
+        """
+        更新释义变化的单词
+        
+        旧释义的倒排列表不删除，查询时会确认释义中确实包含查询文本
+        
+        Args:
+            word_ids (list): 释义变化的单词ID
+        """
+        self._add_postings(word_ids)
+        self._last_query = None
+    
+    def remove(self, word_ids):
+        """
+        从索引中删除单词存储中已删除的单词
+        
+        已删除的单词在单词存储中标记为 WordStore.REMOVED 并清空释义，倒排列表中的单词ID在查询时过滤
+        
+        Args:
+            word_ids (list): 已删除的单词ID
+        """
+        for word_id in word_ids:
+            key = self.store.words[word_id].casefold()
+            start = bisect.bisect_left(self._sorted_words, key)
+            end = bisect.bisect_right(self._sorted_words, key, start)
+            for position in np.flatnonzero(self._sorted_ids[start:end] == word_id).tolist():
+                del self._sorted_words[start + position]
+                self._sorted_ids = np.delete(self._sorted_ids, start + position)
+                break
+        self._last_query = None
+    
+    def search_prefix(self, prefix):
+        """
+        查找以 prefix 开头的单词（不区分大小写）
+        
+        Args:
+            prefix (str): 单词前缀
+        
+        Returns:
+            numpy.ndarray: 单词ID数组，按单词排序
+        """
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(self._sorted_words, prefix)
+        end = bisect.bisect_left(self._sorted_words, prefix + '\U0010ffff', start)
+        return self._sorted_ids[start:end]
+    
+    def search_meaning(self, query):
+        """
+        查找释义中包含 query 的单词，query 需包含汉字
+        
+        Args:
+            query (str): 查询文本
+        
+        Returns:
+            numpy.ndarray: 单词ID数组（升序）
+        """
+        query = query.casefold()
+        if query == self._last_query:
+            return self._last_meaning_ids
+        
+        if self._last_query and query.startswith(self._last_query):
+            # 输入追加了字符，结果只会是上一次结果的子集
+            candidates = self._last_meaning_ids
+        else:
+            grams = self._grams(query)
+            if not grams:
+                return np.zeros(0, dtype=np.int64)
+            
+            # 从最短的倒排列表开始求交集
+            lists = sorted((self._posting(gram) for gram in grams),
+                           key=lambda ids: -1 if ids is None else len(ids))
+            if lists[0] is None:
+                candidates = np.zeros(0, dtype=np.int64)
+            else:
+                candidates = lists[0]
+                for ids in lists[1:]:
+                    candidates = np.intersect1d(candidates, ids, assume_unique=True)
+                    if len(candidates) == 0:
+                        break
+        
+        # 倒排索引只能保证各个字都出现，需要确认连续出现（同时排除已删除和释义已修改的单词）
+        meanings = self.store.meanings
+        status = self.store.status
+        result = np.asarray([word_id for word_id in candidates.tolist()
+                             if status[word_id] != WordStore.REMOVED and query in str(meanings[word_id]).casefold()],
+                            dtype=np.int64)
+        
+        self._last_query = query
+        self._last_meaning_ids = result
+        return result
+    
+    def search(self, query):
+        """
+        搜索单词：先按单词前缀匹配，查询包含汉字时再按释义匹配
+        
+        Args:
+            query (str): 查询文本
+        
+        Returns:
+            numpy.ndarray: 单词ID数组，前缀匹配的单词在前
+        """
+        query = query.strip()
+        if not query:
+            return np.zeros(0, dtype=np.int64)
+        
+        result = self.search_prefix(query)
+        if _CJK_RUN.search(query):
+            meaning_ids = self.search_meaning(query)
+            if len(result) == 0:
+                return meaning_ids
+            result = np.concatenate([result, meaning_ids[~np.isin(meaning_ids, result)]])
+        return result
\ No newline at end of file
@@ -0,0 +1,430 @@
+import os
+import json
+import sqlite3
+import threading
+import datetime
+from .word_manager import WordManager
+from .vocab_stream import iter_vocabulary_entries
+from .vocab_diff import file_hash
+from .vocab_binary import COMPILED_EXTENSION
+
+class SQLiteWordManager(WordManager):
+    """基于SQLite的单词管理器，单词、每日记录和单词状态保存在带索引的数据表中"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS vocabularies (
+            path TEXT PRIMARY KEY,
+            name TEXT,
+            mtime REAL,
+            size INTEGER,
+            content_hash TEXT
+        );
+        CREATE TABLE IF NOT EXISTS words (
+            id INTEGER PRIMARY KEY,
+            vocab_path TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            word TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_words_vocab_position ON words (vocab_path, position);
+        CREATE INDEX IF NOT EXISTS idx_words_vocab_word ON words (vocab_path, word);
+        CREATE TABLE IF NOT EXISTS daily_records (
+            date TEXT PRIMARY KEY,
+            new_words INTEGER NOT NULL DEFAULT 0,
+            review_words INTEGER NOT NULL DEFAULT 0,
+            test_words INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS record_words (
+            date TEXT NOT NULL,
+            word_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            PRIMARY KEY (date, word_id)
+        );
+        CREATE TABLE IF NOT EXISTS word_state (
+            word_id TEXT PRIMARY KEY,
+            vocab_path TEXT NOT NULL,
+            word TEXT NOT NULL,
+            status TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            study_days INTEGER NOT NULL DEFAULT 1,
+            next_review_time REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_word_state_status ON word_state (vocab_path, status);
+        CREATE INDEX IF NOT EXISTS idx_word_state_time ON word_state (vocab_path, timestamp);
+    """
+    
+    # 单词状态 s 对应的单词行: 单词本中重复出现的单词与 word_id 一样只对应第一次出现的位置
+    FIRST_WORD_ROW_SQL = """(SELECT id FROM words
+                              WHERE vocab_path = s.vocab_path AND word = s.word
+                              ORDER BY position LIMIT 1)"""
+    
+    def __init__(self, config_manager, db_path=None):
+        # 初始化共享的缓存和索引，并重放JSON存储尚未合并的学习记录日志，使首次迁移包含全部记录
+        super().__init__(config_manager)
+        self.db_path = db_path or os.path.join(config_manager.data_dir, 'vocabwindow.db')
+        
+        is_new_db = not os.path.exists(self.db_path)
+        
+        self.conn = sqlite3.connect(self.db_path)
+        self._owner_thread = threading.get_ident()
+        
+        # 工作线程（如学习会话供词线程）使用的只读连接，WAL模式下读取不会阻塞写入
+        self._thread_local = threading.local()
+        self._reader_conns = []
+        self._reader_lock = threading.Lock()
+        
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+        self._upgrade_schema()
+        
+        # 首次创建数据库时从JSON数据迁移
+        if is_new_db:
+            self.migrate_from_json()
+    
+    def _build_word_state_index(self):
+        """单词最新状态保存在 word_state 表中，不需要内存索引"""
+        self._word_state_index = {}
+    
+    def _upgrade_schema(self):
+        """为旧版本数据库补充复习调度字段"""
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(word_state)')]
+        if 'study_days' not in columns:
+            with self.conn:
+                self.conn.execute('ALTER TABLE word_state ADD COLUMN study_days INTEGER NOT NULL DEFAULT 1')
+                self.conn.execute('ALTER TABLE word_state ADD COLUMN next_review_time REAL')
+                self.conn.execute(
+                    """UPDATE word_state SET study_days =
+                       (SELECT COUNT(*) FROM record_words r WHERE r.word_id = word_state.word_id)"""
+                )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_word_state_due ON word_state (vocab_path, next_review_time)')
+        
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(vocabularies)')]
+        if 'content_hash' not in columns:
+            with self.conn:
+                self.conn.execute('ALTER TABLE vocabularies ADD COLUMN content_hash TEXT')
+    
+    def migrate_from_json(self):
+        """将config.json中的学习记录和已添加的单词本一次性迁移到数据库"""
+        for vocabulary in self.config['vocabularies']:
+            if 'path' in vocabulary:
+                self._sync_vocabulary(vocabulary['path'])
+        
+        with self.conn:
+            daily_records = self.config['learning_records']['daily_records']
+            for date, record in daily_records.items():
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO daily_records (date, new_words, review_words, test_words) VALUES (?, ?, ?, ?)',
+                    (date, record.get('new_words', 0), record.get('review_words', 0), record.get('test_words', 0))
+                )
+                for word_id, word_record in record['words'].items():
+                    self._insert_record_word(date, word_id, word_record['status'], word_record['timestamp'])
+            
+            last_study_date = self.config['learning_records']['last_study_date']
+            if last_study_date is not None:
+                self._set_meta('last_study_date', last_study_date)
+    
+    def _import_vocabulary(self, vocab_path, content_hash=None):
+        """将JSON单词本流式导入数据库"""
+        self.conn.execute('DELETE FROM words WHERE vocab_path = ?', (vocab_path,))
+        self.conn.executemany(
+            'INSERT INTO words (vocab_path, position, word, data) VALUES (?, ?, ?, ?)',
+            ((vocab_path, position, entry['word'], json.dumps(entry, ensure_ascii=False))
+             for position, entry in enumerate(iter_vocabulary_entries(vocab_path)))
+        )
+        self._save_vocabulary_info(vocab_path, content_hash)
+    
+    def _update_vocabulary(self, vocab_path, content_hash=None):
+        """
+        单词本文件变化后，按单词比较文件与数据库中的条目，只写入新增、修改（含位置变化）和删除的行
+        
+        Returns:
+            list: 文件中的单词条目列表
+        """
+        words = list(iter_vocabulary_entries(vocab_path))
+        
+        # 单词 -> 数据库中的行 [(id, position, data)]，同一单词可能出现多次
+        existing = {}
+        for row_id, word, position, data in self.conn.execute(
+                'SELECT id, word, position, data FROM words WHERE vocab_path = ? ORDER BY position', (vocab_path,)):
+            existing.setdefault(word, []).append((row_id, position, data))
+        
+        inserts = []
+        updates = []
+        for position, entry in enumerate(words):
+            data = json.dumps(entry, ensure_ascii=False)
+            rows = existing.get(entry['word'])
+            if rows:
+                row_id, old_position, old_data = rows.pop(0)
+                if old_position != position or old_data != data:
+                    updates.append((position, data, row_id))
+            else:
+                inserts.append((vocab_path, position, entry['word'], data))
+        deletes = [(row[0],) for rows in existing.values() for row in rows]
+        
+        self.conn.executemany('DELETE FROM words WHERE id = ?', deletes)
+        self.conn.executemany('UPDATE words SET position = ?, data = ? WHERE id = ?', updates)
+        self.conn.executemany('INSERT INTO words (vocab_path, position, word, data) VALUES (?, ?, ?, ?)', inserts)
+        self._save_vocabulary_info(vocab_path, content_hash)
+        return words
+    
+    def _save_vocabulary_info(self, vocab_path, content_hash):
+        """记录单词本的名称、文件信息和内容哈希"""
+        name = next((vocabulary.get('name') for vocabulary in self.config['vocabularies']
+                     if vocabulary.get('path') == vocab_path), None)
+        stat = os.stat(vocab_path)
+        self.conn.execute(
+            'INSERT OR REPLACE INTO vocabularies (path, name, mtime, size, content_hash) VALUES (?, ?, ?, ?, ?)',
+            (vocab_path, name, stat.st_mtime, stat.st_size, content_hash)
+        )
+    
+    def _sync_vocabulary(self, vocab_path):
+        """确保数据库中的单词本与文件一致，文件内容变化时增量更新"""
+        with self._index_lock:
+            if not os.path.exists(vocab_path):
+                return
+            
+            stat = os.stat(vocab_path)
+            row = self.conn.execute(
+                'SELECT mtime, size, content_hash FROM vocabularies WHERE path = ?', (vocab_path,)
+            ).fetchone()
+            if row is not None and row[0] == stat.st_mtime and row[1] == stat.st_size:
+                return
+            
+            try:
+                content_hash = file_hash(vocab_path)
+                words = None
+                with self.conn:
+                    if row is None:
+                        self._import_vocabulary(vocab_path, content_hash)
+                    elif row[2] == content_hash:
+                        # 内容未变化（例如只更新了修改时间），只更新文件信息
+                        self._save_vocabulary_info(vocab_path, content_hash)
+                    else:
+                        words = self._update_vocabulary(vocab_path, content_hash)
+            except Exception as e:
+                print(f"导入单词本失败: {e}")
+                return
+            
+            old_words = self._get_indexed_words(vocab_path)
+            if words is None:
+                # 文件内容未变化，已解析的单词仍然有效
+                words = old_words
+            elif old_words is not None:
+                self._update_vocabulary_indexes(vocab_path, old_words, words)
+            if words is not None:
+                self.vocabulary_cache.put(vocab_path, words)
+    
+    def resync_vocabulary(self, vocab_path):
+        """重新同步单词本文件，只更新变化的单词"""
+        self._sync_vocabulary(vocab_path)
+        return self.load_vocabulary_words(vocab_path)
+    
+    def _split_word_id(self, word_id):
+        """将 word_id 拆分为单词本路径和单词"""
+        vocab_path, _, word = word_id.rpartition(':')
+        return vocab_path, word
+    
+    def _insert_record_word(self, date, word_id, status, timestamp):
+        """写入一条单词学习记录并更新单词最新状态和下次复习时间"""
+        vocab_path, word = self._split_word_id(word_id)
+        new_day = self.conn.execute(
+            'SELECT 1 FROM record_words WHERE date = ? AND word_id = ?', (date, word_id)
+        ).fetchone() is None
+        self.conn.execute(
+            'INSERT OR REPLACE INTO record_words (date, word_id, status, timestamp) VALUES (?, ?, ?, ?)',
+            (date, word_id, status, timestamp)
+        )
+        self.conn.execute(
+            """INSERT INTO word_state (word_id, vocab_path, word, status, timestamp) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT (word_id) DO UPDATE SET
+                   study_days = study_days + ?,
+                   status = CASE WHEN excluded.timestamp > timestamp THEN excluded.status ELSE status END,
+                   timestamp = MAX(timestamp, excluded.timestamp)""",
+            (word_id, vocab_path, word, status, timestamp, 1 if new_day else 0)
+        )
+        self.conn.execute(
+            f'UPDATE word_state SET next_review_time = {self._next_review_time_sql()} WHERE word_id = ?',
+            (word_id,)
+        )
+    
+    def _remap_learning_records(self, id_map):
+        """按 id_map 修改学习记录中的 word_id，同一天合并到同一单词的记录保留最新的一条"""
+        with self.conn:
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS id_map (old_id TEXT PRIMARY KEY, new_id TEXT NOT NULL)')
+            self.conn.execute('DELETE FROM id_map')
+            self.conn.executemany('INSERT OR REPLACE INTO id_map (old_id, new_id) VALUES (?, ?)', id_map.items())
+            
+            rows = self.conn.execute(
+                """SELECT r.date, m.new_id, r.status, r.timestamp FROM record_words r
+                   JOIN id_map m ON r.word_id = m.old_id ORDER BY r.timestamp"""
+            ).fetchall()
+            self.conn.execute('DELETE FROM record_words WHERE word_id IN (SELECT old_id FROM id_map)')
+            self.conn.execute('DELETE FROM word_state WHERE word_id IN (SELECT old_id FROM id_map)')
+            
+            # 按时间顺序重新写入，由 _insert_record_word 重新计算学习天数和最新状态
+            for date, word_id, status, timestamp in rows:
+                self._insert_record_word(date, word_id, status, timestamp)
+            self.conn.execute('DELETE FROM id_map')
+        
+        self._review_queues.clear()
+        self._word_stores.clear()
+    
+    def _next_review_time_sql(self):
+        """生成按当前复习策略计算下次复习时间的SQL表达式"""
+        review_intervals = [int(days) for days in self._get_review_intervals(
+            self.config['review']['strategy'], self.config['review']['intervals'])]
+        if not review_intervals:
+            return 'NULL'
+        
+        # 第 n 天学习后使用第 n 个复习间隔，超出后保持最后一个间隔
+        cases = ' '.join(f'WHEN {stage + 1} THEN {days}' for stage, days in enumerate(review_intervals))
+        statuses = ', '.join(f"'{status}'" for status in self.REVIEWABLE_STATUSES)
+        return (f"CASE WHEN status IN ({statuses}) "
+                f"THEN timestamp + 86400 * (CASE study_days {cases} ELSE {review_intervals[-1]} END) "
+                f"ELSE NULL END")
+    
+    def _ensure_review_schedule(self):
+        """复习策略变化时重新计算所有单词的下次复习时间"""
+        schedule_sql = self._next_review_time_sql()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'review_schedule'").fetchone()
+        if row is None or row[0] != schedule_sql:
+            with self.conn:
+                self.conn.execute(f'UPDATE word_state SET next_review_time = {schedule_sql}')
+                self._set_meta('review_schedule', schedule_sql)
+    
+    def _read_conn(self):
+        """获取当前线程可用于读取的数据库连接"""
+        if threading.get_ident() == self._owner_thread:
+            return self.conn
+        conn = getattr(self._thread_local, 'conn', None)
+        if conn is None:
+            # 允许在关闭时由主线程关闭
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._thread_local.conn = conn
+            with self._reader_lock:
+                self._reader_conns.append(conn)
+        return conn
+    
+    def _set_meta(self, key, value):
+        """设置元数据"""
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+    
+    def load_vocabulary_words(self, vocab_path):
+        """加载单词本中的单词（返回的列表由缓存共享，调用方不应修改）"""
+        if vocab_path.endswith(COMPILED_EXTENSION):
+            # 二进制单词本通过 mmap 按需读取，不导入数据库
+            return super().load_vocabulary_words(vocab_path)
+        
+        with self._index_lock:
+            if threading.get_ident() == self._owner_thread:
+                self._sync_vocabulary(vocab_path)
+            words = self.vocabulary_cache.get(vocab_path)
+            if words is None:
+                # 同步后复习队列或列式单词存储持有的单词列表与文件一致，不需要重新解析
+                words = self._get_indexed_words(vocab_path)
+                if words is None:
+                    rows = self._read_conn().execute(
+                        'SELECT data FROM words WHERE vocab_path = ? ORDER BY position', (vocab_path,)
+                    )
+                    words = [json.loads(row[0]) for row in rows]
+                    if not words and threading.get_ident() != self._owner_thread:
+                        # 工作线程（如建立模糊查找索引）不写入数据库，尚未导入的单词本直接读取文件，
+                        # 之后在界面线程同步时与数据库比较
+                        words = self._read_vocabulary_file(vocab_path)
+                self.vocabulary_cache.put(vocab_path, words)
+            return words
+    
+    def update_learning_record(self, word_id, status):
+        """更新学习记录"""
+        now = datetime.datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        
+        if self.config['general']['auto_save']:
+            with self.conn:
+                self._write_learning_record(today, word_id, status, now.timestamp())
+        else:
+            # 不自动保存时不提交事务，与JSON存储一样在关闭单词管理器时才写入磁盘
+            self._write_learning_record(today, word_id, status, now.timestamp())
+        self._on_word_state_changed(word_id)
+    
+    def _write_learning_record(self, date, word_id, status, timestamp):
+        """在当前事务中写入一条学习记录和当日计数"""
+        counter = {'new': 'new_words', 'review': 'review_words', 'test': 'test_words'}.get(status)
+        self.conn.execute('INSERT OR IGNORE INTO daily_records (date) VALUES (?)', (date,))
+        if counter is not None:
+            self.conn.execute(f'UPDATE daily_records SET {counter} = {counter} + 1 WHERE date = ?', (date,))
+        self._insert_record_word(date, word_id, status, timestamp)
+        self._set_meta('last_study_date', date)
+    
+    def get_today_stats(self):
+        """获取今日学习统计"""
+        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        row = self.conn.execute(
+            'SELECT new_words, review_words, test_words FROM daily_records WHERE date = ?', (today,)
+        ).fetchone()
+        if row is None:
+            return {'new_words': 0, 'review_words': 0, 'test_words': 0, 'words': {}}
+        
+        words = {}
+        for word_id, status, timestamp in self.conn.execute(
+                'SELECT word_id, status, timestamp FROM record_words WHERE date = ?', (today,)):
+            words[word_id] = {'status': status, 'timestamp': timestamp}
+        
+        return {'new_words': row[0], 'review_words': row[1], 'test_words': row[2], 'words': words}
+    
+    def _get_word_state(self, word_id):
+        """获取单词的最新状态 [状态, 时间戳, 学习天数]，无记录时返回 None"""
+        row = self._read_conn().execute(
+            'SELECT status, timestamp, study_days FROM word_state WHERE word_id = ?', (word_id,)
+        ).fetchone()
+        return list(row) if row is not None else None
+    
+    def get_words_by_status(self, vocab_path, status):
+        """获取指定状态的单词列表"""
+        if status == 'all':
+            return self.load_vocabulary_words(vocab_path)
+        
+        # 二进制单词本的学习记录属于编译时的JSON单词本
+        vocab_path = self.word_id_path(vocab_path)
+        self._sync_vocabulary(vocab_path)
+        rows = self.conn.execute(
+            f"""SELECT w.data FROM word_state s
+               JOIN words w ON w.id = {self.FIRST_WORD_ROW_SQL}
+               WHERE s.vocab_path = ? AND s.status = ?
+               ORDER BY w.position""",
+            (vocab_path, status)
+        )
+        return [json.loads(row[0]) for row in rows]
+    
+    def get_review_words(self, vocab_path):
+        """获取需要复习的单词（包括已过期未复习的单词），按到期时间排序"""
+        vocab_path = self.word_id_path(vocab_path)
+        self._sync_vocabulary(vocab_path)
+        self._ensure_review_schedule()
+        
+        now = datetime.datetime.now().timestamp()
+        rows = self.conn.execute(
+            f"""SELECT w.data FROM word_state s
+               JOIN words w ON w.id = {self.FIRST_WORD_ROW_SQL}
+               WHERE s.vocab_path = ? AND s.next_review_time <= ?
+               ORDER BY s.next_review_time""",
+            (vocab_path, now)
+        )
+        return [json.loads(row[0]) for row in rows]
+    
+    def close(self):
+        """关闭单词管理器，提交未保存的学习记录并关闭数据库连接"""
+        self.conn.commit()
+        with self._reader_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+        self.conn.close()
+        self.journal.close()
+        self._close_binary_vocabulary()
\ No newline at end of file
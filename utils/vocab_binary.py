@@ -0,0 +1,231 @@
+import os
+import mmap
+import struct
+import numpy as np
+from .vocab_stream import iter_vocabulary_entries
+
+# 二进制单词本文件扩展名
+COMPILED_EXTENSION = '.vwb'
+
+MAGIC = b'VWB1'
+VERSION = 2
+
+# 每个单词依次保存的字段
+FIELDS = ('word', 'meaning', 'phonetic', 'examples', 'tags')
+LIST_FIELDS = ('examples', 'tags')
+
+# 列表字段的每个元素保存为 长度 + UTF-8字节，元素中可以包含任意字符
+LIST_ITEM_LENGTH = struct.Struct('<I')
+
+# 文件头: 魔数, 版本, 字段数, 单词数, 偏移表位置, JSON单词本文件名长度
+# 文件头之后紧接着保存编译时的JSON单词本文件名，用于生成与JSON单词本相同的 word_id
+HEADER = struct.Struct('<4sHHIQI')
+
+# 一个单词各字段的起始偏移，以及下一个单词的起始偏移
+ENTRY_OFFSETS = struct.Struct(f'<{len(FIELDS) + 1}Q')
+OFFSET_SIZE = 8
+
+
+def compiled_path(vocab_path):
+    """获取单词本对应的二进制单词本路径"""
+    return os.path.splitext(vocab_path)[0] + COMPILED_EXTENSION
+
+
+def is_binary_vocabulary(path):
+    """判断文件是否为当前版本的二进制单词本"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(len(MAGIC) + 2)
+    except OSError:
+        return False
+    return head == MAGIC + struct.pack('<H', VERSION)
+
+
+def _encode_field(value, is_list):
+    """将字段值编码为UTF-8字节"""
+    if value is None:
+        return b''
+    if is_list:
+        if isinstance(value, str):
+            value = [value]
+        parts = []
+        for item in value:
+            data = str(item).encode('utf-8')
+            parts.append(LIST_ITEM_LENGTH.pack(len(data)))
+            parts.append(data)
+        return b''.join(parts)
+    return str(value).encode('utf-8')
+
+
+def _decode_list(data):
+    """解码列表字段"""
+    items = []
+    position = 0
+    while position < len(data):
+        (length,) = LIST_ITEM_LENGTH.unpack_from(data, position)
+        position += LIST_ITEM_LENGTH.size
+        items.append(data[position:position + length].decode('utf-8'))
+        position += length
+    return items
+
+
+def compile_vocabulary(vocab_path, output_path=None):
+    """
+    将JSON单词本编译为二进制单词本
+    
+    文件结构为 文件头 + JSON单词本文件名 + 各单词的字段字符串 + 偏移表，
+    偏移表中第 i 个单词第 j 个字段位于 offsets[i * 字段数 + j] 到下一个偏移之间
+    
+    Args:
+        vocab_path (str): JSON单词本路径
+        output_path (str, optional): 输出路径. Defaults to None，即同目录下的 .vwb 文件.
+    
+    Returns:
+        int: 单词数量
+    """
+    output_path = output_path or compiled_path(vocab_path)
+    temp_path = output_path + '.tmp'
+    # 只保存文件名，单词本目录整体移动后仍能对应
+    source_name = os.path.basename(vocab_path).encode('utf-8')
+    offsets = []
+    count = 0
+    
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(FIELDS), 0, 0, len(source_name)))
+            f.write(source_name)
+            position = HEADER.size + len(source_name)
+            
+            for entry in iter_vocabulary_entries(vocab_path):
+                for field in FIELDS:
+                    data = _encode_field(entry.get(field), field in LIST_FIELDS)
+                    offsets.append(position)
+                    f.write(data)
+                    position += len(data)
+                count += 1
+            offsets.append(position)
+            
+            # 偏移表按8字节对齐
+            padding = -position % OFFSET_SIZE
+            f.write(b'\0' * padding)
+            table_offset = position + padding
+            f.write(np.asarray(offsets, dtype='<u8').tobytes())
+            
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, len(FIELDS), count, table_offset, len(source_name)))
+        
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    return count
+
+
+class BinaryVocabulary:
+    """
+    二进制单词本，通过 mmap 打开，按下标读取单词时只访问该单词所在的页
+    """
+    
+    def __init__(self, path):
+        """
+        打开二进制单词本
+        
+        Args:
+            path (str): 二进制单词本路径
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mmap) < HEADER.size:
+                raise ValueError(f"不是有效的二进制单词本: {path}")
+            magic, version, field_count, count, table_offset, source_length = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or version != VERSION or field_count != len(FIELDS):
+                raise ValueError(f"不是有效的二进制单词本: {path}")
+            if (HEADER.size + source_length > table_offset
+                    or table_offset + (count * len(FIELDS) + 1) * OFFSET_SIZE > len(self._mmap)):
+                raise ValueError(f"二进制单词本已损坏: {path}")
+            source_name = self._mmap[HEADER.size:HEADER.size + source_length].decode('utf-8')
+        except Exception:
+            self.close()
+            raise
+        
+        self._count = count
+        self._table_offset = table_offset
+        # 编译时的JSON单词本路径，单词的 word_id 使用该路径
+        self.source_path = os.path.join(os.path.dirname(path), source_name) if source_name else None
+        
+        # 随机访问为主，关闭预读，使常驻内存只包含实际访问过的页
+        if hasattr(mmap, 'MADV_RANDOM'):
+            self._mmap.madvise(mmap.MADV_RANDOM)
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.get(i) for i in range(*index.indices(self._count))]
+        return self.get(index)
+    
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.get(index)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _check_index(self, index):
+        """检查并规范化下标"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return index
+    
+    def get(self, index):
+        """
+        获取单词条目
+        
+        Args:
+            index (int): 单词下标
+        
+        Returns:
+            dict: 单词条目
+        """
+        index = self._check_index(index)
+        offsets = ENTRY_OFFSETS.unpack_from(self._mmap, self._table_offset + index * len(FIELDS) * OFFSET_SIZE)
+        
+        entry = {}
+        for field_index, field in enumerate(FIELDS):
+            data = self._mmap[offsets[field_index]:offsets[field_index + 1]]
+            entry[field] = _decode_list(data) if field in LIST_FIELDS else data.decode('utf-8')
+        return entry
+    
+    def get_word(self, index):
+        """
+        只获取单词本身，不解码其他字段
+        
+        Args:
+            index (int): 单词下标
+        
+        Returns:
+            str: 单词
+        """
+        index = self._check_index(index)
+        start, end = struct.unpack_from('<2Q', self._mmap, self._table_offset + index * len(FIELDS) * OFFSET_SIZE)
+        return self._mmap[start:end].decode('utf-8')
+    
+    def close(self):
+        """关闭单词本"""
+        mm = getattr(self, '_mmap', None)
+        if mm is not None:
+            mm.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
\ No newline at end of file
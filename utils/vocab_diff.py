@@ -0,0 +1,40 @@
+import hashlib
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """计算文件内容的哈希值，用于判断单词本是否真的发生了变化"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def diff_vocabulary_entries(old_words, new_words):
+    """
+    按单词比较新旧单词条目
+    
+    Args:
+        old_words (list): 旧的单词条目列表
+        new_words (list): 新的单词条目列表
+    
+    Returns:
+        tuple: (新增的单词条目列表, 内容变化的单词条目列表, 删除的单词列表)，
+            新旧单词条目中有重复的单词时无法按单词对应，返回 None
+    """
+    old_by_word = {entry['word']: entry for entry in old_words}
+    new_by_word = {entry['word']: entry for entry in new_words}
+    if len(old_by_word) != len(old_words) or len(new_by_word) != len(new_words):
+        return None
+    
+    inserted = []
+    updated = []
+    for word, entry in new_by_word.items():
+        old_entry = old_by_word.get(word)
+        if old_entry is None:
+            inserted.append(entry)
+        elif old_entry != entry:
+            updated.append(entry)
+    
+    deleted = [word for word in old_by_word if word not in new_by_word]
+    return inserted, updated, deleted
\ No newline at end of file
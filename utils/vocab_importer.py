@@ -0,0 +1,195 @@
+import io
+import os
+import re
+import json
+import itertools
+from models.word import Word
+from .vocab_stream import iter_entries_from_file
+from .compression import open_text_writer
+
+# 支持导入的文件格式
+SUPPORTED_EXTENSIONS = ('.json', '.csv', '.tsv', '.txt')
+
+# 表格文件中可识别的列名
+COLUMN_ALIASES = {
+    'word': 'word', 'words': 'word', '单词': 'word',
+    'meaning': 'meaning', 'meanings': 'meaning', 'translation': 'meaning', '释义': 'meaning', '含义': 'meaning',
+    'phonetic': 'phonetic', '音标': 'phonetic',
+    'examples': 'examples', 'example': 'examples', '例句': 'examples',
+    'tags': 'tags', 'tag': 'tags', '标签': 'tags'
+}
+
+# 没有表头时各列的含义
+DEFAULT_COLUMNS = ['word', 'meaning', 'phonetic', 'examples', 'tags']
+
+# 纯文本行“单词 释义”：单词可以包含空格（如 give up），释义从第一个中文字符（或其前的词性，如 v.）开始，
+# 单词和释义之间可以有 - : = 等分隔符
+TEXT_LINE_PATTERN = re.compile(
+    r'^(?P<word>.+?)\s*(?:[-:=：]\s*)?(?P<meaning>(?:\b[a-z]+\.\s*)*[\u2e80-\ufaff\uff00-\uffef].*)$'
+)
+
+
+class ImportCancelled(Exception):
+    """导入被用户取消"""
+
+
+def normalize_entry(raw):
+    """将导入的条目规范化为 Word 的格式，没有单词的条目返回 None"""
+    word = str(raw.get('word') or '').strip()
+    if not word:
+        return None
+    
+    examples = raw.get('examples') or []
+    if isinstance(examples, str):
+        examples = [example.strip() for example in examples.split('|') if example.strip()]
+    elif not isinstance(examples, list):
+        examples = list(examples)
+    
+    tags = raw.get('tags') or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in re.split(r'[;,，；]', tags) if tag.strip()]
+    
+    entry = Word(word, str(raw.get('meaning') or '').strip(), str(raw.get('phonetic') or '').strip(),
+                 examples, tags)
+    return {
+        'word': entry.word,
+        'meaning': entry.meaning,
+        'phonetic': entry.phonetic,
+        'examples': entry.examples,
+        'tags': entry.tags
+    }
+
+
+def _chunked(iterable, chunk_size):
+    """将迭代器按块分组"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_json_rows(raw, chunk_size):
+    """读取JSON单词本中的条目"""
+    text = io.TextIOWrapper(raw, encoding='utf-8-sig')
+    yield from _chunked(iter_entries_from_file(text), chunk_size)
+
+
+def _iter_delimited_rows(raw, chunk_size, sep):
+    """使用 pandas 分块读取CSV/TSV文件中的条目"""
+    # pandas 导入较慢，仅在导入表格文件时加载
+    import pandas as pd
+    
+    first_line = raw.readline().decode('utf-8-sig', errors='replace')
+    raw.seek(0)
+    header_fields = [field.strip().strip('"').lower() for field in first_line.split(sep)]
+    has_header = any(field in COLUMN_ALIASES for field in header_fields)
+    
+    reader = pd.read_csv(
+        raw,
+        sep=sep,
+        header=0 if has_header else None,
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunk_size,
+        encoding='utf-8-sig',
+        on_bad_lines='skip'
+    )
+    for frame in reader:
+        if has_header:
+            frame = frame.rename(columns=lambda name: COLUMN_ALIASES.get(str(name).strip().lower(), name))
+        else:
+            frame.columns = DEFAULT_COLUMNS[:len(frame.columns)] + list(frame.columns[len(DEFAULT_COLUMNS):])
+        yield frame.to_dict('records')
+
+
+def _iter_text_rows(raw, chunk_size):
+    """读取纯文本文件中的条目，每行为“单词 释义”，以制表符分隔各列，没有制表符时在释义开头处分隔"""
+    def rows():
+        for line in io.TextIOWrapper(raw, encoding='utf-8-sig'):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if '\t' in line:
+                parts = line.split('\t')
+            else:
+                match = TEXT_LINE_PATTERN.match(line)
+                parts = [match.group('word'), match.group('meaning')] if match else line.split(None, 1)
+            yield dict(zip(DEFAULT_COLUMNS, parts))
+    
+    yield from _chunked(rows(), chunk_size)
+
+
+def iter_import_chunks(raw, ext, chunk_size=2000):
+    """从已打开的二进制文件中按块读取待导入的原始条目"""
+    ext = ext.lower()
+    if ext == '.json':
+        return _iter_json_rows(raw, chunk_size)
+    elif ext == '.csv':
+        return _iter_delimited_rows(raw, chunk_size, ',')
+    elif ext == '.tsv':
+        return _iter_delimited_rows(raw, chunk_size, '\t')
+    elif ext == '.txt':
+        return _iter_text_rows(raw, chunk_size)
+    raise ValueError(f"不支持的文件格式: {ext}")
+
+
+def import_vocabulary_file(file_path, output_dir, progress_callback=None, is_cancelled=None, chunk_size=2000,
+                           compression='none'):
+    """
+    导入单词本文件，规范化后保存到单词本目录
+    
+    Args:
+        file_path (str): 待导入的文件
+        output_dir (str): 单词本目录
+        progress_callback (callable, optional): 进度回调，参数为 0-100 的整数. Defaults to None.
+        is_cancelled (callable, optional): 返回是否已取消. Defaults to None.
+        chunk_size (int, optional): 每块条目数. Defaults to 2000.
+        compression (str, optional): 保存时的压缩格式. Defaults to 'none'.
+    
+    Returns:
+        dict: 单词本信息 {"name", "path", "count"}
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    output_path = os.path.join(output_dir, f"{name}.json")
+    suffix = 1
+    while os.path.exists(output_path):
+        suffix += 1
+        output_path = os.path.join(output_dir, f"{name}_{suffix}.json")
+    
+    total_size = max(os.path.getsize(file_path), 1)
+    temp_path = output_path + '.tmp'
+    count = 0
+    
+    try:
+        with open(file_path, 'rb') as raw, open_text_writer(temp_path, compression) as out:
+            out.write('{"name": ' + json.dumps(name, ensure_ascii=False) + ', "verbs": [\n')
+            for rows in iter_import_chunks(raw, os.path.splitext(file_path)[1], chunk_size):
+                if is_cancelled is not None and is_cancelled():
+                    raise ImportCancelled()
+                
+                for raw_entry in rows:
+                    entry = normalize_entry(raw_entry)
+                    if entry is None:
+                        continue
+                    if count > 0:
+                        out.write(',\n')
+                    out.write(json.dumps(entry, ensure_ascii=False))
+                    count += 1
+                
+                # 按已读取的字节数估算进度
+                if progress_callback is not None and not raw.closed:
+                    progress_callback(min(99, raw.tell() * 100 // total_size))
+            out.write('\n]}')
+        
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    if progress_callback is not None:
+        progress_callback(100)
+    
+    return {"name": name, "path": output_path, "count": count}
\ No newline at end of file
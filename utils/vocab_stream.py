@@ -0,0 +1,124 @@
+import json
+from .compression import open_text
+
+# 对象格式单词本中存放单词数组的键
+ENTRY_KEYS = ('verbs', 'words')
+
+
+class _JsonStreamReader:
+    """JSON流读取器，按块读取文件，只在内存中保留尚未解析的部分"""
+    
+    def __init__(self, f, chunk_size):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+    
+    def _fill(self):
+        """读取下一块数据，返回是否读到了新数据"""
+        if self._eof:
+            return False
+        
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        
+        # 丢弃已解析的部分
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def peek(self):
+        """跳过空白并返回下一个字符，文件结束时返回空字符串"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, chars):
+        """读取下一个字符，必须是 chars 中的一个"""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"单词本格式错误: 位置 {self._pos} 处应为 {chars!r}，实际为 {ch!r}")
+        self._pos += 1
+        return ch
+    
+    def decode(self):
+        """解析下一个完整的JSON值"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # 数据不完整，继续读取
+                if self._fill():
+                    continue
+                raise
+            
+            # 数字等值可能恰好在块边界被截断
+            if end == len(self._buffer) and self._fill():
+                continue
+            
+            self._pos = end
+            return value
+    
+    def iter_array(self):
+        """逐个解析数组中的元素（调用前需已读取 '['）"""
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        
+        while True:
+            yield self.decode()
+            if self.expect(',]') == ']':
+                return
+
+
+def iter_vocabulary_entries(vocab_path, chunk_size=65536):
+    """
+    逐个读取单词本文件中的单词条目，内存占用只与单个条目大小有关
+    
+    支持 {"name": ..., "verbs": [...]} 格式和单词列表格式，gzip/lzma 压缩的文件边读取边解压
+    """
+    with open_text(vocab_path) as f:
+        yield from iter_entries_from_file(f, chunk_size)
+
+
+def iter_entries_from_file(f, chunk_size=65536):
+    """从已打开的文本文件中逐个读取单词条目"""
+    reader = _JsonStreamReader(f, chunk_size)
+    ch = reader.expect('[{')
+    
+    if ch == '[':
+        yield from reader.iter_array()
+        return
+    
+    # 对象格式: 跳过其他键，流式读取单词数组
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(':')
+        if key in ENTRY_KEYS and reader.peek() == '[':
+            reader.expect('[')
+            yield from reader.iter_array()
+        else:
+            reader.decode()
+        if reader.expect(',}') == '}':
+            return
+
+
+def extract_vocabulary_entries(data):
+    """从已解析的单词本数据中取出单词条目列表"""
+    if isinstance(data, dict):
+        for key in ENTRY_KEYS:
+            if isinstance(data.get(key), list):
+                return data[key]
+        return []
+    return data
\ No newline at end of file
@@ -0,0 +1,118 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+class VocabularyCache:
+    """
+    单词本缓存类，按路径缓存解析结果，以文件修改时间和大小校验，超出内存预算时按LRU淘汰，
+    最近使用的单词本即使单独超出预算也保留，避免每次使用都重新解析
+    """
+    
+    # 估算解析结果占用内存时抽样的条目数
+    SIZE_SAMPLE_COUNT = 64
+    
+    def __init__(self, max_bytes):
+        # 内存预算（按解析后的单词条目占用的内存估算）
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        
+        # path -> (mtime_ns, 文件大小, 计入预算的大小, data)，按最近使用排序
+        self._entries = OrderedDict()
+        
+        # 供词线程和界面线程都会访问缓存
+        self._lock = threading.Lock()
+        
+        # 统计计数
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, path):
+        """获取缓存的单词本，文件已变化或未缓存时返回 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                if stat is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    self._entries.move_to_end(path)
+                    self.hits += 1
+                    return entry[3]
+                
+                # 文件已变化，丢弃旧缓存
+                self._invalidate(path)
+            
+            self.misses += 1
+            return None
+    
+    def put(self, path, data):
+        """缓存单词本解析结果"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        
+        size = self.estimate_size(data)
+        
+        with self._lock:
+            self._invalidate(path)
+            
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, size, data)
+            self.total_bytes += size
+            
+            # 按LRU淘汰，刚放入的单词本总是保留
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (mtime_ns, file_size, size, _) = self._entries.popitem(last=False)
+                self.total_bytes -= size
+                self.evictions += 1
+    
+    def estimate_size(self, data):
+        """估算单词条目列表占用的内存，按抽样条目的对象大小乘以条目数计算"""
+        if not data:
+            return sys.getsizeof(data)
+        step = max(1, len(data) // self.SIZE_SAMPLE_COUNT)
+        sample = data[::step]
+        sample_bytes = sum(_sizeof(entry) for entry in sample)
+        return sys.getsizeof(data) + sample_bytes * len(data) // len(sample)
+    
+    def invalidate(self, path=None):
+        """使指定单词本（或全部单词本）的缓存失效"""
+        with self._lock:
+            self._invalidate(path)
+    
+    def _invalidate(self, path):
+        """使缓存失效，调用方需持有锁"""
+        if path is None:
+            self._entries.clear()
+            self.total_bytes = 0
+            return
+        
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+    
+    def get_stats(self):
+        """获取缓存统计信息"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'total_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+def _sizeof(value):
+    """计算单词条目及其包含的字符串和列表占用的内存（字典的键由JSON解析共享，不计入）"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_sizeof(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_sizeof(item) for item in value)
+    return size
\ No newline at end of file
@@ -1,9 +1,37 @@
 import os
+import re
 import json
 import datetime
+import threading
+import unicodedata
+from .record_journal import RecordJournal
+from .review_queue import ReviewQueue
+from .vocabulary_cache import VocabularyCache
+from .vocab_stream import iter_vocabulary_entries, extract_vocabulary_entries
+from .compression import open_text, open_text_writer
+from .search_index import SearchIndex
+from .fuzzy_index import FuzzyIndex
+from .vocab_diff import file_hash, diff_vocabulary_entries
+from .vocab_binary import BinaryVocabulary, compile_vocabulary, compiled_path, is_binary_vocabulary, COMPILED_EXTENSION
+from models.word_store import WordStore
 
 class WordManager:
     """单词管理器类，负责管理单词本和学习记录"""
+    
+    # 学习记录状态 -> 单词学习状态
+    RECORD_STATUS_TO_WORD_STATUS = {
+        'new': 'learned',
+        'learned': 'learned',
+        'review': 'learned',
+        'reviewed': 'learned',
+        'test': 'learned',
+        'skipped': 'skipped',
+        'favorite': 'favorite'
+    }
+    
+    # 需要安排复习的学习记录状态
+    REVIEWABLE_STATUSES = ['learned', 'reviewed']
+    
     """
     {
   "name": "CET6英语",
@@ -23,6 +51,83 @@ class WordManager:
         self.config_manager = config_manager
         self.vocabularies_dir = config_manager.vocabularies_dir
         self.config = config_manager.config
+        self._init_caches()
+        
+        # 单词本内容变化的监听函数，参数为单词本路径
+        self._vocabulary_listeners = []
+        
+        # 单词最新状态索引: word_id -> [最新状态, 最新时间戳, 学习天数]
+        self._word_state_index = {}
+        self._build_word_state_index()
+        
+        # 学习记录日志
+        self.journal = RecordJournal(os.path.join(config_manager.data_dir, 'learning_records.journal'))
+        self._replay_journal()
+    
+    def _init_caches(self):
+        """初始化单词本缓存和各单词本的索引"""
+        # 单词本缓存
+        self.vocabulary_cache = VocabularyCache(self.config['general']['vocabulary_cache_mb'] * 1024 * 1024)
+        
+        # 各单词本的复习队列: vocab_path -> (复习间隔, ReviewQueue, word_id -> 单词, 单词列表)
+        self._review_queues = {}
+        
+        # 各单词本的列式单词存储: vocab_path -> (单词列表, WordStore, 单词ID -> 单词条目, 计算下次复习时间所用的复习间隔)
+        self._word_stores = {}
+        
+        # 单词本文件信息和内容哈希: vocab_path -> ((mtime_ns, 文件大小), 哈希值)
+        self._vocabulary_hashes = {}
+        
+        # 各单词本的搜索索引: vocab_path -> (WordStore, SearchIndex)
+        self._search_indexes = {}
+        
+        # 各单词本的模糊查找索引: vocab_path -> (WordStore, FuzzyIndex)
+        self._fuzzy_indexes = {}
+        
+        # 已打开的二进制单词本: 二进制单词本路径 -> (mtime_ns, BinaryVocabulary)
+        # 供词线程也会打开二进制单词本（获取 word_id 路径），打开、编译和关闭时加锁
+        self._binary_vocabularies = {}
+        self._binary_lock = threading.RLock()
+        
+        # 模糊查找索引可能在线程池中建立，加载单词本和修改上面的索引时加锁
+        self._index_lock = threading.RLock()
+    
+    def _build_word_state_index(self):
+        """根据全部学习记录构建单词最新状态索引"""
+        self._word_state_index = {}
+        for date, record in self.config['learning_records']['daily_records'].items():
+            for word_id, word_record in record['words'].items():
+                self._update_word_state_index(word_id, word_record['status'], word_record['timestamp'], True)
+    
+    def _update_word_state_index(self, word_id, status, timestamp, new_day):
+        """用一条学习记录更新单词最新状态索引，new_day 表示该单词当天的第一条记录"""
+        state = self._word_state_index.get(word_id)
+        if state is None:
+            self._word_state_index[word_id] = [status, timestamp, 1]
+            return
+        
+        if new_day:
+            state[2] += 1
+        if timestamp > state[1]:
+            state[0] = status
+            state[1] = timestamp
+    
+    def add_vocabulary_listener(self, callback):
+        """
+        添加单词本内容变化的监听函数，单词本文件的增删改已应用到列式单词存储后调用
+        
+        Args:
+            callback (callable): 监听函数，参数为单词本路径，可能在工作线程中调用
+        """
+        self._vocabulary_listeners.append(callback)
+    
+    def _notify_vocabulary_changed(self, vocab_path):
+        """通知监听函数单词本内容已变化"""
+        for callback in list(self._vocabulary_listeners):
+            try:
+                callback(vocab_path)
+            except Exception as e:
+                print(f"通知单词本变化失败: {e}")
     
     def get_vocabularies(self):
         """获取单词本列表"""
@@ -30,44 +135,405 @@ class WordManager:
     
     def add_vocabulary(self, vocabulary):
         """添加单词本"""
-        self.config['vocabularies'].append(vocabulary)
+        with self.config_manager.lock:
+            self.config['vocabularies'].append(vocabulary)
         self.config_manager.save_config()
     
     def remove_vocabulary(self, index):
         """删除单词本"""
         if 0 <= index < len(self.config['vocabularies']):
-            del self.config['vocabularies'][index]
+            with self.config_manager.lock:
+                del self.config['vocabularies'][index]
             self.config_manager.save_config()
             return True
         return False
     
     def load_vocabulary_words(self, vocab_path):
-        """加载单词本中的单词"""
+        """加载单词本中的单词（返回的列表由缓存共享，调用方不应修改）"""
+        if vocab_path.endswith(COMPILED_EXTENSION):
+            # 二进制单词本按需读取，不需要缓存
+            vocabulary = self.open_binary_vocabulary(vocab_path)
+            return vocabulary if vocabulary is not None else []
+        
+        words = self.vocabulary_cache.get(vocab_path)
+        if words is None:
+            words = self.resync_vocabulary(vocab_path)
+        return words
+    
+    def resync_vocabulary(self, vocab_path):
+        """
+        重新读取单词本文件，只将新增、修改和删除的单词更新到复习队列和列式单词存储，
+        其他单词的索引和学习记录保持不变
+        
+        Args:
+            vocab_path (str): 单词本路径
+        
+        Returns:
+            list: 单词条目列表
+        """
+        with self._index_lock:
+            try:
+                stat = os.stat(vocab_path)
+                file_info = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                file_info = None
+            old_words = self._get_indexed_words(vocab_path)
+            known_info, known_hash = self._vocabulary_hashes.get(vocab_path, (None, None))
+            
+            if old_words is not None and file_info is not None and file_info == known_info:
+                # 文件未变化（缓存已淘汰，但索引仍持有解析结果），不需要重新计算哈希和解析
+                words = old_words
+                content_hash = known_hash
+            else:
+                try:
+                    content_hash = file_hash(vocab_path)
+                except OSError:
+                    content_hash = None
+                
+                if old_words is not None and content_hash is not None and content_hash == known_hash:
+                    # 内容未变化（例如只更新了修改时间），沿用已解析的单词
+                    words = old_words
+                else:
+                    words = self._read_vocabulary_file(vocab_path)
+                    if old_words is not None:
+                        self._update_vocabulary_indexes(vocab_path, old_words, words)
+            
+            self._vocabulary_hashes[vocab_path] = (file_info, content_hash)
+            self.vocabulary_cache.put(vocab_path, words)
+            return words
+    
+    def _get_indexed_words(self, vocab_path):
+        """获取复习队列或列式单词存储所基于的单词列表，都未建立时返回 None"""
+        entry = self._review_queues.get(vocab_path)
+        if entry is not None:
+            return entry[3]
+        entry = self._word_stores.get(vocab_path)
+        if entry is not None:
+            return entry[0]
+        return None
+    
+    def _update_vocabulary_indexes(self, vocab_path, old_words, words):
+        """单词本内容变化后更新其复习队列、列式单词存储和搜索索引"""
+        changes = diff_vocabulary_entries(old_words, words)
+        if changes is not None:
+            self._apply_vocabulary_diff(vocab_path, words, *changes)
+            return
+        
+        # 有重复的单词时无法按单词对应新旧条目，下次使用时重新构建
+        for indexes in (self._review_queues, self._word_stores, self._search_indexes, self._fuzzy_indexes):
+            indexes.pop(vocab_path, None)
+        self._notify_vocabulary_changed(vocab_path)
+    
+    def _apply_vocabulary_diff(self, vocab_path, words, inserted, updated, deleted):
+        """将单词本的变化应用到复习队列和列式单词存储，并使其指向新的单词列表"""
+        entry = self._review_queues.get(vocab_path)
+        if entry is not None:
+            review_intervals, queue, words_by_id, _ = entry
+            for word in deleted:
+                word_id = f"{vocab_path}:{word}"
+                queue.remove(word_id)
+                words_by_id.pop(word_id, None)
+            for word in updated:
+                words_by_id[f"{vocab_path}:{word['word']}"] = word
+            for word in inserted:
+                word_id = f"{vocab_path}:{word['word']}"
+                words_by_id[word_id] = word
+                queue.schedule(word_id, self._get_next_review_time(word_id, review_intervals))
+            self._review_queues[vocab_path] = (review_intervals, queue, words_by_id, words)
+        
+        entry = self._word_stores.get(vocab_path)
+        store = None
+        if entry is not None:
+            old_words, store, slot_words, store_intervals = entry
+            if slot_words is old_words:
+                # 旧列表可能仍被调用方使用，复制后再修改
+                slot_words = list(slot_words)
+            removed_ids = []
+            updated_ids = []
+            added_ids = []
+            for word in deleted:
+                index = store.find(word)
+                if index is not None:
+                    store.remove(index)
+                    slot_words[index] = None
+                    removed_ids.append(index)
+            for word in updated:
+                index = store.find(word['word'])
+                if index is not None:
+                    store.update(index, word.get('meaning', ''), word.get('phonetic'),
+                                 word.get('examples'), word.get('tags'))
+                    slot_words[index] = word
+                    updated_ids.append(index)
+            for word in inserted:
+                index = store.add(word['word'], word.get('meaning', ''), word.get('phonetic'),
+                                  word.get('examples'), word.get('tags'))
+                slot_words.append(word)
+                added_ids.append(index)
+                self._sync_word_store_state(store, index, f"{vocab_path}:{word['word']}")
+            self._word_stores[vocab_path] = (words, store, slot_words, store_intervals)
+            
+            # 搜索索引只更新变化的单词（模糊查找只使用单词本身，不受释义变化影响）
+            entry = self._search_indexes.get(vocab_path)
+            if entry is not None and entry[0] is store:
+                entry[1].remove(removed_ids)
+                entry[1].update(updated_ids)
+                entry[1].add(added_ids)
+            entry = self._fuzzy_indexes.get(vocab_path)
+            if entry is not None and entry[0] is store:
+                entry[1].remove(removed_ids)
+                entry[1].add(added_ids)
+        
+        # 基于其他单词存储建立的搜索索引已过期，下次搜索时重建
+        for indexes in (self._search_indexes, self._fuzzy_indexes):
+            entry = indexes.get(vocab_path)
+            if entry is not None and entry[0] is not store:
+                del indexes[vocab_path]
+        
+        if inserted or updated or deleted:
+            self._notify_vocabulary_changed(vocab_path)
+    
+    def _read_vocabulary_file(self, vocab_path):
+        """读取并解析单词本文件，返回单词条目列表"""
         if os.path.exists(vocab_path):
             try:
-                with open(vocab_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open_text(vocab_path) as f:
+                    return extract_vocabulary_entries(json.load(f))
             except Exception as e:
                 print(f"加载单词本失败: {e}")
         return []
     
+    def iter_vocabulary_words(self, vocab_path):
+        """逐个读取单词本中的单词，不需要先将整个文件读入内存"""
+        if vocab_path.endswith(COMPILED_EXTENSION):
+            # 在调用线程（如供词线程）中独立打开，其他线程重新编译或关闭共享的二进制单词本时不受影响
+            try:
+                vocabulary = BinaryVocabulary(vocab_path)
+            except Exception as e:
+                print(f"加载单词本失败: {e}")
+                return
+            with vocabulary:
+                yield from vocabulary
+            return
+        
+        words = self.vocabulary_cache.get(vocab_path)
+        if words is not None:
+            yield from words
+            return
+        
+        if os.path.exists(vocab_path):
+            try:
+                yield from iter_vocabulary_entries(vocab_path)
+            except Exception as e:
+                print(f"加载单词本失败: {e}")
+    
+    def compile_vocabulary(self, vocab_path):
+        """将JSON单词本编译为二进制单词本，返回二进制单词本路径"""
+        with self._binary_lock:
+            binary_path = compiled_path(vocab_path)
+            try:
+                # 先关闭旧的映射，否则部分系统上无法替换文件
+                self._close_binary_vocabulary(binary_path)
+                compile_vocabulary(vocab_path, binary_path)
+                return binary_path
+            except Exception as e:
+                print(f"编译单词本失败: {e}")
+                return None
+    
+    def open_binary_vocabulary(self, vocab_path):
+        """
+        通过 mmap 打开单词本对应的二进制单词本，可按下标随机读取单词
+        
+        传入JSON单词本时，二进制单词本不存在或已过期则先重新编译
+        """
+        with self._binary_lock:
+            binary_path = vocab_path
+            if not vocab_path.endswith(COMPILED_EXTENSION):
+                binary_path = compiled_path(vocab_path)
+                try:
+                    if (not is_binary_vocabulary(binary_path)
+                            or os.stat(binary_path).st_mtime_ns < os.stat(vocab_path).st_mtime_ns):
+                        if self.compile_vocabulary(vocab_path) is None:
+                            return None
+                except OSError as e:
+                    print(f"加载单词本失败: {e}")
+                    return None
+            
+            try:
+                mtime_ns = os.stat(binary_path).st_mtime_ns
+                entry = self._binary_vocabularies.get(binary_path)
+                if entry is not None and entry[0] == mtime_ns:
+                    return entry[1]
+                
+                self._close_binary_vocabulary(binary_path)
+                vocabulary = BinaryVocabulary(binary_path)
+                self._binary_vocabularies[binary_path] = (mtime_ns, vocabulary)
+                return vocabulary
+            except Exception as e:
+                print(f"加载单词本失败: {e}")
+                return None
+    
+    def word_id_path(self, vocab_path):
+        """
+        获取单词本中单词的 word_id 所使用的单词本路径
+        
+        二进制单词本使用编译时的JSON单词本路径，与打开JSON单词本时的 word_id 相同，学习记录通用
+        """
+        if vocab_path.endswith(COMPILED_EXTENSION):
+            vocabulary = self.open_binary_vocabulary(vocab_path)
+            if vocabulary is not None and vocabulary.source_path:
+                return vocabulary.source_path
+        return vocab_path
+    
+    def _close_binary_vocabulary(self, binary_path=None):
+        """关闭已打开的二进制单词本，binary_path 为 None 时全部关闭"""
+        with self._binary_lock:
+            paths = list(self._binary_vocabularies) if binary_path is None else [binary_path]
+            for path in paths:
+                entry = self._binary_vocabularies.pop(path, None)
+                if entry is not None:
+                    entry[1].close()
+    
     def save_vocabulary_words(self, vocab_path, words):
-        """保存单词本中的单词"""
+        """保存单词本中的单词，按设置压缩保存"""
+        compression = self.config['general']['storage_compression']
         try:
-            with open(vocab_path, 'w', encoding='utf-8') as f:
-                json.dump(words, f, ensure_ascii=False, indent=4)
+            with open_text_writer(vocab_path, compression) as f:
+                if compression == 'none':
+                    json.dump(words, f, ensure_ascii=False, indent=4)
+                else:
+                    json.dump(words, f, ensure_ascii=False, separators=(',', ':'))
+            self.vocabulary_cache.invalidate(vocab_path)
             return True
         except Exception as e:
             print(f"保存单词本失败: {e}")
             return False
     
+    def merge_vocabularies(self, vocab_paths, name):
+        """
+        合并多个单词本，相同的单词只保留一个并合并释义、例句和标签，
+        原单词本中的学习记录迁移到合并后的单词本
+        
+        Args:
+            vocab_paths (list): 待合并的单词本路径
+            name (str): 合并后的单词本名称
+        
+        Returns:
+            dict: 新单词本信息 {"name", "path", "count"}，失败时返回 None
+        """
+        output_path = os.path.join(self.vocabularies_dir, f"{name}.json")
+        suffix = 1
+        while os.path.exists(output_path):
+            suffix += 1
+            output_path = os.path.join(self.vocabularies_dir, f"{name}_{suffix}.json")
+        
+        # 规范化单词 -> 合并后的条目，以及各字段已出现的值
+        merged = {}
+        seen = {}
+        # 原 word_id -> 规范化单词
+        id_keys = {}
+        
+        try:
+            for vocab_path in vocab_paths:
+                id_path = self.word_id_path(vocab_path)
+                for entry in self.iter_vocabulary_words(vocab_path):
+                    word = str(entry.get('word') or '').strip()
+                    if not word:
+                        continue
+                    
+                    key = normalize_headword(word)
+                    id_keys[f"{id_path}:{entry['word']}"] = key
+                    
+                    target = merged.get(key)
+                    if target is None:
+                        target = merged[key] = {
+                            'word': word,
+                            'meaning': '',
+                            'phonetic': entry.get('phonetic') or '',
+                            'examples': [],
+                            'tags': []
+                        }
+                        seen[key] = (set(), set(), set())
+                    elif not target['phonetic']:
+                        target['phonetic'] = entry.get('phonetic') or ''
+                    
+                    meanings, examples, tags = seen[key]
+                    parts = [part.strip() for part in re.split(r'[;；]', str(entry.get('meaning') or ''))]
+                    new_parts = [part for part in parts if part and part not in meanings]
+                    if new_parts:
+                        meanings.update(new_parts)
+                        target['meaning'] = '; '.join(([target['meaning']] if target['meaning'] else []) + new_parts)
+                    _extend_unique(target['examples'], examples, entry.get('examples'))
+                    _extend_unique(target['tags'], tags, entry.get('tags'))
+        except Exception as e:
+            print(f"合并单词本失败: {e}")
+            return None
+        
+        if not self.save_vocabulary_words(output_path, {'name': name, 'verbs': list(merged.values())}):
+            return None
+        
+        vocabulary = {'name': name, 'path': output_path, 'count': len(merged)}
+        self.add_vocabulary(vocabulary)
+        
+        # 将原单词本的学习记录迁移到新单词本
+        id_map = {word_id: f"{output_path}:{merged[key]['word']}" for word_id, key in id_keys.items()}
+        self._remap_learning_records(id_map)
+        return vocabulary
+    
+    def _remap_learning_records(self, id_map):
+        """按 id_map 修改学习记录中的 word_id，同一天合并到同一单词的记录保留最新的一条"""
+        # 先将日志合并到配置中，确保迁移包含全部记录
+        self.compact_journal()
+        
+        with self.config_manager.lock:
+            for record in self.config['learning_records']['daily_records'].values():
+                words = {}
+                for word_id, word_record in record['words'].items():
+                    word_id = id_map.get(word_id, word_id)
+                    current = words.get(word_id)
+                    if current is None or word_record['timestamp'] > current['timestamp']:
+                        words[word_id] = word_record
+                record['words'] = words
+            self._build_word_state_index()
+            self._review_queues.clear()
+            self._word_stores.clear()
+        
+        self.config_manager.save_config(sync=True)
+    
     def update_learning_record(self, word_id, status):
         """更新学习记录"""
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        now = datetime.datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        timestamp = now.timestamp()
+        
+        with self.config_manager.lock:
+            self._apply_learning_record(today, word_id, status, timestamp)
         
-        # 初始化今日记录
-        if today not in self.config['learning_records']['daily_records']:
-            self.config['learning_records']['daily_records'][today] = {
+        # 保存记录
+        if self.config['general']['auto_save']:
+            if self.config['general']['journal_mode']:
+                # 日志模式: 只追加一行事件，定期合并到配置文件
+                learning_records = self.config['learning_records']
+                with self.config_manager.lock:
+                    learning_records['journal_seq'] += 1
+                self.journal.append({
+                    'seq': learning_records['journal_seq'],
+                    'date': today,
+                    'word_id': word_id,
+                    'status': status,
+                    'timestamp': timestamp
+                })
+                if self.journal.event_count >= self.config['general']['journal_compact_threshold']:
+                    self.compact_journal()
+            else:
+                self.config_manager.save_config()
+    
+    def _apply_learning_record(self, date, word_id, status, timestamp):
+        """将一条学习记录应用到内存中的配置"""
+        daily_records = self.config['learning_records']['daily_records']
+        
+        # 初始化当日记录
+        if date not in daily_records:
+            daily_records[date] = {
                 'new_words': 0,
                 'review_words': 0,
                 'test_words': 0,
@@ -75,25 +541,57 @@ class WordManager:
             }
         
         # 更新单词状态
-        self.config['learning_records']['daily_records'][today]['words'][word_id] = {
+        new_day = word_id not in daily_records[date]['words']
+        daily_records[date]['words'][word_id] = {
             'status': status,
-            'timestamp': datetime.datetime.now().timestamp()
+            'timestamp': timestamp
         }
+        self._update_word_state_index(word_id, status, timestamp, new_day)
+        self._on_word_state_changed(word_id)
         
         # 更新计数
         if status == 'new':
-            self.config['learning_records']['daily_records'][today]['new_words'] += 1
+            daily_records[date]['new_words'] += 1
         elif status == 'review':
-            self.config['learning_records']['daily_records'][today]['review_words'] += 1
+            daily_records[date]['review_words'] += 1
         elif status == 'test':
-            self.config['learning_records']['daily_records'][today]['test_words'] += 1
+            daily_records[date]['test_words'] += 1
         
         # 更新最后学习日期
-        self.config['learning_records']['last_study_date'] = today
+        last_study_date = self.config['learning_records']['last_study_date']
+        if last_study_date is None or date >= last_study_date:
+            self.config['learning_records']['last_study_date'] = date
+    
+    def _replay_journal(self):
+        """将上次未合并的日志事件重放到配置中"""
+        learning_records = self.config['learning_records']
+        replayed = 0
         
-        # 保存配置
-        if self.config['general']['auto_save']:
-            self.config_manager.save_config()
+        for event in self.journal.read_events():
+            # 序号不大于快照序号的事件已包含在配置文件中
+            if event['seq'] <= learning_records['journal_seq']:
+                continue
+            self._apply_learning_record(event['date'], event['word_id'], event['status'], event['timestamp'])
+            learning_records['journal_seq'] = event['seq']
+            replayed += 1
+        
+        if replayed > 0:
+            self.compact_journal()
+    
+    def compact_journal(self):
+        """将日志合并到配置文件快照中并清空日志"""
+        if self.journal.event_count == 0:
+            return True
+        # 快照必须在清空日志前写入磁盘
+        if self.config_manager.save_config(sync=True):
+            return self.journal.clear()
+        return False
+    
+    def close(self):
+        """关闭单词管理器，合并未保存的学习记录"""
+        self.compact_journal()
+        self.journal.close()
+        self._close_binary_vocabulary()
     
     def get_today_stats(self):
         """获取今日学习统计"""
@@ -104,26 +602,39 @@ class WordManager:
     
     def get_word_status(self, word_id):
         """获取单词的学习状态"""
-        # 遍历所有日期的记录，查找最新的状态
-        latest_status = None
-        latest_timestamp = 0
+        state = self._get_word_state(word_id)
+        return state[0] if state is not None else None
+    
+    def get_word_schedule(self, word_id):
+        """
+        获取单词的复习调度状态，可在工作线程中调用
         
-        for date, record in self.config['learning_records']['daily_records'].items():
-            if word_id in record['words']:
-                word_record = record['words'][word_id]
-                if word_record['timestamp'] > latest_timestamp:
-                    latest_timestamp = word_record['timestamp']
-                    latest_status = word_record['status']
+        Args:
+            word_id (str): 单词ID，格式为 "单词本路径:单词"
+        
+        Returns:
+            tuple: (学习状态, 下次复习时间)，未学过的单词为 ('unlearned', None)
+        """
+        state = self._get_word_state(word_id)
+        if state is None:
+            return 'unlearned', None
         
-        return latest_status
+        review_intervals = self._get_review_intervals(self.config['review']['strategy'], self.config['review']['intervals'])
+        return (self.RECORD_STATUS_TO_WORD_STATUS.get(state[0], 'unlearned'),
+                self._get_next_review_time(word_id, review_intervals))
+    
+    def _get_word_state(self, word_id):
+        """获取单词的最新状态 [状态, 时间戳, 学习天数]，无记录时返回 None"""
+        return self._word_state_index.get(word_id)
     
     def get_words_by_status(self, vocab_path, status):
         """获取指定状态的单词列表"""
         words = self.load_vocabulary_words(vocab_path)
+        id_path = self.word_id_path(vocab_path)
         result = []
         
         for word in words:
-            word_id = f"{vocab_path}:{word['word']}"
+            word_id = f"{id_path}:{word['word']}"
             word_status = self.get_word_status(word_id)
             
             if status == 'all' or word_status == status:
@@ -132,60 +643,231 @@ class WordManager:
         return result
     
     def get_review_words(self, vocab_path):
-        """获取需要复习的单词"""
+        """获取需要复习的单词（包括已过期未复习的单词），按到期时间排序"""
+        now = datetime.datetime.now().timestamp()
         words = self.load_vocabulary_words(vocab_path)
-        result = []
+        entry = self._word_stores.get(vocab_path)
+        if entry is not None and entry[0] is words:
+            # 已建立列式单词存储时用数组运算一次性计算
+            return self.get_review_words_batch(vocab_path, now)
         
-        # 获取复习策略
-        strategy = self.config['review']['strategy']
-        intervals = self.config['review']['intervals']
+        intervals, queue, words_by_id, words = self._get_review_queue(vocab_path)
+        return [words_by_id[word_id] for word_id in queue.get_due(now)]
+    
+    def get_review_words_batch(self, vocab_path, now=None):
+        """使用数组运算一次性计算单词本中所有需要复习的单词，结果与复习队列相同"""
+        if now is None:
+            now = datetime.datetime.now().timestamp()
+        store = self.get_word_store(vocab_path)
+        words = self._word_stores[vocab_path][2]
         
-        for word in words:
-            word_id = f"{vocab_path}:{word['word']}"
-            word_status = self.get_word_status(word_id)
+        # 下次复习时间列与复习队列使用相同的学习记录和复习间隔计算，复习策略变化时由 get_word_store 重新计算
+        ids = store.due_ids(now).tolist()
+        
+        # 重复出现的单词与 word_id 一样只对应第一次出现的位置
+        return [words[i] for i in ids if store.find(store.words[i]) == i]
+    
+    def _get_review_queue(self, vocab_path):
+        """获取单词本的复习队列，首次使用或复习策略变化时构建，单词本文件变化时由 resync_vocabulary 增量更新"""
+        with self._index_lock:
+            review_intervals = self._get_review_intervals(self.config['review']['strategy'], self.config['review']['intervals'])
+            words = self.load_vocabulary_words(vocab_path)
+            entry = self._review_queues.get(vocab_path)
+            if entry is not None and entry[0] == review_intervals and entry[3] is words:
+                return entry
+            
+            queue = ReviewQueue()
+            words_by_id = {}
+            id_path = self.word_id_path(vocab_path)
+            for word in words:
+                word_id = f"{id_path}:{word['word']}"
+                if word_id in words_by_id:
+                    # 重复出现的单词只对应第一次出现的位置
+                    continue
+                words_by_id[word_id] = word
+                queue.schedule(word_id, self._get_next_review_time(word_id, review_intervals))
+            
+            entry = (list(review_intervals), queue, words_by_id, words)
+            self._review_queues[vocab_path] = entry
+            return entry
+    
+    def get_word_store(self, vocab_path):
+        """
+        获取单词本的列式单词存储（学习状态来自学习记录），单词本文件变化时由 resync_vocabulary 增量更新，
+        复习策略变化时重新计算下次复习时间
+        """
+        with self._index_lock:
+            review_intervals = self._get_review_intervals(self.config['review']['strategy'], self.config['review']['intervals'])
+            words = self.load_vocabulary_words(vocab_path)
+            id_path = self.word_id_path(vocab_path)
+            entry = self._word_stores.get(vocab_path)
+            if entry is not None and entry[0] is words:
+                if entry[3] != review_intervals:
+                    store, slot_words = entry[1], entry[2]
+                    for index, word in enumerate(slot_words):
+                        if word is not None:
+                            self._sync_word_store_state(store, index, f"{id_path}:{word['word']}")
+                    self._word_stores[vocab_path] = (words, store, slot_words, list(review_intervals))
+                return entry[1]
+            
+            store = WordStore(capacity=len(words))
+            for word in words:
+                index = store.add(word['word'], word.get('meaning', ''), word.get('phonetic'),
+                                  word.get('examples'), word.get('tags'))
+                self._sync_word_store_state(store, index, f"{id_path}:{word['word']}")
+            
+            self._word_stores[vocab_path] = (words, store, words, list(review_intervals))
+            return store
+    
+    def get_search_index(self, vocab_path):
+        """获取单词本的搜索索引，首次使用或单词本变化时构建"""
+        with self._index_lock:
+            store = self.get_word_store(vocab_path)
+            entry = self._search_indexes.get(vocab_path)
+            if entry is not None and entry[0] is store:
+                return entry[1]
             
-            # 只考虑已学过的单词
-            if word_status in ['learned', 'reviewed']:
-                # 获取最后一次学习的时间
-                last_time = self._get_last_study_time(word_id)
+            index = SearchIndex(store)
+            self._search_indexes[vocab_path] = (store, index)
+            return index
+    
+    def get_fuzzy_index(self, vocab_path):
+        """获取单词本的模糊查找索引，首次使用或单词本变化时构建"""
+        with self._index_lock:
+            store = self.get_word_store(vocab_path)
+            entry = self._fuzzy_indexes.get(vocab_path)
+            if entry is not None and entry[0] is store:
+                return entry[1]
+            
+            index = FuzzyIndex(store, normalize_headword)
+            self._fuzzy_indexes[vocab_path] = (store, index)
+            return index
+    
+    def get_cached_fuzzy_index(self, vocab_path):
+        """获取已建立的模糊查找索引，不加载单词本，未建立或单词本已变化时返回 None"""
+        entry = self._fuzzy_indexes.get(vocab_path)
+        store_entry = self._word_stores.get(vocab_path)
+        if entry is None or store_entry is None or entry[0] is not store_entry[1]:
+            return None
+        return entry[1]
+    
+    def fuzzy_lookup(self, query, vocab_paths=None, max_distance=None, limit=None):
+        """
+        在单词本中查找与 query 拼写相近的单词（编辑距离）
+        
+        Args:
+            query (str): 查询文本
+            vocab_paths (list, optional): 单词本路径列表，索引未建立时先建立. Defaults to None，
+                即所有已建立模糊查找索引的单词本（不在调用线程中加载单词本）.
+            max_distance (int, optional): 最大编辑距离. Defaults to None，即使用配置.
+            limit (int, optional): 最多返回的数量. Defaults to None，即使用配置.
+        
+        Returns:
+            list: [(编辑距离, 单词本路径, 单词ID), ...]，按编辑距离排序
+        """
+        general = self.config['general']
+        max_distance = general['fuzzy_max_distance'] if max_distance is None else max_distance
+        limit = general['fuzzy_limit'] if limit is None else limit
+        if vocab_paths is None:
+            indexes = [(vocab['path'], self.get_cached_fuzzy_index(vocab['path'])) for vocab in self.get_vocabularies()]
+            indexes = [(vocab_path, index) for vocab_path, index in indexes if index is not None]
+        else:
+            indexes = [(vocab_path, self.get_fuzzy_index(vocab_path)) for vocab_path in vocab_paths]
+        
+        results = []
+        for vocab_path, index in indexes:
+            word_ids, distances = index.search(query, max_distance, limit)
+            results.extend(zip(distances.tolist(), [vocab_path] * len(word_ids), word_ids.tolist()))
+        
+        # 稳定排序，编辑距离相同时保持单词本顺序
+        results.sort(key=lambda result: result[0])
+        return results[:limit]
+    
+    def _sync_word_store_state(self, store, index, word_id):
+        """将学习记录中的单词状态写入列式单词存储"""
+        state = self._get_word_state(word_id)
+        if state is None:
+            return
+        
+        review_intervals = self._get_review_intervals(self.config['review']['strategy'], self.config['review']['intervals'])
+        view = store[index]
+        view.status = self.RECORD_STATUS_TO_WORD_STATUS.get(state[0], 'unlearned')
+        view.next_review_time = self._get_next_review_time(word_id, review_intervals)
+        store.learn_count[index] = state[2]
+        store.review_count[index] = state[2] - 1
+        store.last_learn_time[index] = state[1]
+    
+    def _on_word_state_changed(self, word_id):
+        """单词学习记录变化后更新其所在单词本的复习队列和列式单词存储"""
+        with self._index_lock:
+            vocab_path, _, word = word_id.rpartition(':')
+            # 通过二进制单词本打开时，复习队列和列式单词存储以二进制单词本路径为键
+            for path in {vocab_path, compiled_path(vocab_path)}:
+                entry = self._review_queues.get(path)
+                if entry is not None and word_id in entry[2]:
+                    entry[1].schedule(word_id, self._get_next_review_time(word_id, entry[0]))
                 
-                if last_time is not None:
-                    # 计算距离上次学习的天数
-                    days = (datetime.datetime.now() - last_time).days
-                    
-                    # 根据复习策略判断是否需要复习
-                    if self._need_review(days, strategy, intervals):
-                        result.append(word)
+                entry = self._word_stores.get(path)
+                if entry is not None:
+                    index = entry[1].find(word)
+                    if index is not None:
+                        self._sync_word_store_state(entry[1], index, word_id)
+    
+    def _get_next_review_time(self, word_id, review_intervals):
+        """计算单词的下次复习时间，未学过或无需复习的单词返回 None"""
+        state = self._get_word_state(word_id)
         
-        return result
+        # 只考虑已学过的单词
+        if state is None or state[0] not in self.REVIEWABLE_STATUSES or not review_intervals:
+            return None
+        
+        # 第 n 天学习后使用第 n 个复习间隔，超出后保持最后一个间隔
+        stage = min(state[2] - 1, len(review_intervals) - 1)
+        return state[1] + review_intervals[stage] * 86400
     
     def _get_last_study_time(self, word_id):
         """获取单词最后一次学习的时间"""
-        latest_timestamp = 0
-        
-        for date, record in self.config['learning_records']['daily_records'].items():
-            if word_id in record['words']:
-                word_record = record['words'][word_id]
-                if word_record['timestamp'] > latest_timestamp:
-                    latest_timestamp = word_record['timestamp']
+        state = self._get_word_state(word_id)
         
-        if latest_timestamp > 0:
-            return datetime.datetime.fromtimestamp(latest_timestamp)
+        if state is not None and state[1] > 0:
+            return datetime.datetime.fromtimestamp(state[1])
         return None
     
-    def _need_review(self, days, strategy, intervals):
-        """根据复习策略判断是否需要复习"""
+    def _need_review(self, days, strategy, intervals, stage=0):
+        """根据复习策略判断是否需要复习，stage 为已完成的复习轮数"""
+        review_intervals = self._get_review_intervals(strategy, intervals)
+        if not review_intervals:
+            return False
+        return days >= review_intervals[min(stage, len(review_intervals) - 1)]
+    
+    def _get_review_intervals(self, strategy, intervals):
+        """获取复习策略对应的复习间隔（天）"""
         if strategy == '艾宾浩斯记忆曲线':
             # 艾宾浩斯记忆曲线: 1, 2, 4, 7, 15天后复习
-            ebbinghaus_intervals = [1, 2, 4, 7, 15]
-            return days in ebbinghaus_intervals
+            return [1, 2, 4, 7, 15]
         elif strategy == '间隔重复系统':
             # 间隔重复系统: 根据记忆效果动态调整间隔
             # 这里简化为固定间隔: 1, 3, 6, 10, 20天后复习
-            srs_intervals = [1, 3, 6, 10, 20]
-            return days in srs_intervals
+            return [1, 3, 6, 10, 20]
         elif strategy == '自定义策略':
             # 自定义策略: 使用用户设置的间隔
-            return days in intervals
+            return intervals
         
-        return False
\ No newline at end of file
+        return []
+
+
+def normalize_headword(word):
+    """规范化单词，用于判断不同单词本中的单词是否相同"""
+    return ' '.join(unicodedata.normalize('NFKC', word).casefold().split())
+
+
+def _extend_unique(target, seen, values):
+    """将 values 中未出现过的值依次追加到 target"""
+    if not values:
+        return
+    if isinstance(values, str):
+        values = [values]
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            target.append(value)
\ No newline at end of file